@@ -0,0 +1,119 @@
+"""Microbenchmark: validated versus trusted (construct) parsing per item type.
+
+Compares the client's validate-from-bytes path with decoding the JSON and
+building models via ``model_construct`` (nested models constructed
+recursively, no validation), plus decoding alone as a floor.
+
+Run with::
+
+    uv run python benchmarks/bench_construct.py
+"""
+
+from __future__ import annotations
+
+import functools
+import timeit
+import types
+from typing import Any, Union, get_args, get_origin
+
+import httpx
+from pydantic_core import from_json
+
+from nansen import Nansen
+from nansen._models import BaseModel
+from nansen.types.profiler import TransactionItem
+from nansen.types.smart_money import SmartMoneyDexTradeItem
+from nansen.types.tgm import TgmDexTradeItem, TransferItem
+
+PER_PAGE = 1000
+PAGES = 20
+MODELS: list[type[BaseModel]] = [
+    TgmDexTradeItem,
+    TransferItem,
+    SmartMoneyDexTradeItem,
+    TransactionItem,
+]
+
+
+def _unwrap(annotation: Any) -> tuple[Any, bool]:
+    """Strip ``X | None`` and report whether the annotation is a list."""
+    if get_origin(annotation) in (Union, types.UnionType):
+        annotation = next(arg for arg in get_args(annotation) if arg is not type(None))
+    if get_origin(annotation) is list:
+        (item,) = get_args(annotation)
+        return item, True
+    return annotation, False
+
+
+@functools.cache
+def _nested_fields(model: type[BaseModel]) -> dict[str, tuple[type[BaseModel], bool]]:
+    nested = {}
+    for name, field in model.model_fields.items():
+        annotation, is_list = _unwrap(field.annotation)
+        if isinstance(annotation, type) and issubclass(annotation, BaseModel):
+            nested[name] = (annotation, is_list)
+    return nested
+
+
+def _construct(model: type[BaseModel], data: dict[str, Any]) -> BaseModel:
+    """Build *model* without validation, constructing nested models recursively."""
+    values = dict(data)
+    for name, (nested, is_list) in _nested_fields(model).items():
+        value = values.get(name)
+        if value is None:
+            continue
+        if is_list:
+            values[name] = [_construct(nested, item) for item in value]
+        else:
+            values[name] = _construct(nested, value)
+    return model.model_construct(**values)
+
+
+def _sample(annotation: Any) -> Any:
+    annotation, is_list = _unwrap(annotation)
+    if is_list:
+        return [_sample(annotation) for _ in range(2)]
+    if isinstance(annotation, type) and issubclass(annotation, BaseModel):
+        return _row(annotation)
+    return {str: "0xabc", float: 1234.5, int: 7, bool: True}.get(annotation, "x")
+
+
+def _row(model: type[BaseModel]) -> dict[str, Any]:
+    return {name: _sample(field.annotation) for name, field in model.model_fields.items()}
+
+
+def _content(model: type[BaseModel]) -> bytes:
+    return httpx.Response(
+        200,
+        json={
+            "data": [_row(model)] * PER_PAGE,
+            "pagination": {"page": 1, "per_page": PER_PAGE, "is_last_page": False},
+        },
+    ).content
+
+
+def _rate(parse: Any) -> float:
+    """Rows parsed per second."""
+    return PAGES * PER_PAGE / timeit.timeit(parse, number=PAGES)
+
+
+def main() -> None:
+    client = Nansen(api_key="bench")
+    print(f"{PAGES} pages x {PER_PAGE} rows, rows/second (higher is better)")
+    print(f"  {'item type':<24} {'validate':>10} {'construct':>10} {'decode only':>12}")
+    for model in MODELS:
+        content = _content(model)
+        # A fresh response per page, so per-response memoisation doesn't hide the cost.
+        validate = _rate(
+            lambda: client._parse_page_response(httpx.Response(200, content=content), model)  # noqa: B023
+        )
+        construct = _rate(
+            lambda: [_construct(model, row) for row in from_json(content)["data"]]  # noqa: B023
+        )
+        decode = _rate(lambda: from_json(content))  # noqa: B023
+        print(f"  {model.__name__:<24} {validate:>10,.0f} {construct:>10,.0f} {decode:>12,.0f}")
+    client.close()
+
+
+if __name__ == "__main__":
+    main()
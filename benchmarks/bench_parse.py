@@ -0,0 +1,85 @@
+"""Microbenchmark: per-page parse overhead across validator and JSON backend choices.
+
+Run with::
+
+    uv run python benchmarks/bench_parse.py
+"""
+
+from __future__ import annotations
+
+import timeit
+
+import httpx
+from pydantic import TypeAdapter
+
+from nansen import Nansen
+from nansen._utils._json import JSON_BACKENDS
+from nansen._utils._validators import get_adapter
+from nansen.types.tgm import TransferItem
+
+PER_PAGE = 100
+PAGES = 200
+
+
+def _make_body() -> bytes:
+    row = {
+        "block_timestamp": "2024-01-01T00:00:00",
+        "transaction_hash": "0xabc",
+        "from_address": "0x1",
+        "to_address": "0x2",
+        "from_address_label": "Binance",
+        "to_address_label": None,
+        "transfer_amount": 12.5,
+        "transfer_value_usd": 31000.0,
+    }
+    return httpx.Response(
+        200,
+        json={
+            "data": [row] * PER_PAGE,
+            "pagination": {"page": 1, "per_page": PER_PAGE, "is_last_page": False},
+        },
+    ).content
+
+
+def _response(body: bytes) -> httpx.Response:
+    # A fresh response per page: the client memoises parsed results on the response.
+    return httpx.Response(200, content=body, headers={"content-type": "application/json"})
+
+
+def _parse_uncached(response: httpx.Response) -> None:
+    body = response.json()
+    TypeAdapter(list[TransferItem]).validate_python(body.get("data", []))
+
+
+def _parse_registry(response: httpx.Response) -> None:
+    body = response.json()
+    get_adapter(list[TransferItem]).validate_python(body.get("data", []))
+
+
+def main() -> None:
+    body = _make_body()
+
+    results = {
+        "fresh TypeAdapter per page": timeit.timeit(
+            lambda: _parse_uncached(_response(body)), number=PAGES
+        ),
+        "registry adapter": timeit.timeit(lambda: _parse_registry(_response(body)), number=PAGES),
+    }
+    for backend in JSON_BACKENDS:
+        try:
+            client = Nansen(api_key="bench", json_backend=backend)  # type: ignore[arg-type]
+        except ImportError:
+            continue
+        results[f"client ({backend})"] = timeit.timeit(
+            lambda: client._parse_page_response(_response(body), TransferItem),  # noqa: B023
+            number=PAGES,
+        )
+        client.close()
+
+    print(f"{PAGES} pages x {PER_PAGE} TransferItem rows")
+    for name, total in results.items():
+        print(f"  {name:<30} {total / PAGES * 1e3:8.3f} ms/page")
+
+
+if __name__ == "__main__":
+    main()
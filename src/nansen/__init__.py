@@ -1,10 +1,16 @@
+from nansen._cache import CacheStats, ResponseCache, SQLiteCache
+from nansen._checkpoint import PageCursor
 from nansen._client import AsyncNansen, Nansen
+from nansen._columnar import Categorical, ColumnBatch, arrow_schema
+from nansen._compact import CompactRecord, compact_type
+from nansen._credits import CreditJob, CreditLedger, CreditReservation, CreditUsage
 from nansen._exceptions import (
     APIConnectionError,
     APIError,
     APITimeoutError,
     AuthenticationError,
     BadRequestError,
+    CreditBudgetExceededError,
     GatewayTimeoutError,
     InternalServerError,
     NansenError,
@@ -13,8 +19,11 @@ from nansen._exceptions import (
     RateLimitError,
     UnprocessableEntityError,
 )
+from nansen._fanout import AsyncFanOutStream, FanOutResult, FanOutStream
+from nansen._models import LazyModel
 from nansen._pagination import AsyncPage, SyncPage
-from nansen._response import APIResponse, RateLimitInfo
+from nansen._rate_limit import RateLimiter, RateLimiterStats
+from nansen._response import APIResponse, RateLimitInfo, ResponseMeta
 from nansen._types import NOT_GIVEN
 from nansen._version import __version__
 
@@ -25,9 +34,33 @@ __all__ = [
     # Pagination
     "SyncPage",
     "AsyncPage",
+    "PageCursor",
     # Response
     "APIResponse",
     "RateLimitInfo",
+    "ResponseMeta",
+    "LazyModel",
+    "CompactRecord",
+    "compact_type",
+    "ColumnBatch",
+    "Categorical",
+    "arrow_schema",
+    # Rate limiting
+    "RateLimiter",
+    "RateLimiterStats",
+    # Credits
+    "CreditLedger",
+    "CreditJob",
+    "CreditReservation",
+    "CreditUsage",
+    # Fan-out
+    "FanOutResult",
+    "FanOutStream",
+    "AsyncFanOutStream",
+    # Caching
+    "ResponseCache",
+    "SQLiteCache",
+    "CacheStats",
     # Exceptions
     "NansenError",
     "APIError",
@@ -41,6 +74,7 @@ __all__ = [
     "RateLimitError",
     "InternalServerError",
     "GatewayTimeoutError",
+    "CreditBudgetExceededError",
     # Sentinel
     "NOT_GIVEN",
     # Version
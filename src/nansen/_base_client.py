@@ -1,25 +1,74 @@
 from __future__ import annotations
 
+import collections
+import contextvars
+import copy
+import functools
+import itertools
+import logging
+import threading
 import time
+from collections.abc import AsyncIterator, Awaitable, Callable, Iterable, Iterator
+from concurrent.futures import Future, ThreadPoolExecutor
 from typing import Any, TypeVar
 
 import anyio
+import anyio.lowlevel
 import httpx
-from pydantic import TypeAdapter
+from anyio.abc import TaskGroup
+from typing_extensions import Self
 
-from nansen._constants import DEFAULT_BASE_URL, DEFAULT_MAX_RETRIES, DEFAULT_TIMEOUT
+from nansen._cache import CachedResponse, ResponseCache, cache_key
+from nansen._checkpoint import PageCursor
+from nansen._compact import compact_row_type
+from nansen._constants import (
+    DEFAULT_BASE_URL,
+    DEFAULT_FAN_OUT_CONCURRENCY,
+    DEFAULT_MAX_PER_PAGE,
+    DEFAULT_MAX_RETRIES,
+    DEFAULT_SHARD_CONCURRENCY,
+    DEFAULT_TIMEOUT,
+    MAX_PAGE_SIZE_SHRINKS,
+)
+from nansen._credits import CreditLedger
 from nansen._exceptions import (
     APIConnectionError,
     APITimeoutError,
     _make_api_error,
 )
-from nansen._models import BaseModel
-from nansen._pagination import AsyncPage, PaginationInfo, SyncPage
-from nansen._response import APIResponse
+from nansen._fanout import FanOutResult, fan_out, fan_out_async
+from nansen._models import BaseModel, lazy_row_type
+from nansen._pagination import (
+    PAGE_SIZE_ERRORS,
+    AsyncPage,
+    PageEnvelope,
+    PaginationInfo,
+    SyncPage,
+    _empty_last_page,
+    _is_page_size_error,
+    _page_offset,
+    _pagination_params,
+    _shrink_page_size,
+    _size_for_limit,
+    _trim_to_limit,
+)
+from nansen._rate_limit import RateLimiter
+from nansen._response import APIResponse, RateLimitInfo, ResponseMeta
+from nansen._sharding import plan_shards
+from nansen._transport import accept_encoding, build_async_http_client, build_http_client
+from nansen._types import ALL_CHAINS, NOT_GIVEN, RESULT_MODES, NotGiven, ResultMode
+from nansen._utils._concurrency import TaskSpawner, interrupted_error, submit_in_context
+from nansen._utils._json import JSONBackend, get_json_loader
 from nansen._utils._retry import RETRYABLE_STATUS_CODES, calculate_retry_delay
+from nansen._utils._validators import get_adapter, response_models, warmup_adapters
 from nansen._version import __version__
 
 T = TypeVar("T", bound=BaseModel)
+R = TypeVar("R")
+
+_PARSED_EXTENSION = "nansen.parsed"
+
+logger = logging.getLogger("nansen")
 
 
 class _BaseClient:
@@ -29,6 +78,12 @@ class _BaseClient:
     api_key: str
     timeout: float
     max_retries: int
+    json_backend: JSONBackend
+    compression: bool
+    rate_limiter: RateLimiter | None
+    credits: CreditLedger
+    cache: ResponseCache | None
+    result_mode: ResultMode
 
     def __init__(
         self,
@@ -37,15 +92,32 @@ class _BaseClient:
         base_url: str = DEFAULT_BASE_URL,
         timeout: float = DEFAULT_TIMEOUT,
         max_retries: int = DEFAULT_MAX_RETRIES,
+        json_backend: JSONBackend = "pydantic",
+        compression: bool = True,
+        rate_limiter: RateLimiter | None | NotGiven = NOT_GIVEN,
+        credit_budget: int | None = None,
+        cache: ResponseCache | None = None,
+        result_mode: ResultMode = "model",
     ) -> None:
         self.api_key = api_key
         self.base_url = base_url
         self.timeout = timeout
         self.max_retries = max_retries
+        self.json_backend = json_backend
+        self.compression = compression
+        self.rate_limiter = RateLimiter() if isinstance(rate_limiter, NotGiven) else rate_limiter
+        self.credits = CreditLedger(budget=credit_budget)
+        self.cache = cache
+        self._use_cache = True
+        self.result_mode = _check_result_mode(result_mode)
+        self._json_loads = get_json_loader(json_backend)
+        # Largest per_page each endpoint has accepted after a size back-off.
+        self._max_per_page: dict[str, int] = {}
 
     def _build_headers(self) -> dict[str, str]:
         return {
             "apikey": self.api_key,
+            "accept-encoding": accept_encoding() if self.compression else "identity",
             "content-type": "application/json",
             "user-agent": f"nansen-python/{__version__}",
         }
@@ -53,30 +125,114 @@ class _BaseClient:
     def _build_url(self, path: str) -> str:
         return f"{self.base_url}{path}"
 
+    def with_options(
+        self,
+        *,
+        use_cache: bool | NotGiven = NOT_GIVEN,
+        result_mode: ResultMode | NotGiven = NOT_GIVEN,
+    ) -> Self:
+        """Return a copy of this client with per-call options changed.
+
+        The copy shares the connection pool, rate limiter, credit ledger and
+        cache with this client, so it is cheap to create for a single call::
+
+            client.with_options(use_cache=False).tgm.token_information(...)
+
+        Closing either client closes the shared connection pool.
+
+        Args:
+            use_cache: Read from and write to the response cache.
+            result_mode: How response rows are returned; see the client's
+                ``result_mode`` argument.
+        """
+        clone = copy.copy(self)
+        # Resources hold a reference to the client that created them.
+        for klass in type(clone).__mro__:
+            for name, attr in vars(klass).items():
+                if isinstance(attr, functools.cached_property):
+                    clone.__dict__.pop(name, None)
+        if not isinstance(use_cache, NotGiven):
+            clone._use_cache = use_cache
+        if not isinstance(result_mode, NotGiven):
+            clone.result_mode = _check_result_mode(result_mode)
+        return clone
+
+    @property
+    def _active_cache(self) -> ResponseCache | None:
+        return self.cache if self._use_cache else None
+
+    def warmup(self, *models: type[BaseModel]) -> None:
+        """Eagerly compile the validators used to parse responses.
+
+        Validators are otherwise compiled lazily on the first response for
+        each model. Calling this at service startup moves that cost out of
+        the first request.
+
+        Args:
+            models: Response models to compile (e.g. ``TransferItem``).
+                Defaults to every model in ``nansen.types``.
+        """
+        targets: Iterable[type[BaseModel]] = models or response_models()
+        warmup_adapters(targets)
+
     def _should_retry(self, response: httpx.Response) -> bool:
         return response.status_code in RETRYABLE_STATUS_CODES
 
+    def _validate_content(self, response: httpx.Response, tp: Any) -> Any:
+        """Validate the raw response body against *tp* using the JSON backend.
+
+        Results are memoised on the response, so callers sharing a coalesced
+        response also share one parsed result.
+        """
+        parsed: dict[Any, Any] = response.extensions.setdefault(_PARSED_EXTENSION, {})
+        if tp in parsed:
+            return parsed[tp]
+        adapter = get_adapter(tp)
+        if self._json_loads is None:
+            value = adapter.validate_json(response.content)
+        else:
+            value = adapter.validate_python(self._json_loads(response.content))
+        return parsed.setdefault(tp, value)
+
     def _parse_response(
         self,
         response: httpx.Response,
         model: type[T],
     ) -> APIResponse[T]:
-        body = response.json()
-        data = TypeAdapter(model).validate_python(body)
+        data = self._validate_content(response, self._row_type(model))
         return APIResponse(data=data, http_response=response)
 
+    def _parse_list_response(self, response: httpx.Response, model: type[T]) -> list[T]:
+        items: list[T] = self._validate_content(response, list[self._row_type(model)])  # type: ignore[misc]
+        return items
+
     def _parse_page_response(
         self,
         response: httpx.Response,
         model: type[T],
     ) -> tuple[list[T], PaginationInfo]:
-        body = response.json()
-        raw_data = body.get("data", [])
-        items = TypeAdapter(list[model]).validate_python(raw_data)  # type: ignore[valid-type]
-        raw_pagination = body.get("pagination", {})
-        pagination = PaginationInfo.model_validate(raw_pagination)
+        envelope = self._validate_content(response, PageEnvelope[self._row_type(model)])  # type: ignore[misc]
+        items: list[T] = envelope.get("data", [])
+        pagination: PaginationInfo = envelope.get("pagination") or PaginationInfo()
         return items, pagination
 
+    def _row_type(self, model: type[T]) -> Any:
+        """The type each response row is validated against in the current result mode."""
+        if self.result_mode == "raw":
+            return Any
+        if self.result_mode == "lazy":
+            return lazy_row_type(model)
+        if self.result_mode == "compact":
+            return compact_row_type(model)
+        return model
+
+    def _limit_page_body(self, path: str, body: dict[str, object], limit: int) -> dict[str, object]:
+        return _size_for_limit(body, limit, self._max_per_page.get(path, DEFAULT_MAX_PER_PAGE))
+
+    def _remember_page_size(self, path: str, body: dict[str, object]) -> None:
+        per_page = int(_pagination_params(body).get("per_page", DEFAULT_MAX_PER_PAGE))
+        self._max_per_page[path] = min(per_page, self._max_per_page.get(path, per_page))
+
     @staticmethod
     def _raise_for_response(response: httpx.Response) -> None:
         if response.is_success:
@@ -101,14 +257,36 @@ class SyncAPIClient(_BaseClient):
         timeout: float = DEFAULT_TIMEOUT,
         max_retries: int = DEFAULT_MAX_RETRIES,
         http_client: httpx.Client | None = None,
+        json_backend: JSONBackend = "pydantic",
+        connection_limits: httpx.Limits | None = None,
+        http2: bool = False,
+        share_transport: bool = False,
+        compression: bool = True,
+        rate_limiter: RateLimiter | None | NotGiven = NOT_GIVEN,
+        credit_budget: int | None = None,
+        cache: ResponseCache | None = None,
+        result_mode: ResultMode = "model",
     ) -> None:
         super().__init__(
             api_key=api_key,
             base_url=base_url,
             timeout=timeout,
             max_retries=max_retries,
+            json_backend=json_backend,
+            compression=compression,
+            rate_limiter=rate_limiter,
+            credit_budget=credit_budget,
+            cache=cache,
+            result_mode=result_mode,
+        )
+        self._client = http_client or build_http_client(
+            timeout=timeout,
+            limits=connection_limits,
+            http2=http2,
+            share_transport=share_transport,
         )
-        self._client = http_client or httpx.Client(timeout=timeout)
+        self._inflight: dict[str, Future[httpx.Response]] = {}
+        self._inflight_lock = threading.Lock()
 
     def __enter__(self) -> SyncAPIClient:
         return self
@@ -128,50 +306,161 @@ class SyncAPIClient(_BaseClient):
         params: dict[str, Any] | None = None,
         headers: dict[str, str] | None = None,
         base_url: str | None = None,
+    ) -> httpx.Response:
+        key = cache_key(
+            method,
+            base_url or self.base_url,
+            path,
+            body,
+            params,
+            api_key=(headers or {}).get("apikey", self.api_key),
+        )
+        cache = self._active_cache
+        send = functools.partial(
+            self._send, method, path, body=body, params=params, headers=headers, base_url=base_url
+        )
+        if cache is not None:
+            hit = cache.get(key, path)
+            if hit is not None:
+                if hit.stale:
+                    self._revalidate(key, path, cache, send)
+                return hit.response.to_response(age=hit.age, stale=hit.stale)
+
+        # Single flight: identical requests already in flight share its response.
+        flight, leader = self._join_flight(key)
+        if not leader:
+            return flight.result()
+        return self._fly(flight, key, path, cache, send)
+
+    def _join_flight(self, key: str) -> tuple[Future[httpx.Response], bool]:
+        with self._inflight_lock:
+            flight = self._inflight.get(key)
+            if flight is not None:
+                return flight, False
+            flight = self._inflight[key] = Future()
+            return flight, True
+
+    def _fly(
+        self,
+        flight: Future[httpx.Response],
+        key: str,
+        path: str,
+        cache: ResponseCache | None,
+        send: Callable[[], httpx.Response],
+    ) -> httpx.Response:
+        try:
+            response = send()
+            if cache is not None:
+                cache.set(key, path, CachedResponse.from_response(response))
+        except BaseException as exc:
+            flight.set_exception(exc)
+            raise
+        else:
+            flight.set_result(response)
+        finally:
+            with self._inflight_lock:
+                del self._inflight[key]
+        return response
+
+    def _revalidate(
+        self, key: str, path: str, cache: ResponseCache, send: Callable[[], httpx.Response]
+    ) -> None:
+        flight, leader = self._join_flight(key)
+        if not leader:
+            # A refresh (or an identical request) is already in flight.
+            return
+        context = contextvars.copy_context()
+        threading.Thread(
+            target=context.run,
+            args=(self._refresh, flight, key, path, cache, send),
+            name="nansen-revalidate",
+            daemon=True,
+        ).start()
+
+    def _refresh(
+        self,
+        flight: Future[httpx.Response],
+        key: str,
+        path: str,
+        cache: ResponseCache,
+        send: Callable[[], httpx.Response],
+    ) -> None:
+        try:
+            self._fly(flight, key, path, cache, send)
+        except Exception:
+            logger.warning(
+                "Background refresh of %s failed; serving the stale response.", path, exc_info=True
+            )
+
+    def _send(
+        self,
+        method: str,
+        path: str,
+        *,
+        body: dict[str, object] | None = None,
+        params: dict[str, Any] | None = None,
+        headers: dict[str, str] | None = None,
+        base_url: str | None = None,
     ) -> httpx.Response:
         url = f"{base_url or self.base_url}{path}"
         request_headers = self._build_headers()
         if headers:
             request_headers.update(headers)
 
-        last_exc: Exception | None = None
-        for attempt in range(self.max_retries + 1):
-            try:
-                response = self._client.request(
-                    method,
-                    url,
-                    json=body,
-                    params=params,
-                    headers=request_headers,
-                )
-            except httpx.TimeoutException as exc:
-                last_exc = APITimeoutError()
-                if attempt >= self.max_retries:
-                    raise last_exc from exc
-                delay = calculate_retry_delay(attempt)
-                time.sleep(delay)
-                continue
-            except httpx.ConnectError as exc:
-                last_exc = APIConnectionError(message=str(exc))
-                if attempt >= self.max_retries:
-                    raise last_exc from exc
-                delay = calculate_retry_delay(attempt)
-                time.sleep(delay)
-                continue
-
-            if self._should_retry(response) and attempt < self.max_retries:
-                delay = calculate_retry_delay(
-                    attempt,
-                    response.headers.get("retry-after"),
+        reservation = self.credits.check(path)
+        try:
+            last_exc: Exception | None = None
+            for attempt in range(self.max_retries + 1):
+                if self.rate_limiter is not None:
+                    self.rate_limiter.acquire()
+                try:
+                    response = self._client.request(
+                        method,
+                        url,
+                        json=body,
+                        params=params,
+                        headers=request_headers,
+                    )
+                except httpx.TimeoutException as exc:
+                    last_exc = APITimeoutError()
+                    if attempt >= self.max_retries:
+                        raise last_exc from exc
+                    delay = calculate_retry_delay(attempt)
+                    time.sleep(delay)
+                    continue
+                except httpx.ConnectError as exc:
+                    last_exc = APIConnectionError(message=str(exc))
+                    if attempt >= self.max_retries:
+                        raise last_exc from exc
+                    delay = calculate_retry_delay(attempt)
+                    time.sleep(delay)
+                    continue
+
+                info = RateLimitInfo.from_headers(response.headers)
+                self.credits.record(
+                    path,
+                    credits_used=info.credits_used,
+                    credits_remaining=info.credits_remaining,
+                    reservation=reservation,
                 )
-                time.sleep(delay)
-                continue
+                if self.rate_limiter is not None:
+                    self.rate_limiter.observe(info)
+
+                if self._should_retry(response) and attempt < self.max_retries:
+                    delay = calculate_retry_delay(
+                        attempt,
+                        response.headers.get("retry-after"),
+                    )
+                    time.sleep(delay)
+                    continue
 
-            self._raise_for_response(response)
-            return response
+                self._raise_for_response(response)
+                return response
 
-        # Should not be reached, but satisfy type checker
-        raise last_exc or APIConnectionError(message="Max retries exceeded")
+            # Should not be reached, but satisfy type checker
+            raise last_exc or APIConnectionError(message="Max retries exceeded")
+        finally:
+            reservation.release()
 
     def _post(
         self,
@@ -207,9 +496,50 @@ class SyncAPIClient(_BaseClient):
         path: str,
         body: dict[str, object],
         model: type[T],
+        limit: int | None = None,
     ) -> SyncPage[T]:
-        response = self._request("POST", path, body=body)
+        if limit is None:
+            response = self._request("POST", path, body=body)
+            items, pagination = self._parse_page_response(response, model)
+            return SyncPage(
+                data=items,
+                pagination=pagination,
+                client=self,
+                path=path,
+                body=body,
+                model=model,
+                meta=ResponseMeta.from_response(response),
+            )
+
+        body = self._limit_page_body(path, body, limit)
+        if _page_offset(body) >= limit:
+            # Nothing left to fetch; don't spend a request on it.
+            return SyncPage(
+                data=[],
+                pagination=_empty_last_page(body),
+                client=self,
+                path=path,
+                body=body,
+                model=model,
+                limit=limit,
+            )
+        shrinks = 0
+        while True:
+            try:
+                response = self._request("POST", path, body=body)
+                break
+            except PAGE_SIZE_ERRORS as exc:
+                if shrinks == MAX_PAGE_SIZE_SHRINKS or not _is_page_size_error(exc):
+                    raise
+                smaller = _shrink_page_size(body)
+                if smaller is None:
+                    raise
+                body = smaller
+                shrinks += 1
+        if shrinks:
+            self._remember_page_size(path, body)
         items, pagination = self._parse_page_response(response, model)
+        items, pagination = _trim_to_limit(items, pagination, body, limit)
         return SyncPage(
             data=items,
             pagination=pagination,
@@ -217,8 +547,134 @@ class SyncAPIClient(_BaseClient):
             path=path,
             body=body,
             model=model,
+            meta=ResponseMeta.from_response(response),
+            limit=limit,
         )
 
+    def resume_page(self, cursor: PageCursor | str) -> SyncPage[Any]:
+        """Fetch the page named by a :class:`PageCursor` or cursor token.
+
+        Use this to continue a paginated export from a checkpoint, e.g. with a
+        fresh client after the original process exited.
+        """
+        if isinstance(cursor, str):
+            cursor = PageCursor.from_token(cursor)
+        return self._request_page(
+            path=cursor.path,
+            body=cursor.body,
+            model=cursor.resolve_model(),
+            limit=cursor.limit,
+        )
+
+    def iter_sharded(
+        self,
+        method: Callable[..., SyncPage[T]],
+        /,
+        *,
+        shard_days: float = 1,
+        max_concurrency: int = DEFAULT_SHARD_CONCURRENCY,
+        **params: Any,
+    ) -> Iterator[T]:
+        """Fetch a time-bounded paginated call as concurrent date-range shards.
+
+        The ``date`` (or ``date_range``) window in *params* is split into
+        ``shard_days``-long sub-windows; up to ``max_concurrency`` shards are
+        paginated at once on worker threads, all sharing the client's rate
+        limiter and credit ledger. Items come back as one stream in
+        timestamp order::
+
+            for trade in client.iter_sharded(
+                client.tgm.dex_trades,
+                chain="ethereum",
+                token_address="0x...",
+                date={"from": "2024-01-01", "to": "2024-03-31"},
+            ):
+                ...
+
+        Args:
+            method: A paginated resource method taking ``date`` or ``date_range``.
+            shard_days: Length of each sub-window in days.
+            max_concurrency: Maximum number of shards fetched at once.
+            **params: Arguments for *method*. ``limit`` applies per shard.
+        """
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be at least 1.")
+        return self._iter_shards(method, plan_shards(method, params, shard_days), max_concurrency)
+
+    def _iter_shards(
+        self,
+        method: Callable[..., SyncPage[T]],
+        shards: list[dict[str, Any]],
+        max_concurrency: int,
+    ) -> Iterator[T]:
+        def fetch(kwargs: dict[str, Any]) -> list[T]:
+            return list(method(**kwargs))
+
+        executor = ThreadPoolExecutor(
+            max_workers=max_concurrency, thread_name_prefix="nansen-shard"
+        )
+        remaining = iter(shards)
+        pending: collections.deque[Future[list[T]]] = collections.deque(
+            submit_in_context(executor, fetch, kwargs)
+            for kwargs in itertools.islice(remaining, max_concurrency)
+        )
+        try:
+            # Shards are consumed in order; at most max_concurrency are buffered or in flight.
+            while pending:
+                items = pending.popleft().result()
+                for kwargs in itertools.islice(remaining, 1):
+                    pending.append(submit_in_context(executor, fetch, kwargs))
+                yield from items
+        finally:
+            for future in pending:
+                future.cancel()
+            executor.shutdown(wait=False)
+
+    def across_chains(
+        self,
+        method: Callable[..., R],
+        /,
+        *,
+        chains: Iterable[str] | None = None,
+        max_concurrency: int = DEFAULT_FAN_OUT_CONCURRENCY,
+        **params: Any,
+    ) -> FanOutResult[str, R]:
+        """Run a single-chain call for several chains concurrently.
+
+        ``method(chain=..., **params)`` is called once per chain on worker
+        threads, all sharing the client's rate limiter and credit ledger.
+        A chain that fails is reported in ``errors`` without aborting the
+        rest::
+
+            balances = client.across_chains(
+                client.profiler.address.current_balance, address="0x...",
+            )
+            for chain, item in balances.iter_items():
+                ...
+
+        Args:
+            method: A resource method taking a ``chain`` argument.
+            chains: Chains to query; every supported chain by default.
+            max_concurrency: Maximum number of calls in flight at once.
+            **params: Other arguments for *method*.
+        """
+        return fan_out(
+            lambda chain: method(chain=chain, **params),
+            ALL_CHAINS if chains is None else chains,
+            max_concurrency=max_concurrency,
+        )
+
+
+class _AsyncFlight:
+    """A request in flight that identical async requests wait on instead of sending."""
+
+    __slots__ = ("done", "error", "response")
+
+    def __init__(self) -> None:
+        self.done = anyio.Event()
+        self.response: httpx.Response | None = None
+        self.error: Exception | None = None
+
 
 class AsyncAPIClient(_BaseClient):
     """Asynchronous HTTP client backed by ``httpx.AsyncClient``."""
@@ -233,19 +689,55 @@ class AsyncAPIClient(_BaseClient):
         timeout: float = DEFAULT_TIMEOUT,
         max_retries: int = DEFAULT_MAX_RETRIES,
         http_client: httpx.AsyncClient | None = None,
+        json_backend: JSONBackend = "pydantic",
+        connection_limits: httpx.Limits | None = None,
+        http2: bool = False,
+        share_transport: bool = False,
+        compression: bool = True,
+        rate_limiter: RateLimiter | None | NotGiven = NOT_GIVEN,
+        credit_budget: int | None = None,
+        cache: ResponseCache | None = None,
+        result_mode: ResultMode = "model",
     ) -> None:
         super().__init__(
             api_key=api_key,
             base_url=base_url,
             timeout=timeout,
             max_retries=max_retries,
+            json_backend=json_backend,
+            compression=compression,
+            rate_limiter=rate_limiter,
+            credit_budget=credit_budget,
+            cache=cache,
+            result_mode=result_mode,
         )
-        self._client = http_client or httpx.AsyncClient(timeout=timeout)
+        self._client = http_client or build_async_http_client(
+            timeout=timeout,
+            limits=connection_limits,
+            http2=http2,
+            share_transport=share_transport,
+        )
+        self._inflight: dict[str, _AsyncFlight] = {}
+        # The open task group, if any; a list so that ``with_options`` copies share it.
+        self._task_groups: list[TaskGroup] = []
+
+    @property
+    def _background(self) -> TaskGroup | None:
+        """Task group for background work (refreshes, read-ahead), while open as ``async with``."""
+        return self._task_groups[0] if self._task_groups else None
 
     async def __aenter__(self) -> AsyncAPIClient:
+        background = anyio.create_task_group()
+        await background.__aenter__()
+        self._task_groups[:] = [background]
         return self
 
     async def __aexit__(self, *args: Any) -> None:
+        background = self._background
+        self._task_groups.clear()
+        if background is not None:
+            background.cancel_scope.cancel()
+            await background.__aexit__(None, None, None)
         await self.close()
 
     async def close(self) -> None:
@@ -260,49 +752,175 @@ class AsyncAPIClient(_BaseClient):
         params: dict[str, Any] | None = None,
         headers: dict[str, str] | None = None,
         base_url: str | None = None,
+    ) -> httpx.Response:
+        key = cache_key(
+            method,
+            base_url or self.base_url,
+            path,
+            body,
+            params,
+            api_key=(headers or {}).get("apikey", self.api_key),
+        )
+        cache = self._active_cache
+        send = functools.partial(
+            self._send, method, path, body=body, params=params, headers=headers, base_url=base_url
+        )
+        if cache is not None:
+            if self._background is None and cache.grace_for(path) > 0:
+                raise RuntimeError(
+                    f"The cache serves {path} stale while it refreshes in the background, "
+                    "which needs the client open as `async with AsyncNansen(...) as client:`. "
+                    "Open it that way, or set the endpoint's stale grace to 0."
+                )
+            hit = cache.get(key, path)
+            if hit is not None:
+                if hit.stale:
+                    self._revalidate(key, path, cache, send)
+                return hit.response.to_response(age=hit.age, stale=hit.stale)
+        return await self._coalesced(key, path, cache, send)
+
+    async def _coalesced(
+        self,
+        key: str,
+        path: str,
+        cache: ResponseCache | None,
+        send: Callable[[], Awaitable[httpx.Response]],
+    ) -> httpx.Response:
+        # Single flight: identical requests already in flight share its response.
+        while True:
+            joined = self._inflight.get(key)
+            if joined is None:
+                flight = self._inflight[key] = _AsyncFlight()
+                return await self._fly(flight, key, path, cache, send)
+            await joined.done.wait()
+            if joined.response is not None:
+                return joined.response
+            if joined.error is not None:
+                raise joined.error
+            # Its sender was cancelled before a response arrived; send it again.
+
+    async def _fly(
+        self,
+        flight: _AsyncFlight,
+        key: str,
+        path: str,
+        cache: ResponseCache | None,
+        send: Callable[[], Awaitable[httpx.Response]],
+    ) -> httpx.Response:
+        try:
+            # Let identical requests started alongside this one join it.
+            await anyio.lowlevel.checkpoint()
+            response = await send()
+            if cache is not None:
+                cache.set(key, path, CachedResponse.from_response(response))
+        except Exception as exc:
+            flight.error = exc
+            raise
+        else:
+            flight.response = response
+        finally:
+            if self._inflight.get(key) is flight:
+                del self._inflight[key]
+            flight.done.set()
+        return response
+
+    def _revalidate(
+        self,
+        key: str,
+        path: str,
+        cache: ResponseCache,
+        send: Callable[[], Awaitable[httpx.Response]],
+    ) -> None:
+        background = self._background
+        if background is None or key in self._inflight:
+            # Closed, or a refresh (or an identical request) is already in flight.
+            return
+        flight = self._inflight[key] = _AsyncFlight()
+        background.start_soon(self._refresh, flight, key, path, cache, send)
+
+    async def _refresh(
+        self,
+        flight: _AsyncFlight,
+        key: str,
+        path: str,
+        cache: ResponseCache,
+        send: Callable[[], Awaitable[httpx.Response]],
+    ) -> None:
+        try:
+            await self._fly(flight, key, path, cache, send)
+        except Exception:
+            logger.warning(
+                "Background refresh of %s failed; serving the stale response.", path, exc_info=True
+            )
+
+    async def _send(
+        self,
+        method: str,
+        path: str,
+        *,
+        body: dict[str, object] | None = None,
+        params: dict[str, Any] | None = None,
+        headers: dict[str, str] | None = None,
+        base_url: str | None = None,
     ) -> httpx.Response:
         url = f"{base_url or self.base_url}{path}"
         request_headers = self._build_headers()
         if headers:
             request_headers.update(headers)
 
-        last_exc: Exception | None = None
-        for attempt in range(self.max_retries + 1):
-            try:
-                response = await self._client.request(
-                    method,
-                    url,
-                    json=body,
-                    params=params,
-                    headers=request_headers,
-                )
-            except httpx.TimeoutException as exc:
-                last_exc = APITimeoutError()
-                if attempt >= self.max_retries:
-                    raise last_exc from exc
-                delay = calculate_retry_delay(attempt)
-                await anyio.sleep(delay)
-                continue
-            except httpx.ConnectError as exc:
-                last_exc = APIConnectionError(message=str(exc))
-                if attempt >= self.max_retries:
-                    raise last_exc from exc
-                delay = calculate_retry_delay(attempt)
-                await anyio.sleep(delay)
-                continue
-
-            if self._should_retry(response) and attempt < self.max_retries:
-                delay = calculate_retry_delay(
-                    attempt,
-                    response.headers.get("retry-after"),
+        reservation = self.credits.check(path)
+        try:
+            last_exc: Exception | None = None
+            for attempt in range(self.max_retries + 1):
+                if self.rate_limiter is not None:
+                    await self.rate_limiter.acquire_async()
+                try:
+                    response = await self._client.request(
+                        method,
+                        url,
+                        json=body,
+                        params=params,
+                        headers=request_headers,
+                    )
+                except httpx.TimeoutException as exc:
+                    last_exc = APITimeoutError()
+                    if attempt >= self.max_retries:
+                        raise last_exc from exc
+                    delay = calculate_retry_delay(attempt)
+                    await anyio.sleep(delay)
+                    continue
+                except httpx.ConnectError as exc:
+                    last_exc = APIConnectionError(message=str(exc))
+                    if attempt >= self.max_retries:
+                        raise last_exc from exc
+                    delay = calculate_retry_delay(attempt)
+                    await anyio.sleep(delay)
+                    continue
+
+                info = RateLimitInfo.from_headers(response.headers)
+                self.credits.record(
+                    path,
+                    credits_used=info.credits_used,
+                    credits_remaining=info.credits_remaining,
+                    reservation=reservation,
                 )
-                await anyio.sleep(delay)
-                continue
+                if self.rate_limiter is not None:
+                    self.rate_limiter.observe(info)
+
+                if self._should_retry(response) and attempt < self.max_retries:
+                    delay = calculate_retry_delay(
+                        attempt,
+                        response.headers.get("retry-after"),
+                    )
+                    await anyio.sleep(delay)
+                    continue
 
-            self._raise_for_response(response)
-            return response
+                self._raise_for_response(response)
+                return response
 
-        raise last_exc or APIConnectionError(message="Max retries exceeded")
+            raise last_exc or APIConnectionError(message="Max retries exceeded")
+        finally:
+            reservation.release()
 
     async def _post(
         self,
@@ -338,9 +956,50 @@ class AsyncAPIClient(_BaseClient):
         path: str,
         body: dict[str, object],
         model: type[T],
+        limit: int | None = None,
     ) -> AsyncPage[T]:
-        response = await self._request("POST", path, body=body)
+        if limit is None:
+            response = await self._request("POST", path, body=body)
+            items, pagination = self._parse_page_response(response, model)
+            return AsyncPage(
+                data=items,
+                pagination=pagination,
+                client=self,
+                path=path,
+                body=body,
+                model=model,
+                meta=ResponseMeta.from_response(response),
+            )
+
+        body = self._limit_page_body(path, body, limit)
+        if _page_offset(body) >= limit:
+            # Nothing left to fetch; don't spend a request on it.
+            return AsyncPage(
+                data=[],
+                pagination=_empty_last_page(body),
+                client=self,
+                path=path,
+                body=body,
+                model=model,
+                limit=limit,
+            )
+        shrinks = 0
+        while True:
+            try:
+                response = await self._request("POST", path, body=body)
+                break
+            except PAGE_SIZE_ERRORS as exc:
+                if shrinks == MAX_PAGE_SIZE_SHRINKS or not _is_page_size_error(exc):
+                    raise
+                smaller = _shrink_page_size(body)
+                if smaller is None:
+                    raise
+                body = smaller
+                shrinks += 1
+        if shrinks:
+            self._remember_page_size(path, body)
         items, pagination = self._parse_page_response(response, model)
+        items, pagination = _trim_to_limit(items, pagination, body, limit)
         return AsyncPage(
             data=items,
             pagination=pagination,
@@ -348,4 +1007,141 @@ class AsyncAPIClient(_BaseClient):
             path=path,
             body=body,
             model=model,
+            meta=ResponseMeta.from_response(response),
+            limit=limit,
+        )
+
+    async def resume_page(self, cursor: PageCursor | str) -> AsyncPage[Any]:
+        """Fetch the page named by a :class:`PageCursor` or cursor token.
+
+        Use this to continue a paginated export from a checkpoint, e.g. with a
+        fresh client after the original process exited.
+        """
+        if isinstance(cursor, str):
+            cursor = PageCursor.from_token(cursor)
+        return await self._request_page(
+            path=cursor.path,
+            body=cursor.body,
+            model=cursor.resolve_model(),
+            limit=cursor.limit,
         )
+
+    def iter_sharded(
+        self,
+        method: Callable[..., Awaitable[AsyncPage[T]]],
+        /,
+        *,
+        shard_days: float = 1,
+        max_concurrency: int = DEFAULT_SHARD_CONCURRENCY,
+        **params: Any,
+    ) -> AsyncIterator[T]:
+        """Fetch a time-bounded paginated call as concurrent date-range shards.
+
+        The ``date`` (or ``date_range``) window in *params* is split into
+        ``shard_days``-long sub-windows; up to ``max_concurrency`` shards are
+        paginated at once as tasks, all sharing the client's rate limiter and
+        credit ledger. While the client is open as ``async with`` the tasks
+        run in its task group and keep going as items are consumed; otherwise
+        shards are fetched in batches. Items come back as one stream in
+        timestamp order::
+
+            async for trade in client.iter_sharded(
+                client.tgm.dex_trades,
+                chain="ethereum",
+                token_address="0x...",
+                date={"from": "2024-01-01", "to": "2024-03-31"},
+            ):
+                ...
+
+        Args:
+            method: A paginated resource method taking ``date`` or ``date_range``.
+            shard_days: Length of each sub-window in days.
+            max_concurrency: Maximum number of shards fetched at once.
+            **params: Arguments for *method*. ``limit`` applies per shard.
+        """
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be at least 1.")
+        return self._iter_shards(method, plan_shards(method, params, shard_days), max_concurrency)
+
+    async def _iter_shards(
+        self,
+        method: Callable[..., Awaitable[AsyncPage[T]]],
+        shards: list[dict[str, Any]],
+        max_concurrency: int,
+    ) -> AsyncIterator[T]:
+        results: dict[int, list[T] | Exception] = {}
+
+        async def fetch(index: int, kwargs: dict[str, Any], done: anyio.Event) -> None:
+            try:
+                page = await method(**kwargs)
+                results[index] = [item async for item in page]
+            except Exception as exc:
+                results[index] = exc
+            finally:
+                if index not in results:
+                    results[index] = interrupted_error()
+                done.set()
+
+        remaining = enumerate(shards)
+        pending: collections.deque[tuple[int, anyio.Event]] = collections.deque()
+        spawner = TaskSpawner(self._background)
+
+        def start(count: int) -> None:
+            for index, kwargs in itertools.islice(remaining, count):
+                done = anyio.Event()
+                pending.append((index, done))
+                spawner.start_soon(fetch, index, kwargs, done)
+
+        try:
+            # Shards are consumed in order; at most max_concurrency are buffered or in flight.
+            start(max_concurrency)
+            while pending:
+                index, done = pending.popleft()
+                await spawner.wait(done)
+                items = results.pop(index)
+                if isinstance(items, Exception):
+                    raise items
+                start(1)
+                for item in items:
+                    yield item
+        finally:
+            spawner.cancel()
+
+    async def across_chains(
+        self,
+        method: Callable[..., Awaitable[R]],
+        /,
+        *,
+        chains: Iterable[str] | None = None,
+        max_concurrency: int = DEFAULT_FAN_OUT_CONCURRENCY,
+        **params: Any,
+    ) -> FanOutResult[str, R]:
+        """Run a single-chain call for several chains concurrently.
+
+        ``method(chain=..., **params)`` is awaited once per chain, all
+        sharing the client's rate limiter and credit ledger. A chain that
+        fails is reported in ``errors`` without aborting the rest::
+
+            balances = await client.across_chains(
+                client.profiler.address.current_balance, address="0x...",
+            )
+            for chain, item in balances.iter_items():
+                ...
+
+        Args:
+            method: A resource method taking a ``chain`` argument.
+            chains: Chains to query; every supported chain by default.
+            max_concurrency: Maximum number of calls in flight at once.
+            **params: Other arguments for *method*.
+        """
+        return await fan_out_async(
+            lambda chain: method(chain=chain, **params),
+            ALL_CHAINS if chains is None else chains,
+            max_concurrency=max_concurrency,
+        )
+
+
+def _check_result_mode(result_mode: str) -> ResultMode:
+    if result_mode not in RESULT_MODES:
+        raise ValueError(f"Unknown result_mode {result_mode!r}; expected one of {RESULT_MODES}.")
+    return result_mode
@@ -0,0 +1,469 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+import zlib
+from collections import OrderedDict
+from collections.abc import Callable, Mapping
+from dataclasses import dataclass
+from typing import Any
+
+import httpx
+
+from nansen._constants import (
+    DEFAULT_CACHE_MAXSIZE,
+    DEFAULT_CACHE_TTL,
+    DEFAULT_CACHE_TTLS,
+    DEFAULT_DISK_CACHE_MAX_BYTES,
+)
+from nansen._response import CACHE_AGE_EXTENSION, CACHE_STALE_EXTENSION
+
+# Transfer headers that no longer describe a cached (already decoded) body.
+_DROPPED_HEADERS = frozenset({"content-encoding", "content-length", "transfer-encoding"})
+
+
+def cache_key(
+    method: str,
+    base_url: str,
+    path: str,
+    body: Mapping[str, Any] | None,
+    params: Mapping[str, Any] | None,
+    *,
+    api_key: str = "",
+) -> str:
+    """Return a stable key for a request.
+
+    The body and query parameters are canonicalised (sorted keys, compact
+    separators), so logically identical requests share a key regardless of
+    argument order. A digest of *api_key* is part of the key, so clients
+    sharing a cache never serve one account's responses to another.
+    """
+    account = hashlib.sha256(api_key.encode()).hexdigest()
+    canonical = json.dumps(
+        [method.upper(), base_url, path, body, params, account],
+        sort_keys=True,
+        separators=(",", ":"),
+        default=str,
+    )
+    return hashlib.sha256(canonical.encode()).hexdigest()
+
+
+@dataclass(frozen=True)
+class CachedResponse:
+    """The parts of a successful response needed to replay it."""
+
+    status_code: int
+    headers: tuple[tuple[str, str], ...]
+    content: bytes
+    url: str
+    method: str
+
+    @classmethod
+    def from_response(cls, response: httpx.Response) -> CachedResponse:
+        headers = tuple(
+            (name, value)
+            for name, value in response.headers.items()
+            if name.lower() not in _DROPPED_HEADERS
+        )
+        return cls(
+            status_code=response.status_code,
+            headers=headers,
+            content=response.content,
+            url=str(response.request.url),
+            method=response.request.method,
+        )
+
+    def to_response(self, *, age: float = 0.0, stale: bool = False) -> httpx.Response:
+        """Rebuild an ``httpx.Response`` equivalent to the original.
+
+        The cache *age* and staleness are recorded in the response extensions,
+        where :class:`~nansen.APIResponse` reads them.
+        """
+        return httpx.Response(
+            self.status_code,
+            headers=self.headers,
+            content=self.content,
+            request=httpx.Request(self.method, self.url),
+            extensions={CACHE_AGE_EXTENSION: age, CACHE_STALE_EXTENSION: stale},
+        )
+
+
+@dataclass(frozen=True)
+class CacheHit:
+    """A response found in a :class:`ResponseCache`."""
+
+    response: CachedResponse
+    age: float
+    """Seconds since the response was fetched from the API."""
+    stale: bool
+    """The TTL has passed and the response is served within the grace window."""
+
+
+@dataclass(frozen=True)
+class CacheStats:
+    """Point-in-time counters of a :class:`ResponseCache`."""
+
+    hits: int
+    misses: int
+    evictions: int
+    """Entries dropped to stay within ``maxsize``."""
+    expirations: int
+    """Entries dropped because their TTL had passed."""
+    size: int
+    maxsize: int
+    disk_hits: int = 0
+    """Hits served from the :class:`SQLiteCache` tier (included in ``hits``)."""
+    stale_hits: int = 0
+    """Hits served stale while a refresh ran (included in ``hits``)."""
+
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS responses (
+    key TEXT PRIMARY KEY,
+    status_code INTEGER NOT NULL,
+    headers TEXT NOT NULL,
+    url TEXT NOT NULL,
+    method TEXT NOT NULL,
+    body BLOB NOT NULL,
+    size INTEGER NOT NULL,
+    stored_at REAL NOT NULL,
+    expires_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS responses_stored_at ON responses (stored_at);
+"""
+
+
+class SQLiteCache:
+    """SQLite-backed response store shared by every process using the same file.
+
+    Use it as the second tier of a :class:`ResponseCache`, so short-lived
+    worker processes reuse each other's responses::
+
+        cache = ResponseCache(disk=SQLiteCache("~/.cache/nansen/responses.sqlite"))
+        client = Nansen(cache=cache)
+
+    The database runs in WAL mode, so readers never block and concurrent
+    writers from other processes wait on SQLite's lock rather than failing.
+    Bodies are stored decoded and zlib-compressed; a hit replays them straight
+    into response validation without any HTTP decoding. Expired entries are
+    never returned, and once the stored bodies exceed *max_bytes* expired and
+    then oldest entries are deleted.
+
+    Args:
+        path: Database file, created with its parent directories if missing.
+        max_bytes: Upper bound on the total size of the compressed bodies.
+        timeout: Seconds to wait for another process's write lock.
+        clock: Wall-clock time source (expiry is shared across processes),
+            overridable for testing.
+    """
+
+    def __init__(
+        self,
+        path: str | os.PathLike[str],
+        *,
+        max_bytes: int = DEFAULT_DISK_CACHE_MAX_BYTES,
+        timeout: float = 30.0,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        if max_bytes < 1:
+            raise ValueError("max_bytes must be at least 1.")
+        self.path = os.path.expanduser(os.fspath(path))
+        self.max_bytes = max_bytes
+        self._timeout = timeout
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._conn: sqlite3.Connection | None = None
+        self._pid = 0
+
+    def _connect(self) -> sqlite3.Connection:
+        # Connections must not be shared with forked children.
+        if self._conn is None or self._pid != os.getpid():
+            directory = os.path.dirname(self.path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            conn = sqlite3.connect(
+                self.path, timeout=self._timeout, isolation_level=None, check_same_thread=False
+            )
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.executescript(_SCHEMA)
+            self._conn = conn
+            self._pid = os.getpid()
+        return self._conn
+
+    def get(self, key: str, *, grace: float = 0.0) -> tuple[CachedResponse, float, float] | None:
+        """Return the response stored under *key*, its age and its remaining TTL.
+
+        Entries that expired less than *grace* seconds ago are still returned,
+        with a negative remaining TTL.
+        """
+        with self._lock:
+            row = (
+                self._connect()
+                .execute(
+                    "SELECT status_code, headers, url, method, body, stored_at, expires_at"
+                    " FROM responses WHERE key = ?",
+                    (key,),
+                )
+                .fetchone()
+            )
+        if row is None:
+            return None
+        status_code, headers, url, method, body, stored_at, expires_at = row
+        now = self._clock()
+        remaining = expires_at - now
+        if remaining <= -max(grace, 0.0):
+            return None
+        response = CachedResponse(
+            status_code=status_code,
+            headers=tuple((name, value) for name, value in json.loads(headers)),
+            content=zlib.decompress(body),
+            url=url,
+            method=method,
+        )
+        return response, now - stored_at, remaining
+
+    def set(self, key: str, response: CachedResponse, ttl: float) -> None:
+        """Store *response* under *key* for *ttl* seconds, evicting to stay in budget."""
+        body = zlib.compress(response.content)
+        now = self._clock()
+        with self._lock:
+            conn = self._connect()
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                conn.execute(
+                    "INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                    (
+                        key,
+                        response.status_code,
+                        json.dumps(response.headers),
+                        response.url,
+                        response.method,
+                        body,
+                        len(body),
+                        now,
+                        now + ttl,
+                    ),
+                )
+                self._evict(conn, now)
+                conn.execute("COMMIT")
+            except BaseException:
+                conn.execute("ROLLBACK")
+                raise
+
+    def _evict(self, conn: sqlite3.Connection, now: float) -> None:
+        (total,) = conn.execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()
+        if total <= self.max_bytes:
+            return
+        conn.execute("DELETE FROM responses WHERE expires_at <= ?", (now,))
+        (total,) = conn.execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()
+        excess = total - self.max_bytes
+        if excess <= 0:
+            return
+        freed = 0
+        doomed: list[str] = []
+        for key, size in conn.execute("SELECT key, size FROM responses ORDER BY stored_at"):
+            doomed.append(key)
+            freed += size
+            if freed >= excess:
+                break
+        conn.executemany("DELETE FROM responses WHERE key = ?", [(key,) for key in doomed])
+
+    def invalidate(self, key: str) -> None:
+        """Drop the entry stored under *key*, if any."""
+        with self._lock:
+            self._connect().execute("DELETE FROM responses WHERE key = ?", (key,))
+
+    def clear(self) -> None:
+        """Drop every entry, for all processes sharing the file."""
+        with self._lock:
+            self._connect().execute("DELETE FROM responses")
+
+    def close(self) -> None:
+        """Close this process's connection; the next call reopens it."""
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+    @property
+    def size_bytes(self) -> int:
+        """Total size of the stored (compressed) bodies."""
+        with self._lock:
+            (total,) = (
+                self._connect().execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()
+            )
+        return int(total)
+
+    def __len__(self) -> int:
+        with self._lock:
+            (count,) = self._connect().execute("SELECT COUNT(*) FROM responses").fetchone()
+        return int(count)
+
+
+class ResponseCache:
+    """In-memory TTL + LRU cache of successful API responses.
+
+    Pass an instance to a client to enable caching::
+
+        client = Nansen(cache=ResponseCache(ttls={"/token-screener": 30}))
+
+    Responses are keyed on method, base URL, path, the canonicalised
+    request body and a digest of the API key, so each page of a paginated
+    call is cached on its own and re-walking a page set makes no requests.
+    Cache hits spend no rate-limit budget or credits. Bypass the cache for
+    individual calls with ``client.with_options(use_cache=False)``.
+
+    With a grace window, an expired response is returned immediately, marked
+    stale and with its age on :attr:`APIResponse.cache_age
+    <nansen.APIResponse.cache_age>`, while the client refreshes it in the
+    background. Failed refreshes are logged and the stale response is kept
+    until the grace window ends. Async clients refresh in the task group
+    of ``async with``, so they raise :exc:`RuntimeError` for an endpoint
+    with a grace window when used without it.
+
+    Args:
+        maxsize: Maximum number of cached responses; least recently used
+            responses are evicted first.
+        ttl: Seconds a response stays fresh for endpoints without an entry in
+            *ttls*.
+        ttls: Per-endpoint TTLs keyed by path (e.g. ``"/profiler/address/labels"``),
+            merged over the built-in defaults for slow-moving endpoints. A TTL
+            of ``0`` disables caching for that endpoint.
+        stale_grace: Seconds past its TTL that a response is still served
+            (stale-while-revalidate) while one background request refreshes it.
+            ``0`` disables stale serving.
+        stale_graces: Per-endpoint grace windows keyed by path, overriding
+            *stale_grace*.
+        disk: Optional persistent tier shared across processes.
+        clock: Monotonic time source, overridable for testing.
+    """
+
+    def __init__(
+        self,
+        *,
+        maxsize: int = DEFAULT_CACHE_MAXSIZE,
+        ttl: float = DEFAULT_CACHE_TTL,
+        ttls: Mapping[str, float] | None = None,
+        stale_grace: float = 0.0,
+        stale_graces: Mapping[str, float] | None = None,
+        disk: SQLiteCache | None = None,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        if maxsize < 1:
+            raise ValueError("maxsize must be at least 1.")
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.ttls = {**DEFAULT_CACHE_TTLS, **(ttls or {})}
+        self.stale_grace = stale_grace
+        self.stale_graces = dict(stale_graces or {})
+        self.disk = disk
+        self._clock = clock
+        self._lock = threading.Lock()
+        # key -> (stored_at, expires_at, response)
+        self._entries: OrderedDict[str, tuple[float, float, CachedResponse]] = OrderedDict()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._expirations = 0
+        self._disk_hits = 0
+        self._stale_hits = 0
+
+    def ttl_for(self, path: str) -> float:
+        """Return the TTL, in seconds, applied to responses from *path*."""
+        return self.ttls.get(path, self.ttl)
+
+    def grace_for(self, path: str) -> float:
+        """Return the stale-while-revalidate window, in seconds, for *path*."""
+        return self.stale_graces.get(path, self.stale_grace)
+
+    def get(self, key: str, path: str) -> CacheHit | None:
+        """Return the response stored under *key*, counting a hit or miss.
+
+        Expired responses are returned (marked stale) until the grace window
+        for *path* ends.
+        """
+        grace = self.grace_for(path)
+        with self._lock:
+            now = self._clock()
+            entry = self._entries.get(key)
+            if entry is not None and entry[1] + max(grace, 0.0) <= now:
+                del self._entries[key]
+                self._expirations += 1
+                entry = None
+            if entry is not None:
+                stored_at, expires_at, response = entry
+                self._entries.move_to_end(key)
+                return self._hit(response, now - stored_at, stale=expires_at <= now)
+        stored = self.disk.get(key, grace=grace) if self.disk is not None else None
+        with self._lock:
+            if stored is None:
+                self._misses += 1
+                return None
+            response, age, remaining = stored
+            now = self._clock()
+            self._store(key, response, stored_at=now - age, expires_at=now + remaining)
+            self._disk_hits += 1
+            return self._hit(response, age, stale=remaining <= 0)
+
+    def _hit(self, response: CachedResponse, age: float, *, stale: bool) -> CacheHit:
+        self._hits += 1
+        if stale:
+            self._stale_hits += 1
+        return CacheHit(response=response, age=age, stale=stale)
+
+    def set(self, key: str, path: str, response: CachedResponse) -> None:
+        """Store *response* under *key* using the TTL configured for *path*."""
+        ttl = self.ttl_for(path)
+        if ttl <= 0:
+            return
+        with self._lock:
+            now = self._clock()
+            self._store(key, response, stored_at=now, expires_at=now + ttl)
+        if self.disk is not None:
+            self.disk.set(key, response, ttl)
+
+    def _store(
+        self, key: str, response: CachedResponse, *, stored_at: float, expires_at: float
+    ) -> None:
+        self._entries[key] = (stored_at, expires_at, response)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+            self._evictions += 1
+
+    def invalidate(self, key: str) -> None:
+        """Drop the entry stored under *key*, if any."""
+        with self._lock:
+            self._entries.pop(key, None)
+        if self.disk is not None:
+            self.disk.invalidate(key)
+
+    def clear(self) -> None:
+        """Drop every entry, including the disk tier. Counters are kept."""
+        with self._lock:
+            self._entries.clear()
+        if self.disk is not None:
+            self.disk.clear()
+
+    @property
+    def stats(self) -> CacheStats:
+        """Hit, miss, eviction and expiration counters."""
+        with self._lock:
+            return CacheStats(
+                hits=self._hits,
+                misses=self._misses,
+                evictions=self._evictions,
+                expirations=self._expirations,
+                size=len(self._entries),
+                maxsize=self.maxsize,
+                disk_hits=self._disk_hits,
+                stale_hits=self._stale_hits,
+            )
+
+    def __len__(self) -> int:
+        return len(self._entries)
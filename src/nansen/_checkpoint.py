@@ -0,0 +1,124 @@
+from __future__ import annotations
+
+import base64
+import contextlib
+import importlib
+import json
+import os
+import tempfile
+import zlib
+from dataclasses import dataclass
+from typing import Any
+
+from nansen._models import BaseModel
+
+_CURSOR_VERSION = 1
+
+
+@dataclass(frozen=True)
+class PageCursor:
+    """Serializable position within a paginated result set.
+
+    A cursor records everything needed to request one page again (endpoint
+    path, request body including the page number, and the item model), so
+    a long export can resume from a fresh client after a crash::
+
+        cursor = page.next_cursor()
+        token = cursor.to_token()          # or cursor.save("export.ckpt")
+        ...
+        page = client.resume_page(token)   # or PageCursor.load("export.ckpt")
+    """
+
+    path: str
+    body: dict[str, Any]
+    model: str
+    """Import path of the item model, as ``"module:QualName"``."""
+    limit: int | None = None
+    """Total item limit of the paginated call, if one was set."""
+
+    @classmethod
+    def for_page(
+        cls,
+        *,
+        path: str,
+        body: dict[str, Any],
+        model: type[BaseModel],
+        limit: int | None = None,
+    ) -> PageCursor:
+        return cls(
+            path=path,
+            body=body,
+            model=f"{model.__module__}:{model.__qualname__}",
+            limit=limit,
+        )
+
+    @property
+    def page(self) -> int:
+        """The page number this cursor points at."""
+        pagination = self.body.get("pagination")
+        if isinstance(pagination, dict):
+            return int(pagination.get("page", 1))
+        return 1
+
+    def resolve_model(self) -> type[BaseModel]:
+        """Import the item model named by this cursor."""
+        module_name, _, qualname = self.model.partition(":")
+        if not (module_name == "nansen" or module_name.startswith("nansen.")):
+            raise ValueError(f"Cursor model {self.model!r} is not a nansen type.")
+        obj: Any = importlib.import_module(module_name)
+        for attr in qualname.split("."):
+            obj = getattr(obj, attr)
+        if not (isinstance(obj, type) and issubclass(obj, BaseModel)):
+            raise ValueError(f"Cursor model {self.model!r} is not a response model.")
+        return obj
+
+    def _payload(self) -> dict[str, Any]:
+        payload = {"v": _CURSOR_VERSION, "path": self.path, "body": self.body, "model": self.model}
+        if self.limit is not None:
+            payload["limit"] = self.limit
+        return payload
+
+    @classmethod
+    def _from_payload(cls, payload: Any) -> PageCursor:
+        if not isinstance(payload, dict) or payload.get("v") != _CURSOR_VERSION:
+            raise ValueError("Unsupported or corrupt page cursor.")
+        return cls(
+            path=payload["path"],
+            body=payload["body"],
+            model=payload["model"],
+            limit=payload.get("limit"),
+        )
+
+    def to_token(self) -> str:
+        """Encode the cursor as a compact URL-safe string."""
+        raw = json.dumps(self._payload(), separators=(",", ":"), sort_keys=True).encode()
+        return base64.urlsafe_b64encode(zlib.compress(raw)).decode("ascii")
+
+    @classmethod
+    def from_token(cls, token: str) -> PageCursor:
+        """Decode a cursor produced by :meth:`to_token`."""
+        try:
+            raw = zlib.decompress(base64.urlsafe_b64decode(token.encode("ascii")))
+            payload = json.loads(raw)
+        except (ValueError, zlib.error) as exc:
+            raise ValueError("Unsupported or corrupt page cursor.") from exc
+        return cls._from_payload(payload)
+
+    def save(self, file: str | os.PathLike[str]) -> None:
+        """Write the cursor to *file* atomically (a crash never leaves a torn file)."""
+        directory = os.path.dirname(os.fspath(file)) or "."
+        fd, tmp = tempfile.mkstemp(dir=directory, prefix=".nansen-cursor-")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as fh:
+                json.dump(self._payload(), fh, separators=(",", ":"), sort_keys=True)
+            os.replace(tmp, file)
+        except BaseException:
+            with contextlib.suppress(OSError):
+                os.unlink(tmp)
+            raise
+
+    @classmethod
+    def load(cls, file: str | os.PathLike[str]) -> PageCursor:
+        """Read a cursor written by :meth:`save`."""
+        with open(file, encoding="utf-8") as fh:
+            return cls._from_payload(json.load(fh))
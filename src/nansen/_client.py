@@ -6,12 +6,16 @@ from functools import cached_property
 import httpx
 
 from nansen._base_client import AsyncAPIClient, SyncAPIClient
+from nansen._cache import ResponseCache
 from nansen._constants import (
     API_KEY_ENV_VAR,
     DEFAULT_BASE_URL,
     DEFAULT_MAX_RETRIES,
     DEFAULT_TIMEOUT,
 )
+from nansen._rate_limit import RateLimiter
+from nansen._types import NOT_GIVEN, NotGiven, ResultMode
+from nansen._utils._json import JSONBackend
 from nansen.resources.points import AsyncPoints, Points
 from nansen.resources.portfolio import AsyncPortfolio, Portfolio
 from nansen.resources.profiler.profiler import AsyncProfiler, Profiler
@@ -38,6 +42,15 @@ class Nansen(SyncAPIClient):
         timeout: float = DEFAULT_TIMEOUT,
         max_retries: int = DEFAULT_MAX_RETRIES,
         http_client: httpx.Client | None = None,
+        json_backend: JSONBackend = "pydantic",
+        connection_limits: httpx.Limits | None = None,
+        http2: bool = False,
+        share_transport: bool = False,
+        compression: bool = True,
+        rate_limiter: RateLimiter | None | NotGiven = NOT_GIVEN,
+        credit_budget: int | None = None,
+        cache: ResponseCache | None = None,
+        result_mode: ResultMode = "model",
     ) -> None:
         resolved_key = api_key or os.environ.get(API_KEY_ENV_VAR)
         if not resolved_key:
@@ -51,6 +64,15 @@ class Nansen(SyncAPIClient):
             timeout=timeout,
             max_retries=max_retries,
             http_client=http_client,
+            json_backend=json_backend,
+            connection_limits=connection_limits,
+            http2=http2,
+            share_transport=share_transport,
+            compression=compression,
+            rate_limiter=rate_limiter,
+            credit_budget=credit_budget,
+            cache=cache,
+            result_mode=result_mode,
         )
 
     @cached_property
@@ -93,6 +115,15 @@ class AsyncNansen(AsyncAPIClient):
         timeout: float = DEFAULT_TIMEOUT,
         max_retries: int = DEFAULT_MAX_RETRIES,
         http_client: httpx.AsyncClient | None = None,
+        json_backend: JSONBackend = "pydantic",
+        connection_limits: httpx.Limits | None = None,
+        http2: bool = False,
+        share_transport: bool = False,
+        compression: bool = True,
+        rate_limiter: RateLimiter | None | NotGiven = NOT_GIVEN,
+        credit_budget: int | None = None,
+        cache: ResponseCache | None = None,
+        result_mode: ResultMode = "model",
     ) -> None:
         resolved_key = api_key or os.environ.get(API_KEY_ENV_VAR)
         if not resolved_key:
@@ -106,6 +137,15 @@ class AsyncNansen(AsyncAPIClient):
             timeout=timeout,
             max_retries=max_retries,
             http_client=http_client,
+            json_backend=json_backend,
+            connection_limits=connection_limits,
+            http2=http2,
+            share_transport=share_transport,
+            compression=compression,
+            rate_limiter=rate_limiter,
+            credit_budget=credit_budget,
+            cache=cache,
+            result_mode=result_mode,
         )
 
     @cached_property
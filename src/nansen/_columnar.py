@@ -0,0 +1,302 @@
+from __future__ import annotations
+
+import functools
+import json
+import types
+from collections.abc import Iterable, Iterator, Mapping, Sequence
+from dataclasses import dataclass
+from typing import Any, Union, get_args, get_origin
+
+from nansen._compact import CompactRecord
+from nansen._models import BaseModel, LazyModel
+from nansen._utils._validators import get_adapter
+
+# Fill value and dtype for each nullable scalar type; nulls are also flagged in the mask.
+_NUMERIC: dict[type, tuple[str, Any]] = {
+    float: ("float64", float("nan")),
+    int: ("int64", 0),
+    bool: ("bool", False),
+}
+# pyarrow type factory for each scalar field type.
+_ARROW_SCALARS: dict[type, str] = {
+    str: "string",
+    float: "float64",
+    int: "int64",
+    bool: "bool_",
+}
+
+
+def _numpy() -> Any:
+    try:
+        import numpy
+    except ImportError as exc:
+        raise ImportError(
+            'Column batches require the numpy package: pip install "nansen[numpy]"'
+        ) from exc
+    return numpy
+
+
+def _pyarrow() -> Any:
+    try:
+        import pyarrow
+    except ImportError as exc:
+        raise ImportError(
+            'Arrow export requires the pyarrow package: pip install "nansen[arrow]"'
+        ) from exc
+    return pyarrow
+
+
+def _polars() -> Any:
+    try:
+        import polars
+    except ImportError as exc:
+        raise ImportError(
+            'Polars export requires the polars package: pip install "nansen[polars]"'
+        ) from exc
+    return polars
+
+
+def _pandas() -> Any:
+    try:
+        import pandas
+    except ImportError as exc:
+        raise ImportError(
+            'pandas export requires the pandas package: pip install "nansen[pandas]"'
+        ) from exc
+    return pandas
+
+
+@dataclass(frozen=True)
+class Categorical:
+    """Dictionary-encoded string column: ``categories[codes]``, with ``-1`` for nulls."""
+
+    codes: Any
+    """``int32`` array of indexes into :attr:`categories`."""
+    categories: Any
+    """Sorted ``object`` array of the distinct values."""
+
+    def __len__(self) -> int:
+        return len(self.codes)
+
+    def to_object(self) -> Any:
+        """Decode into an ``object`` array with ``None`` for nulls."""
+        np = _numpy()
+        values = np.empty(len(self.codes), dtype=object)
+        present = self.codes >= 0
+        values[present] = self.categories[self.codes[present]]
+        return values
+
+
+@dataclass(frozen=True)
+class ColumnBatch:
+    """One page of rows as NumPy columns, built without per-row model objects.
+
+    Columns follow the item model's fields. ``float``, ``int`` and ``bool``
+    fields become ``float64``, ``int64`` and ``bool`` arrays, with nulls
+    filled (``NaN``, ``0``, ``False``) and flagged in :attr:`masks`. String
+    fields become ``object`` arrays, or :class:`Categorical` columns when
+    requested. Other fields (lists, nested objects) are ``object`` arrays of
+    the decoded JSON. Fields the API returns beyond the model are skipped.
+    """
+
+    columns: dict[str, Any]
+    masks: dict[str, Any]
+    """``bool`` arrays, ``True`` where a numeric column is null."""
+    num_rows: int
+
+    def __getitem__(self, name: str) -> Any:
+        return self.columns[name]
+
+    def __len__(self) -> int:
+        return self.num_rows
+
+    @property
+    def names(self) -> list[str]:
+        return list(self.columns)
+
+    def masked(self, name: str) -> Any:
+        """Return a numeric column as a ``numpy.ma.MaskedArray``."""
+        np = _numpy()
+        return np.ma.MaskedArray(self.columns[name], mask=self.masks[name])
+
+
+def _scalar_type(annotation: Any) -> Any:
+    if get_origin(annotation) in (Union, types.UnionType):
+        options = [arg for arg in get_args(annotation) if arg is not type(None)]
+        if len(options) == 1:
+            return options[0]
+    return annotation
+
+
+@functools.cache
+def _column_types(model: type[BaseModel]) -> dict[str, Any]:
+    return {name: _scalar_type(field.annotation) for name, field in model.model_fields.items()}
+
+
+def _rows_as_mappings(rows: Sequence[Any]) -> Iterator[Any]:
+    for row in rows:
+        if isinstance(row, Mapping):
+            yield row
+        elif isinstance(row, LazyModel):
+            yield row.raw
+        elif isinstance(row, CompactRecord):
+            yield row.to_dict()
+        else:
+            yield row.model_dump() if isinstance(row, BaseModel) else {}
+
+
+def _column(np: Any, values: list[Any], tp: Any, categorical: bool) -> tuple[Any, Any | None]:
+    if tp in _NUMERIC:
+        dtype, fill = _NUMERIC[tp]
+        mask = np.fromiter((value is None for value in values), dtype=bool, count=len(values))
+        filled = [fill if value is None else value for value in values]
+        # Casting to int64 would silently truncate fractional floats.
+        if tp is not int or not any(
+            isinstance(value, float) and not value.is_integer() for value in filled
+        ):
+            try:
+                return np.array(filled, dtype=dtype), mask
+            except (TypeError, ValueError, OverflowError):
+                # Unexpected values (e.g. strings in a numeric field, or integers
+                # beyond int64): keep them as decoded.
+                pass
+    column = np.empty(len(values), dtype=object)
+    column[:] = values
+    if tp is str and categorical:
+        codes = np.full(len(values), -1, dtype="int32")
+        present = np.fromiter(
+            (value is not None for value in values), dtype=bool, count=len(values)
+        )
+        categories, inverse = np.unique(column[present].astype(str), return_inverse=True)
+        codes[present] = inverse
+        return Categorical(codes=codes, categories=categories.astype(object)), None
+    return column, None
+
+
+def columns_from_rows(
+    rows: Sequence[Any], model: type[BaseModel], *, categorical: Iterable[str] = ()
+) -> ColumnBatch:
+    """Build a :class:`ColumnBatch` from decoded rows (dicts) or row objects."""
+    np = _numpy()
+    categorical = frozenset(categorical)
+    mappings = list(_rows_as_mappings(rows))
+    columns: dict[str, Any] = {}
+    masks: dict[str, Any] = {}
+    for name, tp in _column_types(model).items():
+        values = [row.get(name) for row in mappings]
+        column, mask = _column(np, values, tp, name in categorical)
+        columns[name] = column
+        if mask is not None:
+            masks[name] = mask
+    return ColumnBatch(columns=columns, masks=masks, num_rows=len(mappings))
+
+
+def _arrow_type(pa: Any, annotation: Any) -> Any:
+    tp = _scalar_type(annotation)
+    if tp in _ARROW_SCALARS:
+        return getattr(pa, _ARROW_SCALARS[tp])()
+    if get_origin(tp) is list:
+        (item,) = get_args(tp)
+        return pa.list_(_arrow_type(pa, item))
+    if isinstance(tp, type) and issubclass(tp, BaseModel):
+        return pa.struct(arrow_schema(tp))
+    raise TypeError(f"No Arrow type for field annotation {annotation!r}")
+
+
+@functools.cache
+def arrow_schema(model: type[BaseModel]) -> Any:
+    """Return the ``pyarrow.Schema`` for rows of *model*.
+
+    Every field is nullable. ``str``, ``float``, ``int`` and ``bool`` map to
+    ``string``, ``float64``, ``int64`` and ``bool``; lists become Arrow lists
+    and nested models become structs.
+    """
+    pa = _pyarrow()
+    return pa.schema(
+        [(name, _arrow_type(pa, field.annotation)) for name, field in model.model_fields.items()]
+    )
+
+
+def _as_text(value: Any) -> str | None:
+    if value is None or isinstance(value, str):
+        return value
+    return json.dumps(value, default=str)
+
+
+def _arrow_column(pa: Any, values: list[Any], field: Any, annotation: Any) -> Any:
+    try:
+        return pa.array(values, type=field.type)
+    except (TypeError, ValueError, OverflowError):
+        pass
+    # Coerce the way the model would (e.g. "12" in an int field) before giving up.
+    adapter = get_adapter(list[annotation])
+    try:
+        return pa.array(adapter.dump_python(adapter.validate_python(values)), type=field.type)
+    except (TypeError, ValueError, OverflowError):
+        # Values the Arrow type cannot hold (e.g. integers beyond int64): keep them as text.
+        return pa.array([_as_text(value) for value in values], type=pa.string())
+
+
+def record_batch_from_rows(rows: Sequence[Any], model: type[BaseModel]) -> Any:
+    """Build a ``pyarrow.RecordBatch`` with :func:`arrow_schema` from rows or row objects.
+
+    Values are coerced as the model would coerce them, so raw rows convert
+    like validated ones. A column whose values still do not fit its Arrow
+    type becomes a ``string`` column of the decoded values.
+    """
+    pa = _pyarrow()
+    schema = arrow_schema(model)
+    mappings = list(_rows_as_mappings(rows))
+    try:
+        return pa.RecordBatch.from_pylist(mappings, schema=schema)
+    except (TypeError, ValueError, OverflowError):
+        pass
+    columns = [
+        _arrow_column(pa, [row.get(name) for row in mappings], schema.field(name), field.annotation)
+        for name, field in model.model_fields.items()
+    ]
+    return pa.RecordBatch.from_arrays(columns, names=schema.names)
+
+
+def _with_text_columns(pa: Any, batch: Any, names: set[str]) -> Any:
+    columns = [
+        pa.array([_as_text(value) for value in column.to_pylist()], type=pa.string())
+        if name in names and column.type != pa.string()
+        else column
+        for name, column in zip(batch.schema.names, batch.columns, strict=True)
+    ]
+    return pa.RecordBatch.from_arrays(columns, names=batch.schema.names)
+
+
+def arrow_table(batches: Iterable[Any], model: type[BaseModel]) -> Any:
+    """Concatenate record batches of *model* rows into a ``pyarrow.Table``.
+
+    A column that fell back to ``string`` in any batch is ``string`` in the table.
+    """
+    pa = _pyarrow()
+    schema = arrow_schema(model)
+    batches = list(batches)
+    text = {
+        field.name
+        for batch in batches
+        for field in batch.schema
+        if field.type != schema.field(field.name).type
+    }
+    if text:
+        schema = pa.schema(
+            [pa.field(field.name, pa.string()) if field.name in text else field for field in schema]
+        )
+        batches = [_with_text_columns(pa, batch, text) for batch in batches]
+    return pa.Table.from_batches(batches, schema=schema)
+
+
+def polars_frame(batches: Iterable[Any], model: type[BaseModel]) -> Any:
+    """Concatenate record batches of *model* rows into a ``polars.DataFrame``."""
+    pl = _polars()
+    return pl.from_arrow(arrow_table(batches, model))
+
+
+def pandas_frame(batches: Iterable[Any], model: type[BaseModel]) -> Any:
+    """Concatenate record batches of *model* rows into a ``pandas.DataFrame``."""
+    _pandas()
+    return arrow_table(batches, model).to_pandas()
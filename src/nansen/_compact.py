@@ -0,0 +1,167 @@
+from __future__ import annotations
+
+import functools
+import types
+from collections.abc import Mapping
+from typing import Annotated, Any, ClassVar, TypeVar, Union, get_args, get_origin
+
+from pydantic import AfterValidator
+from pydantic_core import PydanticUndefined
+
+from nansen._models import BaseModel
+
+M = TypeVar("M", bound=BaseModel)
+
+
+class CompactRecord:
+    """Slotted, memory-compact stand-in for a response model.
+
+    Records have the same attribute names as their model but no per-instance
+    ``__dict__``, fields-set record or separate extras mapping, so large
+    result sets take a fraction of the memory. Nested models become nested
+    records. Fields the API adds beyond the model are kept in ``_extra``.
+    Values are stored as decoded, without validation; :meth:`to_model`
+    validates a record into its model when needed.
+
+    Create record types with :func:`compact_type`, or fetch them directly with
+    ``result_mode="compact"``.
+    """
+
+    __slots__ = ("_extra",)
+
+    _model: ClassVar[type[BaseModel]]
+    _fields: ClassVar[tuple[str, ...]]
+    _field_set: ClassVar[frozenset[str]]
+    _defaults: ClassVar[tuple[Any, ...]]
+    _nested: ClassVar[dict[str, tuple[type[CompactRecord], bool]]]
+
+    _extra: dict[str, Any] | None
+
+    def __init__(self, **values: Any) -> None:
+        for name, default in zip(self._fields, self._defaults, strict=True):
+            setattr(self, name, values.pop(name, default))
+        self._extra = values or None
+
+    @classmethod
+    def from_dict(cls, data: Mapping[str, Any]) -> CompactRecord:
+        """Build a record from a decoded JSON object."""
+        record = cls.__new__(cls)
+        for name, default in zip(cls._fields, cls._defaults, strict=True):
+            setattr(record, name, data.get(name, default))
+        for name, (nested, is_list) in cls._nested.items():
+            value = getattr(record, name)
+            if value is None:
+                continue
+            if is_list:
+                setattr(record, name, [nested.from_dict(item) for item in value])
+            else:
+                setattr(record, name, nested.from_dict(value))
+        extra = {key: value for key, value in data.items() if key not in cls._field_set}
+        record._extra = extra or None
+        return record
+
+    @classmethod
+    def from_model(cls, instance: BaseModel) -> CompactRecord:
+        """Build a record from a model instance."""
+        record = cls.__new__(cls)
+        for name in cls._fields:
+            setattr(record, name, getattr(instance, name))
+        for name, (nested, is_list) in cls._nested.items():
+            value = getattr(record, name)
+            if value is None:
+                continue
+            if is_list:
+                setattr(record, name, [nested.from_model(item) for item in value])
+            else:
+                setattr(record, name, nested.from_model(value))
+        record._extra = dict(instance.model_extra) if instance.model_extra else None
+        return record
+
+    def to_dict(self) -> dict[str, Any]:
+        """Return the record as a JSON-style dict, nested records included."""
+        data = {name: getattr(self, name) for name in self._fields}
+        for name, (_, is_list) in self._nested.items():
+            value = data[name]
+            if value is None:
+                continue
+            data[name] = [item.to_dict() for item in value] if is_list else value.to_dict()
+        if self._extra:
+            data.update(self._extra)
+        return data
+
+    def to_model(self) -> BaseModel:
+        """Validate the record into its pydantic model."""
+        return self._model.model_validate(self.to_dict())
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, CompactRecord) or type(other) is not type(self):
+            return NotImplemented
+        return self.to_dict() == other.to_dict()
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __repr__(self) -> str:
+        values = ", ".join(f"{name}={getattr(self, name)!r}" for name in self._fields)
+        return f"{type(self).__name__}({values})"
+
+    def __reduce__(self) -> tuple[Any, ...]:
+        # Record types are created at runtime, so pickle by model instead.
+        return _rebuild, (self._model, self.to_dict())
+
+
+def _rebuild(model: type[BaseModel], data: Mapping[str, Any]) -> CompactRecord:
+    return compact_type(model).from_dict(data)
+
+
+def _nested_model(annotation: Any) -> tuple[type[BaseModel], bool] | None:
+    """Return ``(model, is_list)`` if *annotation* holds a model or a list of models."""
+    if get_origin(annotation) in (Union, types.UnionType):
+        options = [arg for arg in get_args(annotation) if arg is not type(None)]
+        if len(options) != 1:
+            return None
+        annotation = options[0]
+    is_list = get_origin(annotation) is list
+    if is_list:
+        (annotation,) = get_args(annotation)
+    if isinstance(annotation, type) and issubclass(annotation, BaseModel):
+        return annotation, is_list
+    return None
+
+
+@functools.cache
+def compact_type(model: type[BaseModel]) -> type[CompactRecord]:
+    """Return the :class:`CompactRecord` type for *model*, creating it on first use.
+
+    Usage::
+
+        CompactTransfer = compact_type(TransferItem)
+        records = [CompactTransfer.from_model(item) for item in page]
+        records[0].transfer_value_usd
+    """
+    fields = tuple(model.model_fields)
+    defaults = tuple(
+        None if field.default is PydanticUndefined else field.default
+        for field in model.model_fields.values()
+    )
+    nested: dict[str, tuple[type[CompactRecord], bool]] = {}
+    for name, field in model.model_fields.items():
+        found = _nested_model(field.annotation)
+        if found is not None:
+            nested[name] = (compact_type(found[0]), found[1])
+    namespace = {
+        "__slots__": fields,
+        "__module__": model.__module__,
+        "__doc__": f"Compact record for :class:`{model.__name__}`.",
+        "_model": model,
+        "_fields": fields,
+        "_defaults": defaults,
+        "_nested": nested,
+        "_field_set": frozenset(fields),
+    }
+    return type(f"Compact{model.__name__}", (CompactRecord,), namespace)
+
+
+@functools.cache
+def compact_row_type(model: type[M]) -> Any:
+    """Return a type that decodes a row into the compact record for *model*."""
+    return Annotated[Any, AfterValidator(compact_type(model).from_dict)]
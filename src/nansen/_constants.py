@@ -2,6 +2,28 @@ DEFAULT_BASE_URL = "https://api.nansen.ai/api/v1"
 POINTS_BASE_URL = "https://app.nansen.ai"
 DEFAULT_TIMEOUT = 60.0
 DEFAULT_MAX_RETRIES = 2
+DEFAULT_MAX_CONNECTIONS = 100
+DEFAULT_MAX_KEEPALIVE_CONNECTIONS = 20
+DEFAULT_KEEPALIVE_EXPIRY = 5.0
 INITIAL_RETRY_DELAY = 0.5
 MAX_RETRY_DELAY = 8.0
+DEFAULT_FAN_OUT_MAX_WAVE = 16
+DEFAULT_MAX_PER_PAGE = 1000
+MAX_PAGE_SIZE_SHRINKS = 5
+DEFAULT_SHARD_CONCURRENCY = 4
+DEFAULT_FAN_OUT_CONCURRENCY = 8
+TOKEN_INFO_CACHE_SIZE = 10_000
+TOKEN_INFO_CACHE_TTL = 300.0
+DEFAULT_CACHE_MAXSIZE = 1024
+DEFAULT_CACHE_TTL = 60.0
+# Slow-moving endpoints that stay fresh for longer by default (seconds).
+DEFAULT_CACHE_TTLS = {
+    "/profiler/address/labels": 3600.0,
+    "/search/entity-name": 3600.0,
+    "/tgm/token-information": 300.0,
+}
+DEFAULT_DISK_CACHE_MAX_BYTES = 256 * 1024 * 1024
+RATE_LIMIT_PER_SECOND = 20
+RATE_LIMIT_PER_MINUTE = 300
+RATE_LIMIT_LOW_WATERMARK = 0.2
 API_KEY_ENV_VAR = "NANSEN_API_KEY"
@@ -0,0 +1,222 @@
+from __future__ import annotations
+
+import threading
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+
+from nansen._exceptions import CreditBudgetExceededError
+
+
+@dataclass(frozen=True)
+class CreditUsage:
+    """Requests made and credits consumed within one bucket of the ledger."""
+
+    requests: int = 0
+    credits: int = 0
+
+    def _add(self, credits: int) -> CreditUsage:
+        return CreditUsage(requests=self.requests + 1, credits=self.credits + credits)
+
+
+def _resource_for(path: str) -> str:
+    """Return the resource group for an endpoint path (``/tgm/holders`` -> ``tgm``)."""
+    return path.strip("/").split("/", 1)[0]
+
+
+class _CreditTally:
+    """Thread-safe credit totals broken down by endpoint path and resource."""
+
+    name: str
+    budget: int | None
+
+    def __init__(self, name: str, budget: int | None) -> None:
+        if budget is not None and budget < 0:
+            raise ValueError("Credit budget must be non-negative.")
+        self.name = name
+        self.budget = budget
+        self._lock = threading.Lock()
+        self._total = CreditUsage()
+        self._reserved = 0
+        self._by_path: dict[str, CreditUsage] = {}
+        self._by_resource: dict[str, CreditUsage] = {}
+
+    def _add(self, path: str, credits: int) -> None:
+        resource = _resource_for(path)
+        with self._lock:
+            self._total = self._total._add(credits)
+            self._by_path[path] = self._by_path.get(path, CreditUsage())._add(credits)
+            self._by_resource[resource] = self._by_resource.get(resource, CreditUsage())._add(
+                credits
+            )
+
+    def _check(self, estimate: int) -> None:
+        if self.budget is None:
+            return
+        spent = self.spent
+        committed = spent + self._reserved
+        if committed >= self.budget or committed + estimate > self.budget:
+            raise CreditBudgetExceededError(
+                scope=self.name, budget=self.budget, spent=spent, estimate=estimate
+            )
+
+    @property
+    def total(self) -> CreditUsage:
+        return self._total
+
+    @property
+    def spent(self) -> int:
+        """Credits consumed so far."""
+        return self._total.credits
+
+    @property
+    def remaining_budget(self) -> int | None:
+        """Credits left before the budget is reached, or ``None`` if unbounded."""
+        if self.budget is None:
+            return None
+        return max(0, self.budget - self.spent)
+
+    @property
+    def by_path(self) -> dict[str, CreditUsage]:
+        """Usage per endpoint path (e.g. ``"/tgm/transfers"``)."""
+        with self._lock:
+            return dict(self._by_path)
+
+    @property
+    def by_resource(self) -> dict[str, CreditUsage]:
+        """Usage per resource group (e.g. ``"tgm"``, ``"smart-money"``)."""
+        with self._lock:
+            return dict(self._by_resource)
+
+
+class CreditJob(_CreditTally):
+    """Credits consumed inside a :meth:`CreditLedger.job` block."""
+
+    def __repr__(self) -> str:
+        return f"CreditJob(name={self.name!r}, spent={self.spent}, budget={self.budget})"
+
+
+_ACTIVE_JOBS: ContextVar[tuple[CreditJob, ...]] = ContextVar("nansen_credit_jobs", default=())
+
+
+class CreditReservation:
+    """Credits held back by :meth:`CreditLedger.check` for one in-flight request.
+
+    The hold is settled by :meth:`CreditLedger.record` once the response
+    reports its real cost, or given back with :meth:`release` if the request
+    fails without a response.
+    """
+
+    def __init__(
+        self, ledger: CreditLedger, tallies: tuple[_CreditTally, ...], estimate: int
+    ) -> None:
+        self._ledger = ledger
+        self._tallies = tallies
+        self.estimate = estimate
+
+    def release(self) -> None:
+        """Return the held credits; a no-op once settled or released."""
+        with self._ledger._reserve_lock:
+            self._release()
+
+    def _release(self) -> None:
+        for tally in self._tallies:
+            tally._reserved -= self.estimate
+        self._tallies = ()
+
+
+class CreditLedger(_CreditTally):
+    """Aggregates the ``x-nansen-credits-*`` headers of every response.
+
+    Usage is tracked per endpoint path, per resource group and per job
+    scope. A budget, on the ledger itself or on a job, is enforced before
+    each request using the last observed cost of the same endpoint, so
+    pagination and fan-out stop with :class:`CreditBudgetExceededError`
+    instead of overrunning it. Requests in flight count against the budget
+    until their response arrives::
+
+        with client.credits.job("nightly-export", budget=5_000) as job:
+            for item in client.tgm.transfers(...):
+                ...
+        print(job.spent, job.by_path)
+
+    Args:
+        budget: Hard limit on credits for everything this client sends.
+    """
+
+    credits_remaining: int | None
+    """Account balance reported by the most recent response."""
+
+    def __init__(self, budget: int | None = None) -> None:
+        super().__init__("client", budget)
+        self._last_cost: dict[str, int] = {}
+        self._reserve_lock = threading.Lock()
+        self.credits_remaining = None
+
+    @contextmanager
+    def job(self, name: str, *, budget: int | None = None) -> Iterator[CreditJob]:
+        """Track (and optionally cap) the credits spent inside a ``with`` block.
+
+        Jobs follow ``contextvars`` scoping, so they cover asyncio tasks
+        started inside the block and may be nested.
+
+        Args:
+            name: Label for the job, used in error messages.
+            budget: Hard limit on credits spent inside the block.
+        """
+        job = CreditJob(name, budget)
+        token = _ACTIVE_JOBS.set((*_ACTIVE_JOBS.get(), job))
+        try:
+            yield job
+        finally:
+            _ACTIVE_JOBS.reset(token)
+
+    def check(self, path: str) -> CreditReservation:
+        """Reserve the estimated cost of a request to *path* against every budget.
+
+        The estimate is the last observed cost of *path*, or one credit for
+        an endpoint not seen yet, so concurrent first requests cannot all
+        slip under the budget.
+
+        Raises:
+            CreditBudgetExceededError: If the reservation would exceed an
+                active budget; nothing is reserved then.
+        """
+        estimate = self._last_cost.get(path, 1)
+        tallies = (self, *_ACTIVE_JOBS.get())
+        with self._reserve_lock:
+            for tally in tallies:
+                tally._check(estimate)
+            for tally in tallies:
+                tally._reserved += estimate
+        return CreditReservation(self, tallies, estimate)
+
+    def record(
+        self,
+        path: str,
+        *,
+        credits_used: int | None,
+        credits_remaining: int | None = None,
+        reservation: CreditReservation | None = None,
+    ) -> None:
+        """Record one response against the ledger and every active job.
+
+        Args:
+            path: Endpoint path the request was sent to.
+            credits_used: Cost reported by the response, if any.
+            credits_remaining: Account balance reported by the response.
+            reservation: The hold returned by :meth:`check` for this request,
+                which is settled by the recorded cost.
+        """
+        credits = credits_used or 0
+        if credits_used is not None:
+            self._last_cost[path] = credits_used
+        if credits_remaining is not None:
+            self.credits_remaining = credits_remaining
+        with self._reserve_lock:
+            if reservation is not None:
+                reservation._release()
+            self._add(path, credits)
+            for job in _ACTIVE_JOBS.get():
+                job._add(path, credits)
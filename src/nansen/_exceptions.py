@@ -106,6 +106,25 @@ class APITimeoutError(APIConnectionError):
         super().__init__(message=message)
 
 
+class CreditBudgetExceededError(NansenError):
+    """Raised before a request that would take a credit budget over its limit."""
+
+    scope: str
+    budget: int
+    spent: int
+    estimate: int
+
+    def __init__(self, *, scope: str, budget: int, spent: int, estimate: int) -> None:
+        self.scope = scope
+        self.budget = budget
+        self.spent = spent
+        self.estimate = estimate
+        super().__init__(
+            f"Credit budget for {scope} would be exceeded: {spent} of {budget} credits spent, "
+            f"next request estimated at {estimate}."
+        )
+
+
 _STATUS_CODE_TO_EXCEPTION: dict[int, type[APIError]] = {
     400: BadRequestError,
     401: AuthenticationError,
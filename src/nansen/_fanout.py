@@ -0,0 +1,255 @@
+from __future__ import annotations
+
+import itertools
+from collections.abc import AsyncGenerator, AsyncIterator, Awaitable, Callable, Iterable, Iterator
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
+from typing import Any, Generic, TypeVar
+
+import anyio
+from anyio.abc import TaskGroup
+from anyio.streams.memory import MemoryObjectReceiveStream, MemoryObjectSendStream
+
+from nansen._pagination import AsyncPage, SyncPage
+from nansen._response import APIResponse
+from nansen._utils._concurrency import TaskSpawner, interrupted_error, submit_in_context
+
+K = TypeVar("K")
+R = TypeVar("R")
+
+
+@dataclass(frozen=True)
+class FanOutResult(Generic[K, R]):
+    """Outcome of running one call per key (e.g. per chain) concurrently.
+
+    A failing key does not abort the others: its exception is recorded in
+    :attr:`errors` and every successful call is in :attr:`results`, both in
+    the order the keys were given.
+    """
+
+    results: dict[K, R] = field(default_factory=dict)
+    errors: dict[K, Exception] = field(default_factory=dict)
+
+    @property
+    def ok(self) -> bool:
+        """``True`` when every call succeeded."""
+        return not self.errors
+
+    def raise_for_errors(self) -> None:
+        """Re-raise the first recorded error, if any."""
+        for error in self.errors.values():
+            raise error
+
+    def iter_items(self) -> Iterator[tuple[K, Any]]:
+        """Merged stream of ``(key, item)`` pairs across all successful results.
+
+        Pages contribute the items already fetched (``page.data``), and
+        responses their ``data`` (each element, if it is a list). No further
+        requests are made; paginate an individual result for more.
+        """
+        for key, result in self.results.items():
+            if isinstance(result, (SyncPage, AsyncPage)):
+                data: Any = result.data
+            elif isinstance(result, APIResponse):
+                data = result.data
+            else:
+                data = result
+            if isinstance(data, list):
+                for item in data:
+                    yield key, item
+            else:
+                yield key, data
+
+
+class FanOutStream(Generic[K, R]):
+    """Runs ``call(key)`` for each distinct key on a thread pool, streaming results.
+
+    Iterating yields ``(key, result)`` pairs in completion order, so work on
+    early results can start while later calls are still in flight. Failed
+    keys are not yielded; their exceptions are collected in :attr:`errors`.
+    Calls are submitted as earlier ones finish, so at most
+    ``max_concurrency`` are in flight at once. The stream can be iterated
+    once; :meth:`collect` drains whatever is left and returns the complete
+    outcome.
+    """
+
+    results: dict[K, R]
+    errors: dict[K, Exception]
+
+    def __init__(self, call: Callable[[K], R], keys: Iterable[K], *, max_concurrency: int) -> None:
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be at least 1.")
+        self._call = call
+        self._keys = list(dict.fromkeys(keys))
+        self._max_concurrency = max_concurrency
+        self._stream: Iterator[tuple[K, R]] | None = None
+        self.results = {}
+        self.errors = {}
+
+    def __iter__(self) -> Iterator[tuple[K, R]]:
+        if self._stream is None:
+            self._stream = self._run()
+        return self._stream
+
+    def _run(self) -> Iterator[tuple[K, R]]:
+        remaining = iter(self._keys)
+        pending: dict[Future[R], K] = {}
+        executor = ThreadPoolExecutor(
+            max_workers=self._max_concurrency, thread_name_prefix="nansen-fan-out"
+        )
+
+        def submit(count: int) -> None:
+            for key in itertools.islice(remaining, count):
+                pending[submit_in_context(executor, self._call, key)] = key
+
+        try:
+            submit(self._max_concurrency)
+            while pending:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                finished: list[tuple[K, R]] = []
+                for future in done:
+                    key = pending.pop(future)
+                    try:
+                        finished.append((key, future.result()))
+                    except Exception as exc:
+                        self.errors[key] = exc
+                submit(len(done))
+                for key, result in finished:
+                    self.results[key] = result
+                    yield key, result
+        finally:
+            for future in pending:
+                future.cancel()
+            executor.shutdown(wait=False)
+
+    def collect(self) -> FanOutResult[K, R]:
+        """Wait for every call and return results and errors in key order."""
+        for _ in self:
+            pass
+        return _ordered(self._keys, self.results, self.errors)
+
+
+class AsyncFanOutStream(Generic[K, R]):
+    """Awaits ``call(key)`` for each distinct key in a task group, streaming results.
+
+    The async counterpart of :class:`FanOutStream`: ``async for`` yields
+    ``(key, result)`` pairs in completion order and :meth:`collect` returns
+    the complete outcome. While streaming, calls run in *task_group* (the
+    client's, while it is open as ``async with``) and new ones start as
+    results are taken; without one, calls run in batches of
+    ``max_concurrency``.
+    """
+
+    results: dict[K, R]
+    errors: dict[K, Exception]
+
+    def __init__(
+        self,
+        call: Callable[[K], Awaitable[R]],
+        keys: Iterable[K],
+        *,
+        max_concurrency: int,
+        task_group: TaskGroup | None = None,
+    ) -> None:
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be at least 1.")
+        self._call = call
+        self._keys = list(dict.fromkeys(keys))
+        self._max_concurrency = max_concurrency
+        self._task_group = task_group
+        self._stream: AsyncGenerator[tuple[K, R], None] | None = None
+        self.results = {}
+        self.errors = {}
+
+    def __aiter__(self) -> AsyncIterator[tuple[K, R]]:
+        if self._stream is None:
+            self._stream = self._run()
+        return self._stream
+
+    async def _run(self) -> AsyncGenerator[tuple[K, R], None]:
+        remaining = iter(self._keys)
+        # Each call hands over exactly one outcome and at most max_concurrency are
+        # outstanding, so sends never block.
+        send: MemoryObjectSendStream[tuple[K, Any]]
+        receive: MemoryObjectReceiveStream[tuple[K, Any]]
+        send, receive = anyio.create_memory_object_stream(self._max_concurrency)
+
+        async def run(key: K) -> None:
+            try:
+                outcome: Any = await self._call(key)
+            except Exception as exc:
+                outcome = exc
+            except BaseException:
+                # Cancelled from outside (e.g. the client closed): don't leave the
+                # consumer waiting.
+                send.send_nowait((key, interrupted_error()))
+                raise
+            send.send_nowait((key, outcome))
+
+        # Calls don't run in a task group owned by this generator, so no cancel
+        # scope is held across ``yield`` and breaking out of the loop is safe.
+        spawner = TaskSpawner(self._task_group)
+
+        def start(count: int) -> int:
+            started = 0
+            for key in itertools.islice(remaining, count):
+                spawner.start_soon(run, key)
+                started += 1
+            return started
+
+        try:
+            pending = start(self._max_concurrency)
+            while pending:
+                try:
+                    key, outcome = receive.receive_nowait()
+                except anyio.WouldBlock:
+                    await spawner.flush()
+                    key, outcome = await receive.receive()
+                pending += start(1) - 1
+                if isinstance(outcome, Exception):
+                    self.errors[key] = outcome
+                    continue
+                self.results[key] = outcome
+                yield key, outcome
+        finally:
+            spawner.cancel()
+            receive.close()
+            send.close()
+
+    async def collect(self) -> FanOutResult[K, R]:
+        """Wait for every call and return results and errors in key order."""
+        if self._stream is None and self._task_group is None:
+            # Nothing is yielded to the caller here, so a local task group can
+            # keep every call slot busy.
+            async with anyio.create_task_group() as tg:
+                self._task_group = tg
+                try:
+                    async for _ in self:
+                        pass
+                finally:
+                    self._task_group = None
+        else:
+            async for _ in self:
+                pass
+        return _ordered(self._keys, self.results, self.errors)
+
+
+def _ordered(keys: list[K], results: dict[K, R], errors: dict[K, Exception]) -> FanOutResult[K, R]:
+    return FanOutResult(
+        results={key: results[key] for key in keys if key in results},
+        errors={key: errors[key] for key in keys if key in errors},
+    )
+
+
+def fan_out(
+    call: Callable[[K], R], keys: Iterable[K], *, max_concurrency: int
+) -> FanOutResult[K, R]:
+    """Run ``call(key)`` for each distinct key on a thread pool and wait for all."""
+    return FanOutStream(call, keys, max_concurrency=max_concurrency).collect()
+
+
+async def fan_out_async(
+    call: Callable[[K], Awaitable[R]], keys: Iterable[K], *, max_concurrency: int
+) -> FanOutResult[K, R]:
+    """Await ``call(key)`` for each distinct key, at most ``max_concurrency`` at once."""
+    return await AsyncFanOutStream(call, keys, max_concurrency=max_concurrency).collect()
@@ -1,7 +1,11 @@
 from __future__ import annotations
 
+import functools
+import threading
+from typing import Annotated, Any, Generic, TypeVar
+
+from pydantic import AfterValidator, ConfigDict
 from pydantic import BaseModel as _PydanticBaseModel
-from pydantic import ConfigDict
 
 
 class BaseModel(_PydanticBaseModel):
@@ -12,3 +16,63 @@ class BaseModel(_PydanticBaseModel):
     """
 
     model_config = ConfigDict(extra="allow")
+
+
+M = TypeVar("M", bound=BaseModel)
+
+
+class LazyModel(Generic[M]):
+    """A response row that is validated into its model on first attribute access.
+
+    Returned in ``result_mode="lazy"``. Attribute access (``row.token_symbol``)
+    validates the row once and reads from the resulting model; item access
+    (``row["token_symbol"]``) and :attr:`raw` read the decoded JSON without
+    validating it.
+    """
+
+    __slots__ = ("_lock", "_model", "_raw", "_value")
+
+    def __init__(self, model: type[M], raw: Any) -> None:
+        self._model = model
+        self._raw = raw
+        self._value: M | None = None
+        self._lock = threading.Lock()
+
+    @property
+    def raw(self) -> Any:
+        """The row as decoded from JSON, without validation."""
+        return self._raw
+
+    def resolve(self) -> M:
+        """Validate the row (once) and return the model instance."""
+        if self._value is None:
+            with self._lock:
+                if self._value is None:
+                    self._value = self._model.model_validate(self._raw)
+        return self._value
+
+    def __getattr__(self, name: str) -> Any:
+        # Private and dunder lookups (copy, pickle, unset slots) never validate.
+        if name.startswith("_"):
+            raise AttributeError(name)
+        return getattr(self.resolve(), name)
+
+    def __getitem__(self, key: str) -> Any:
+        return self._raw[key]
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, LazyModel):
+            return bool(self._model is other._model and self._raw == other._raw)
+        return NotImplemented
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __repr__(self) -> str:
+        state = "validated" if self._value is not None else "pending"
+        return f"LazyModel[{self._model.__name__}]({state}, {self._raw!r})"
+
+
+@functools.cache
+def lazy_row_type(model: type[M]) -> Any:
+    """Return a type that decodes a row and wraps it in :class:`LazyModel`."""
+    return Annotated[Any, AfterValidator(functools.partial(LazyModel, model))]
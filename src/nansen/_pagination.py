@@ -1,15 +1,60 @@
 from __future__ import annotations
 
-from collections.abc import AsyncIterator, Iterator
-from typing import TYPE_CHECKING, Generic, TypeVar
+import contextlib
+import contextvars
+import copy
+import os
+import queue
+import re
+import threading
+from collections.abc import AsyncGenerator, AsyncIterator, Iterable, Iterator
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import TYPE_CHECKING, Any, Generic, TypeVar
 
+import anyio
+import anyio.to_thread
+from anyio.streams.memory import MemoryObjectReceiveStream, MemoryObjectSendStream
+from typing_extensions import TypedDict
+
+from nansen._checkpoint import PageCursor
+from nansen._columnar import (
+    ColumnBatch,
+    arrow_table,
+    columns_from_rows,
+    pandas_frame,
+    polars_frame,
+    record_batch_from_rows,
+)
+from nansen._constants import DEFAULT_FAN_OUT_MAX_WAVE
+from nansen._exceptions import (
+    APIError,
+    APITimeoutError,
+    BadRequestError,
+    GatewayTimeoutError,
+    UnprocessableEntityError,
+)
 from nansen._models import BaseModel
+from nansen._utils._concurrency import TaskSpawner, interrupted_error, submit_in_context
 
 if TYPE_CHECKING:
     from nansen._base_client import AsyncAPIClient, SyncAPIClient
+    from nansen._response import ResponseMeta
 
 T = TypeVar("T", bound=BaseModel)
 
+_DONE = object()
+
+CheckpointPath = str | os.PathLike[str]
+
+
+def _write_checkpoint(file: CheckpointPath, cursor: PageCursor | None) -> None:
+    # The checkpoint always names the next page to fetch; a finished run removes it.
+    if cursor is None:
+        with contextlib.suppress(FileNotFoundError):
+            os.remove(file)
+    else:
+        cursor.save(file)
+
 
 class PaginationInfo(BaseModel):
     page: int = 1
@@ -17,16 +62,112 @@ class PaginationInfo(BaseModel):
     is_last_page: bool = True
 
 
+class PageEnvelope(TypedDict, Generic[T], total=False):
+    """Shape of a paginated response body.
+
+    Validating against this type pulls ``data`` and ``pagination`` out of
+    the response in a single pass; any other top-level keys are skipped.
+    """
+
+    data: list[T]
+    pagination: PaginationInfo
+
+
+# Errors after which a page request may be retried with a smaller ``per_page``.
+PAGE_SIZE_ERRORS = (
+    BadRequestError,
+    UnprocessableEntityError,
+    APITimeoutError,
+    GatewayTimeoutError,
+)
+
+_PAGE_SIZE_MESSAGE = re.compile(r"per[_ ]?page|page[_ ]?size", re.IGNORECASE)
+
+
+def _is_page_size_error(exc: Exception) -> bool:
+    """Whether *exc* points at the page being too large rather than a bad request.
+
+    Timeouts always qualify; a 400/422 only when its message or body names
+    the page size, so unrelated validation errors are raised straight away.
+    """
+    if isinstance(exc, (APITimeoutError, GatewayTimeoutError)):
+        return True
+    return isinstance(exc, APIError) and bool(
+        _PAGE_SIZE_MESSAGE.search(f"{exc.message} {exc.body}")
+    )
+
+
+def _pagination_params(body: dict[str, object]) -> dict[str, Any]:
+    pagination = body.get("pagination")
+    return {**pagination} if isinstance(pagination, dict) else {}
+
+
+def _page_offset(body: dict[str, object]) -> int:
+    """Number of items before the page requested by *body*."""
+    pagination = _pagination_params(body)
+    return (int(pagination.get("page", 1)) - 1) * int(pagination.get("per_page", 10))
+
+
+def _size_for_limit(body: dict[str, object], limit: int, max_per_page: int) -> dict[str, object]:
+    """Fill in ``per_page`` so that *limit* items take as few requests as possible."""
+    if limit < 1:
+        raise ValueError("limit must be at least 1.")
+    pagination = _pagination_params(body)
+    pagination.setdefault("page", 1)
+    pagination.setdefault("per_page", min(limit, max_per_page))
+    return {**body, "pagination": pagination}
+
+
+def _shrink_page_size(body: dict[str, object]) -> dict[str, object] | None:
+    """Return *body* with a smaller ``per_page`` covering the same offset, or ``None``.
+
+    The new size divides the current offset, so the page number still lands
+    exactly on the first item that has not been fetched yet.
+    """
+    pagination = _pagination_params(body)
+    per_page = int(pagination.get("per_page", 10))
+    offset = _page_offset(body)
+    size = per_page // 2
+    while size > 1 and offset % size:
+        size -= 1
+    if size < 1:
+        return None
+    pagination["per_page"] = size
+    pagination["page"] = offset // size + 1
+    return {**body, "pagination": pagination}
+
+
+def _trim_to_limit(
+    items: list[T], pagination: PaginationInfo, body: dict[str, object], limit: int
+) -> tuple[list[T], PaginationInfo]:
+    """Drop items past *limit* and mark the page holding the last one as final."""
+    remaining = limit - _page_offset(body)
+    if remaining > len(items) or (remaining == len(items) and pagination.is_last_page):
+        return items, pagination
+    return items[: max(remaining, 0)], pagination.model_copy(update={"is_last_page": True})
+
+
+def _empty_last_page(body: dict[str, object]) -> PaginationInfo:
+    pagination = _pagination_params(body)
+    return PaginationInfo(
+        page=int(pagination.get("page", 1)),
+        per_page=int(pagination.get("per_page", 10)),
+        is_last_page=True,
+    )
+
+
 class SyncPage(Generic[T]):
     """A single page of results with auto-pagination support."""
 
     data: list[T]
     pagination: PaginationInfo
+    meta: ResponseMeta | None
 
     _client: SyncAPIClient
     _path: str
     _body: dict[str, object]
     _model: type[T]
+    _limit: int | None
 
     def __init__(
         self,
@@ -37,36 +178,95 @@ class SyncPage(Generic[T]):
         path: str,
         body: dict[str, object],
         model: type[T],
+        meta: ResponseMeta | None = None,
+        limit: int | None = None,
     ) -> None:
         self.data = data
         self.pagination = pagination
+        self.meta = meta
         self._client = client
         self._path = path
         self._body = body
         self._model = model
+        self._limit = limit
 
     @property
     def has_next_page(self) -> bool:
         return not self.pagination.is_last_page
 
-    def next_page(self) -> SyncPage[T]:
-        """Fetch the next page of results."""
-        if not self.has_next_page:
-            raise StopIteration("No more pages")
+    def _page_body(self, page_number: int) -> dict[str, object]:
         body = {**self._body}
         pagination = body.get("pagination", {})
-        if not isinstance(pagination, dict):
-            pagination = {}
-        pagination["page"] = self.pagination.page + 1
+        pagination = {**pagination} if isinstance(pagination, dict) else {}
+        pagination["page"] = page_number
         body["pagination"] = pagination
+        return body
+
+    def _fetch_page(self, page_number: int) -> SyncPage[T]:
         return self._client._request_page(
             path=self._path,
-            body=body,
+            body=self._page_body(page_number),
             model=self._model,
+            limit=self._limit,
         )
 
-    def iter_pages(self) -> Iterator[SyncPage[T]]:
-        """Iterate over all pages starting from this one."""
+    def cursor(self) -> PageCursor:
+        """Return a serializable cursor that re-fetches this page."""
+        return PageCursor.for_page(
+            path=self._path,
+            body=self._page_body(self.pagination.page),
+            model=self._model,
+            limit=self._limit,
+        )
+
+    def next_cursor(self) -> PageCursor | None:
+        """Return a cursor for the page after this one, or ``None`` on the last page."""
+        if not self.has_next_page:
+            return None
+        return PageCursor.for_page(
+            path=self._path,
+            body=self._page_body(self.pagination.page + 1),
+            model=self._model,
+            limit=self._limit,
+        )
+
+    def next_page(self) -> SyncPage[T]:
+        """Fetch the next page of results."""
+        if not self.has_next_page:
+            raise StopIteration("No more pages")
+        return self._fetch_page(self.pagination.page + 1)
+
+    def iter_pages(
+        self,
+        *,
+        prefetch: int = 0,
+        checkpoint: CheckpointPath | None = None,
+        checkpoint_every: int = 1,
+    ) -> Iterator[SyncPage[T]]:
+        """Iterate over all pages starting from this one.
+
+        Args:
+            prefetch: Number of pages to read ahead on a background thread
+                while the caller processes the current one. ``0`` (the
+                default) fetches each page only when it is requested.
+            checkpoint: File to save a :class:`PageCursor` to as pages are
+                consumed. The cursor names the next unprocessed page, so
+                ``client.resume_page(PageCursor.load(path))`` continues an
+                interrupted run. The file is removed after the last page.
+            checkpoint_every: Save the checkpoint after every N pages.
+        """
+        if checkpoint_every < 1:
+            raise ValueError("checkpoint_every must be at least 1.")
+        pages = self._iter_pages_prefetch(prefetch) if prefetch > 0 else self._iter_pages_serial()
+        if checkpoint is None:
+            yield from pages
+            return
+        for count, page in enumerate(pages, start=1):
+            yield page
+            if not page.has_next_page or count % checkpoint_every == 0:
+                _write_checkpoint(checkpoint, page.next_cursor())
+
+    def _iter_pages_serial(self) -> Iterator[SyncPage[T]]:
         page = self
         while True:
             yield page
@@ -74,6 +274,191 @@ class SyncPage(Generic[T]):
                 break
             page = page.next_page()
 
+    def _iter_pages_prefetch(self, prefetch: int) -> Iterator[SyncPage[T]]:
+        if not self.has_next_page:
+            yield self
+            return
+
+        # Each slot is one page fetched ahead of the consumer (in flight or buffered).
+        slots = threading.Semaphore(prefetch)
+        buffer: queue.SimpleQueue[Any] = queue.SimpleQueue()
+        stop = threading.Event()
+
+        def produce() -> None:
+            page: SyncPage[T] = self
+            try:
+                while page.has_next_page:
+                    while not slots.acquire(timeout=0.1):
+                        if stop.is_set():
+                            return
+                    if stop.is_set():
+                        return
+                    page = page.next_page()
+                    buffer.put(page)
+            except Exception as exc:
+                buffer.put(exc)
+            else:
+                buffer.put(_DONE)
+
+        # Copy the context so credit jobs and other contextvars apply to the producer.
+        context = contextvars.copy_context()
+        worker = threading.Thread(
+            target=context.run, args=(produce,), name="nansen-prefetch", daemon=True
+        )
+        worker.start()
+        try:
+            yield self
+            while True:
+                item = buffer.get()
+                if item is _DONE:
+                    return
+                if isinstance(item, Exception):
+                    raise item
+                slots.release()
+                yield item
+        finally:
+            # A request already in flight finishes in the background; its page is dropped.
+            stop.set()
+
+    def iter_pages_fan_out(
+        self,
+        *,
+        initial_wave: int = 2,
+        max_wave: int = DEFAULT_FAN_OUT_MAX_WAVE,
+    ) -> Iterator[SyncPage[T]]:
+        """Iterate over all pages, requesting upcoming pages concurrently in waves.
+
+        The API only reports ``is_last_page``, so later pages are requested
+        speculatively: each wave asks for the next ``wave`` page numbers at
+        once, and the wave doubles (up to ``max_wave``) while every page
+        comes back full. Pages are yielded in order; iteration stops at the
+        first last page and any overshoot pages are discarded. Overshoot
+        requests still count against rate limits and credits.
+
+        Args:
+            initial_wave: Number of pages requested in the first wave.
+            max_wave: Upper bound on pages requested concurrently.
+        """
+        if initial_wave < 1 or max_wave < initial_wave:
+            raise ValueError("Expected 1 <= initial_wave <= max_wave.")
+        yield self
+        if not self.has_next_page:
+            return
+
+        per_page = self.pagination.per_page
+        next_number = self.pagination.page + 1
+        wave = initial_wave
+        executor = ThreadPoolExecutor(max_workers=max_wave, thread_name_prefix="nansen-fan-out")
+        futures: list[Future[SyncPage[T]]] = []
+        try:
+            while True:
+                futures = [
+                    submit_in_context(executor, self._fetch_page, number)
+                    for number in range(next_number, next_number + wave)
+                ]
+                all_full = True
+                for future in futures:
+                    page = future.result()
+                    yield page
+                    if not page.has_next_page:
+                        return
+                    all_full = all_full and len(page.data) >= per_page
+                next_number += wave
+                if all_full:
+                    wave = min(wave * 2, max_wave)
+        finally:
+            for future in futures:
+                future.cancel()
+            executor.shutdown(wait=False)
+
+    def stream_items(self) -> Iterator[T]:
+        """Iterate over all items across all pages in constant memory.
+
+        Unlike plain iteration, no page object is kept once its items have
+        been handed out: each page is fetched only after the previous one is
+        exhausted, and items are released as they are yielded. Page
+        metadata is discarded; use :meth:`iter_pages` if you need it.
+        """
+        items = list(self.data)
+        page_number = self.pagination.page
+        has_next = self.has_next_page
+        while True:
+            items.reverse()
+            while items:
+                yield items.pop()
+            if not has_next:
+                return
+            page = self._fetch_page(page_number + 1)
+            items, page_number, has_next = list(page.data), page.pagination.page, page.has_next_page
+            del page
+
+    def to_columns(self, *, categorical: Iterable[str] = ()) -> ColumnBatch:
+        """Return this page's rows as NumPy columns; see :class:`ColumnBatch`.
+
+        Args:
+            categorical: String fields to dictionary-encode as
+                :class:`Categorical` columns.
+        """
+        return columns_from_rows(self.data, self._model, categorical=categorical)
+
+    def iter_column_batches(
+        self, *, categorical: Iterable[str] = (), prefetch: int = 0
+    ) -> Iterator[ColumnBatch]:
+        """Iterate over all pages starting from this one as NumPy column batches.
+
+        Pages after this one are fetched in ``result_mode="raw"``, so columns
+        are filled straight from the decoded JSON without building a model
+        per row.
+
+        Args:
+            categorical: String fields to dictionary-encode as
+                :class:`Categorical` columns.
+            prefetch: Pages to read ahead; see :meth:`iter_pages`.
+        """
+        for page in self._as_raw().iter_pages(prefetch=prefetch):
+            yield columns_from_rows(page.data, self._model, categorical=categorical)
+
+    def iter_record_batches(self, *, prefetch: int = 0) -> Iterator[Any]:
+        """Iterate over all pages starting from this one as ``pyarrow.RecordBatch`` objects.
+
+        Batches share a schema derived from the item model (see
+        :func:`~nansen.arrow_schema`). Pages after this one are fetched in
+        ``result_mode="raw"``, so no model is built per row.
+
+        Args:
+            prefetch: Pages to read ahead; see :meth:`iter_pages`.
+        """
+        for page in self._as_raw().iter_pages(prefetch=prefetch):
+            yield record_batch_from_rows(page.data, self._model)
+
+    def _record_batches(self, all_pages: bool, prefetch: int) -> Iterator[Any]:
+        if all_pages:
+            return self.iter_record_batches(prefetch=prefetch)
+        return iter([record_batch_from_rows(self.data, self._model)])
+
+    def to_arrow(self, *, all_pages: bool = False, prefetch: int = 0) -> Any:
+        """Return the rows as a ``pyarrow.Table`` typed by the item model.
+
+        Args:
+            all_pages: Include every page from this one on, built one record
+                batch per page; otherwise only this page's rows.
+            prefetch: Pages to read ahead when ``all_pages`` is set.
+        """
+        return arrow_table(self._record_batches(all_pages, prefetch), self._model)
+
+    def to_polars(self, *, all_pages: bool = False, prefetch: int = 0) -> Any:
+        """Return the rows as a ``polars.DataFrame``; arguments as for :meth:`to_arrow`."""
+        return polars_frame(self._record_batches(all_pages, prefetch), self._model)
+
+    def to_pandas(self, *, all_pages: bool = False, prefetch: int = 0) -> Any:
+        """Return the rows as a ``pandas.DataFrame``; arguments as for :meth:`to_arrow`."""
+        return pandas_frame(self._record_batches(all_pages, prefetch), self._model)
+
+    def _as_raw(self) -> SyncPage[T]:
+        page = copy.copy(self)
+        page._client = self._client.with_options(result_mode="raw")
+        return page
+
     def __iter__(self) -> Iterator[T]:
         """Iterate over all items across all pages."""
         for page in self.iter_pages():
@@ -88,11 +473,13 @@ class AsyncPage(Generic[T]):
 
     data: list[T]
     pagination: PaginationInfo
+    meta: ResponseMeta | None
 
     _client: AsyncAPIClient
     _path: str
     _body: dict[str, object]
     _model: type[T]
+    _limit: int | None
 
     def __init__(
         self,
@@ -103,36 +490,106 @@ class AsyncPage(Generic[T]):
         path: str,
         body: dict[str, object],
         model: type[T],
+        meta: ResponseMeta | None = None,
+        limit: int | None = None,
     ) -> None:
         self.data = data
         self.pagination = pagination
+        self.meta = meta
         self._client = client
         self._path = path
         self._body = body
         self._model = model
+        self._limit = limit
 
     @property
     def has_next_page(self) -> bool:
         return not self.pagination.is_last_page
 
-    async def next_page(self) -> AsyncPage[T]:
-        """Fetch the next page of results."""
-        if not self.has_next_page:
-            raise StopAsyncIteration("No more pages")
+    def _page_body(self, page_number: int) -> dict[str, object]:
         body = {**self._body}
         pagination = body.get("pagination", {})
-        if not isinstance(pagination, dict):
-            pagination = {}
-        pagination["page"] = self.pagination.page + 1
+        pagination = {**pagination} if isinstance(pagination, dict) else {}
+        pagination["page"] = page_number
         body["pagination"] = pagination
+        return body
+
+    async def _fetch_page(self, page_number: int) -> AsyncPage[T]:
         return await self._client._request_page(
             path=self._path,
-            body=body,
+            body=self._page_body(page_number),
+            model=self._model,
+            limit=self._limit,
+        )
+
+    def cursor(self) -> PageCursor:
+        """Return a serializable cursor that re-fetches this page."""
+        return PageCursor.for_page(
+            path=self._path,
+            body=self._page_body(self.pagination.page),
             model=self._model,
+            limit=self._limit,
         )
 
-    async def iter_pages(self) -> AsyncIterator[AsyncPage[T]]:
-        """Iterate over all pages starting from this one."""
+    def next_cursor(self) -> PageCursor | None:
+        """Return a cursor for the page after this one, or ``None`` on the last page."""
+        if not self.has_next_page:
+            return None
+        return PageCursor.for_page(
+            path=self._path,
+            body=self._page_body(self.pagination.page + 1),
+            model=self._model,
+            limit=self._limit,
+        )
+
+    async def next_page(self) -> AsyncPage[T]:
+        """Fetch the next page of results."""
+        if not self.has_next_page:
+            raise StopAsyncIteration("No more pages")
+        return await self._fetch_page(self.pagination.page + 1)
+
+    async def iter_pages(
+        self,
+        *,
+        prefetch: int = 0,
+        checkpoint: CheckpointPath | None = None,
+        checkpoint_every: int = 1,
+    ) -> AsyncIterator[AsyncPage[T]]:
+        """Iterate over all pages starting from this one.
+
+        Args:
+            prefetch: Number of pages to read ahead in a background task
+                while the caller processes the current one. ``0`` (the
+                default) fetches each page only when it is requested. The
+                task runs in the client's task group, so read-ahead needs
+                the client open as ``async with``; otherwise pages are
+                fetched on demand.
+            checkpoint: File to save a :class:`PageCursor` to as pages are
+                consumed. The cursor names the next unprocessed page, so
+                ``await client.resume_page(PageCursor.load(path))``
+                continues an interrupted run. The file is removed after the
+                last page. Writes run in a worker thread, off the event loop.
+            checkpoint_every: Save the checkpoint after every N pages.
+        """
+        if checkpoint_every < 1:
+            raise ValueError("checkpoint_every must be at least 1.")
+        if prefetch > 0 and self._client._background is not None:
+            source = self._iter_pages_prefetch(prefetch)
+        else:
+            source = self._iter_pages_serial()
+        async with contextlib.aclosing(source) as pages:
+            count = 0
+            async for page in pages:
+                yield page
+                count += 1
+                if checkpoint is not None and (
+                    not page.has_next_page or count % checkpoint_every == 0
+                ):
+                    await anyio.to_thread.run_sync(
+                        _write_checkpoint, checkpoint, page.next_cursor()
+                    )
+
+    async def _iter_pages_serial(self) -> AsyncGenerator[AsyncPage[T], None]:
         page = self
         while True:
             yield page
@@ -140,6 +597,203 @@ class AsyncPage(Generic[T]):
                 break
             page = await page.next_page()
 
+    async def _iter_pages_prefetch(self, prefetch: int) -> AsyncGenerator[AsyncPage[T], None]:
+        if not self.has_next_page:
+            yield self
+            return
+
+        # The producer blocks once the buffer is full while holding one more page,
+        # so ``prefetch`` pages are fetched ahead of the consumer in all.
+        send: MemoryObjectSendStream[Any]
+        receive: MemoryObjectReceiveStream[Any]
+        send, receive = anyio.create_memory_object_stream(prefetch - 1)
+
+        async def produce() -> None:
+            page: AsyncPage[T] = self
+            async with send:
+                try:
+                    while page.has_next_page:
+                        page = await page.next_page()
+                        await send.send(page)
+                except Exception as exc:
+                    await send.send(exc)
+
+        # The producer runs in the client's task group, so no cancel scope is held
+        # across ``yield`` and breaking out of the loop is safe.
+        spawner = TaskSpawner(self._client._background)
+        spawner.start_soon(produce)
+        try:
+            yield self
+            last = self
+            async for item in receive:
+                if isinstance(item, Exception):
+                    raise item
+                yield item
+                last = item
+            if last.has_next_page:
+                raise interrupted_error()
+        finally:
+            # A request in flight is cancelled; nothing more is fetched.
+            spawner.cancel()
+            receive.close()
+
+    async def iter_pages_fan_out(
+        self,
+        *,
+        initial_wave: int = 2,
+        max_wave: int = DEFAULT_FAN_OUT_MAX_WAVE,
+    ) -> AsyncIterator[AsyncPage[T]]:
+        """Iterate over all pages, requesting upcoming pages concurrently in waves.
+
+        The API only reports ``is_last_page``, so later pages are requested
+        speculatively: each wave asks for the next ``wave`` page numbers at
+        once, and the wave doubles (up to ``max_wave``) while every page
+        comes back full. Pages are yielded in order; iteration stops at the
+        first last page and any overshoot requests are cancelled. Overshoot
+        requests still count against rate limits and credits.
+
+        While the client is open as ``async with``, requests run in its task
+        group and pages are yielded as they arrive; otherwise each wave
+        completes before its pages are yielded.
+
+        Args:
+            initial_wave: Number of pages requested in the first wave.
+            max_wave: Upper bound on pages requested concurrently.
+        """
+        if initial_wave < 1 or max_wave < initial_wave:
+            raise ValueError("Expected 1 <= initial_wave <= max_wave.")
+        yield self
+        if not self.has_next_page:
+            return
+
+        per_page = self.pagination.per_page
+        next_number = self.pagination.page + 1
+        wave = initial_wave
+        results: dict[int, AsyncPage[T] | Exception] = {}
+        ready: dict[int, anyio.Event] = {}
+
+        async def fetch(number: int, done: anyio.Event) -> None:
+            try:
+                results[number] = await self._fetch_page(number)
+            except Exception as exc:
+                results[number] = exc
+            finally:
+                if number not in results:
+                    results[number] = interrupted_error()
+                done.set()
+
+        spawner = TaskSpawner(self._client._background)
+        try:
+            while True:
+                numbers = range(next_number, next_number + wave)
+                for number in numbers:
+                    ready[number] = anyio.Event()
+                    spawner.start_soon(fetch, number, ready[number])
+                all_full = True
+                for number in numbers:
+                    await spawner.wait(ready.pop(number))
+                    page = results.pop(number)
+                    if isinstance(page, Exception):
+                        raise page
+                    yield page
+                    if not page.has_next_page:
+                        return
+                    all_full = all_full and len(page.data) >= per_page
+                next_number += wave
+                if all_full:
+                    wave = min(wave * 2, max_wave)
+        finally:
+            # Overshoot requests still in flight are cancelled.
+            spawner.cancel()
+
+    async def stream_items(self) -> AsyncIterator[T]:
+        """Iterate over all items across all pages in constant memory.
+
+        Unlike plain iteration, no page object is kept once its items have
+        been handed out: each page is fetched only after the previous one is
+        exhausted, and items are released as they are yielded. Page
+        metadata is discarded; use :meth:`iter_pages` if you need it.
+        """
+        items = list(self.data)
+        page_number = self.pagination.page
+        has_next = self.has_next_page
+        while True:
+            items.reverse()
+            while items:
+                yield items.pop()
+            if not has_next:
+                return
+            page = await self._fetch_page(page_number + 1)
+            items, page_number, has_next = list(page.data), page.pagination.page, page.has_next_page
+            del page
+
+    def to_columns(self, *, categorical: Iterable[str] = ()) -> ColumnBatch:
+        """Return this page's rows as NumPy columns; see :class:`ColumnBatch`.
+
+        Args:
+            categorical: String fields to dictionary-encode as
+                :class:`Categorical` columns.
+        """
+        return columns_from_rows(self.data, self._model, categorical=categorical)
+
+    async def iter_column_batches(
+        self, *, categorical: Iterable[str] = (), prefetch: int = 0
+    ) -> AsyncGenerator[ColumnBatch, None]:
+        """Iterate over all pages starting from this one as NumPy column batches.
+
+        Pages after this one are fetched in ``result_mode="raw"``, so columns
+        are filled straight from the decoded JSON without building a model
+        per row.
+
+        Args:
+            categorical: String fields to dictionary-encode as
+                :class:`Categorical` columns.
+            prefetch: Pages to read ahead; see :meth:`iter_pages`.
+        """
+        async for page in self._as_raw().iter_pages(prefetch=prefetch):
+            yield columns_from_rows(page.data, self._model, categorical=categorical)
+
+    async def iter_record_batches(self, *, prefetch: int = 0) -> AsyncGenerator[Any, None]:
+        """Iterate over all pages starting from this one as ``pyarrow.RecordBatch`` objects.
+
+        Batches share a schema derived from the item model (see
+        :func:`~nansen.arrow_schema`). Pages after this one are fetched in
+        ``result_mode="raw"``, so no model is built per row.
+
+        Args:
+            prefetch: Pages to read ahead; see :meth:`iter_pages`.
+        """
+        async for page in self._as_raw().iter_pages(prefetch=prefetch):
+            yield record_batch_from_rows(page.data, self._model)
+
+    async def _record_batches(self, all_pages: bool, prefetch: int) -> list[Any]:
+        if all_pages:
+            return [batch async for batch in self.iter_record_batches(prefetch=prefetch)]
+        return [record_batch_from_rows(self.data, self._model)]
+
+    async def to_arrow(self, *, all_pages: bool = False, prefetch: int = 0) -> Any:
+        """Return the rows as a ``pyarrow.Table`` typed by the item model.
+
+        Args:
+            all_pages: Include every page from this one on, built one record
+                batch per page; otherwise only this page's rows.
+            prefetch: Pages to read ahead when ``all_pages`` is set.
+        """
+        return arrow_table(await self._record_batches(all_pages, prefetch), self._model)
+
+    async def to_polars(self, *, all_pages: bool = False, prefetch: int = 0) -> Any:
+        """Return the rows as a ``polars.DataFrame``; arguments as for :meth:`to_arrow`."""
+        return polars_frame(await self._record_batches(all_pages, prefetch), self._model)
+
+    async def to_pandas(self, *, all_pages: bool = False, prefetch: int = 0) -> Any:
+        """Return the rows as a ``pandas.DataFrame``; arguments as for :meth:`to_arrow`."""
+        return pandas_frame(await self._record_batches(all_pages, prefetch), self._model)
+
+    def _as_raw(self) -> AsyncPage[T]:
+        page = copy.copy(self)
+        page._client = self._client.with_options(result_mode="raw")
+        return page
+
     async def __aiter__(self) -> AsyncIterator[T]:
         """Iterate over all items across all pages."""
         async for page in self.iter_pages():
@@ -0,0 +1,189 @@
+from __future__ import annotations
+
+import threading
+import time
+from collections.abc import Callable
+from dataclasses import dataclass
+
+import anyio
+
+from nansen._constants import (
+    RATE_LIMIT_LOW_WATERMARK,
+    RATE_LIMIT_PER_MINUTE,
+    RATE_LIMIT_PER_SECOND,
+)
+from nansen._response import RateLimitInfo
+
+
+class TokenBucket:
+    """A token bucket refilled continuously at ``rate`` tokens per second.
+
+    Not thread-safe on its own; :class:`RateLimiter` serialises access.
+    """
+
+    rate: float
+    capacity: float
+
+    def __init__(self, *, rate: float, capacity: float, now: float) -> None:
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = capacity
+        self._updated = now
+
+    def _refill(self, now: float) -> None:
+        elapsed = max(0.0, now - self._updated)
+        self._tokens = min(self.capacity, self._tokens + elapsed * self.rate)
+        self._updated = now
+
+    def available(self, now: float) -> float:
+        """Return the number of tokens available at *now* (negative while in debt)."""
+        self._refill(now)
+        return self._tokens
+
+    def reserve(self, now: float) -> float:
+        """Take one token and return how long to wait before it is valid.
+
+        Tokens may be borrowed ahead of time, so concurrent callers each get
+        a distinct slot in the queue rather than racing for the same token.
+        """
+        self._refill(now)
+        self._tokens -= 1
+        if self._tokens >= 0:
+            return 0.0
+        return -self._tokens / self.rate
+
+
+@dataclass(frozen=True)
+class RateLimiterStats:
+    """Point-in-time snapshot of a :class:`RateLimiter` for monitoring."""
+
+    available: float
+    """Requests the local token buckets would allow right now."""
+    wait_time: float
+    """Seconds until the next request may be sent."""
+    throttle_events: int
+    """Requests delayed because the server-reported budget was low or exhausted."""
+    throttle_wait: float
+    """Total seconds requests have been delayed by the server-reported budget."""
+    last_rate_limit: RateLimitInfo | None
+    """Rate-limit headers from the most recent response."""
+
+
+class RateLimiter:
+    """Client-side limiter enforcing per-second and per-minute request budgets.
+
+    Every request acquires one slot before it is sent, so bursts queue
+    locally instead of triggering 429 responses. The rate-limit headers of
+    every response are fed back in through :meth:`observe`: as the
+    server-reported remaining budget approaches zero, requests are spaced
+    out over the time left until reset, and once it hits zero they wait
+    until the reset itself. The limiter is safe to use
+    from multiple threads and asyncio tasks at once, and a single instance
+    can be passed to several clients to share one budget between them::
+
+        limiter = RateLimiter()
+        a = Nansen(rate_limiter=limiter)
+        b = Nansen(rate_limiter=limiter)
+
+    Args:
+        per_second: Requests allowed per second (burst size).
+        per_minute: Requests allowed per minute.
+        clock: Monotonic time source, overridable for testing.
+    """
+
+    def __init__(
+        self,
+        *,
+        per_second: float = RATE_LIMIT_PER_SECOND,
+        per_minute: float = RATE_LIMIT_PER_MINUTE,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        if per_second <= 0 or per_minute <= 0:
+            raise ValueError("Rate limits must be positive.")
+        self._clock = clock
+        self._lock = threading.Lock()
+        now = clock()
+        self._buckets = (
+            TokenBucket(rate=per_second, capacity=per_second, now=now),
+            TokenBucket(rate=per_minute / 60.0, capacity=per_minute, now=now),
+        )
+        # Governor state derived from server headers.
+        self._not_before = now
+        self._interval = 0.0
+        self._next_slot = now
+        self._throttle_events = 0
+        self._throttle_wait = 0.0
+        self._last_info: RateLimitInfo | None = None
+
+    def reserve(self) -> float:
+        """Reserve a request slot and return the seconds to wait before sending."""
+        with self._lock:
+            now = self._clock()
+            start = max(now, self._not_before, self._next_slot)
+            if self._interval > 0:
+                self._next_slot = start + self._interval
+            governed = start - now
+            if governed > 0:
+                self._throttle_events += 1
+                self._throttle_wait += governed
+            return max(governed, *(bucket.reserve(now) for bucket in self._buckets))
+
+    def observe(self, info: RateLimitInfo) -> None:
+        """Update the governor from the rate-limit headers of a response."""
+        tiers = (
+            (info.remaining_second, info.limit_second, min(info.reset or 1.0, 1.0)),
+            (info.remaining_minute, info.limit_minute, info.reset or 60.0),
+            (info.remaining, info.limit, info.reset or 60.0),
+        )
+        with self._lock:
+            now = self._clock()
+            self._last_info = info
+            interval = 0.0
+            for remaining, limit, reset in tiers:
+                if remaining is None:
+                    continue
+                if remaining <= 0:
+                    self._not_before = max(self._not_before, now + reset)
+                elif limit and remaining <= limit * RATE_LIMIT_LOW_WATERMARK:
+                    interval = max(interval, reset / remaining)
+            self._interval = interval
+            if interval == 0.0:
+                self._next_slot = now
+
+    def acquire(self) -> None:
+        """Block the calling thread until a request may be sent."""
+        delay = self.reserve()
+        if delay > 0:
+            time.sleep(delay)
+
+    async def acquire_async(self) -> None:
+        """Wait, without blocking the event loop, until a request may be sent."""
+        delay = self.reserve()
+        if delay > 0:
+            await anyio.sleep(delay)
+
+    @property
+    def available(self) -> float:
+        """Requests that could be sent right now without waiting."""
+        with self._lock:
+            now = self._clock()
+            return max(0.0, min(bucket.available(now) for bucket in self._buckets))
+
+    @property
+    def stats(self) -> RateLimiterStats:
+        """Current budget, wait time and throttle counters."""
+        with self._lock:
+            now = self._clock()
+            tokens = [bucket.available(now) for bucket in self._buckets]
+            bucket_wait = max(
+                max(0.0, 1.0 - available) / bucket.rate
+                for bucket, available in zip(self._buckets, tokens, strict=True)
+            )
+            governed = max(self._not_before, self._next_slot) - now
+            return RateLimiterStats(
+                available=max(0.0, min(tokens)),
+                wait_time=max(0.0, governed, bucket_wait),
+                throttle_events=self._throttle_events,
+                throttle_wait=self._throttle_wait,
+                last_rate_limit=self._last_info,
+            )
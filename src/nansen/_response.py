@@ -55,6 +55,48 @@ class RateLimitInfo:
         )
 
 
+CACHE_AGE_EXTENSION = "nansen.cache_age"
+CACHE_STALE_EXTENSION = "nansen.cache_stale"
+
+
+@dataclass(frozen=True)
+class ResponseMeta:
+    """Lightweight response metadata that does not retain the response body."""
+
+    status_code: int
+    headers: httpx.Headers
+    url: str
+    elapsed: float
+    """Seconds between sending the request and receiving the response."""
+    compressed_bytes: int
+    decompressed_bytes: int
+    cache_age: float | None = None
+    """Seconds since the response was fetched, when served from a cache."""
+    stale: bool = False
+    """Served from cache past its TTL while a background refresh runs."""
+
+    @classmethod
+    def from_response(cls, response: httpx.Response) -> ResponseMeta:
+        try:
+            elapsed = response.elapsed.total_seconds()
+        except RuntimeError:
+            elapsed = 0.0
+        return cls(
+            status_code=response.status_code,
+            headers=response.headers,
+            url=str(response.request.url),
+            elapsed=elapsed,
+            compressed_bytes=response.num_bytes_downloaded,
+            decompressed_bytes=len(response.content),
+            cache_age=response.extensions.get(CACHE_AGE_EXTENSION),
+            stale=response.extensions.get(CACHE_STALE_EXTENSION, False),
+        )
+
+    @property
+    def rate_limit(self) -> RateLimitInfo:
+        return RateLimitInfo.from_headers(self.headers)
+
+
 class APIResponse(Generic[T]):
     """Wrapper around an API response that exposes parsed data and metadata."""
 
@@ -77,6 +119,38 @@ class APIResponse(Generic[T]):
     def status_code(self) -> int:
         return self.http_response.status_code
 
+    @property
+    def content_encoding(self) -> str | None:
+        """Compression applied by the server (e.g. ``"gzip"``), if any."""
+        encoding: str | None = self.http_response.headers.get("content-encoding")
+        return encoding
+
+    @property
+    def compressed_bytes(self) -> int:
+        """Body size as transferred over the network."""
+        return self.http_response.num_bytes_downloaded
+
+    @property
+    def decompressed_bytes(self) -> int:
+        """Body size after decompression."""
+        return len(self.http_response.content)
+
     @property
     def rate_limit(self) -> RateLimitInfo:
         return RateLimitInfo.from_headers(self.http_response.headers)
+
+    @property
+    def cache_age(self) -> float | None:
+        """Seconds since the response was fetched, or ``None`` if not from a cache."""
+        age: float | None = self.http_response.extensions.get(CACHE_AGE_EXTENSION)
+        return age
+
+    @property
+    def is_stale(self) -> bool:
+        """``True`` when served from cache past its TTL (stale-while-revalidate)."""
+        return bool(self.http_response.extensions.get(CACHE_STALE_EXTENSION, False))
+
+    @property
+    def meta(self) -> ResponseMeta:
+        """Headers, timing and sizes, detached from the response body."""
+        return ResponseMeta.from_response(self.http_response)
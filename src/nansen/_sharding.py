@@ -0,0 +1,119 @@
+from __future__ import annotations
+
+import datetime as dt
+import typing
+from collections.abc import Callable, Mapping
+from typing import Any
+
+from nansen._models import BaseModel
+from nansen._types import NotGiven
+
+# Fields tried, in order, to find the timestamp that results are merged on.
+TIMESTAMP_FIELDS = ("block_timestamp", "timestamp", "date")
+
+# Keyword arguments that carry the time window on time-bounded endpoints.
+WINDOW_KEYS = ("date", "date_range")
+
+
+def _parse_bound(value: str) -> dt.date | dt.datetime:
+    if len(value) == 10:
+        return dt.date.fromisoformat(value)
+    # fromisoformat() only accepts a "Z" suffix from Python 3.11.
+    return dt.datetime.fromisoformat(value[:-1] + "+00:00" if value.endswith("Z") else value)
+
+
+def _format_bound(value: dt.date | dt.datetime, template: str) -> str:
+    if not isinstance(value, dt.datetime):
+        return value.isoformat()
+    text = value.isoformat(timespec="microseconds" if "." in template else "seconds")
+    if template.endswith("Z") and text.endswith("+00:00"):
+        return text[: -len("+00:00")] + "Z"
+    return text
+
+
+def split_date_range(window: Mapping[str, str], shard_days: float = 1) -> list[dict[str, str]]:
+    """Split a ``{"from": ..., "to": ...}`` window into consecutive sub-windows.
+
+    Both bounds are inclusive, as in the API. Date-only windows
+    (``"2024-01-31"``) split into whole days; timestamp windows split into
+    ``shard_days``-long slices that end one tick (a second, or a microsecond
+    for fractional timestamps) before the next slice starts, so no record
+    falls into two shards.
+
+    Args:
+        window: The window to split.
+        shard_days: Length of each sub-window in days.
+    """
+    if shard_days <= 0:
+        raise ValueError("shard_days must be positive.")
+    start_text, end_text = window["from"], window["to"]
+    start, end = _parse_bound(start_text), _parse_bound(end_text)
+    if isinstance(start, dt.datetime) != isinstance(end, dt.datetime):
+        raise ValueError("Window bounds must both be dates or both be timestamps.")
+    if start > end:
+        raise ValueError("Window 'from' is after 'to'.")
+
+    step = dt.timedelta(days=shard_days)
+    if isinstance(start, dt.datetime):
+        tick = dt.timedelta(microseconds=1) if "." in start_text else dt.timedelta(seconds=1)
+    else:
+        step = dt.timedelta(days=max(1, int(shard_days)))
+        tick = dt.timedelta(days=1)
+
+    shards: list[dict[str, str]] = []
+    lower = start
+    while lower <= end:
+        upper = min(lower + step - tick, end)
+        shards.append(
+            {"from": _format_bound(lower, start_text), "to": _format_bound(upper, end_text)}
+        )
+        lower = upper + tick
+    return shards
+
+
+def _window_key(params: Mapping[str, Any]) -> str:
+    keys = [key for key in WINDOW_KEYS if key in params]
+    if len(keys) != 1:
+        raise TypeError("Sharded calls need exactly one of 'date' or 'date_range'.")
+    return keys[0]
+
+
+def _item_model(method: Callable[..., Any]) -> type[BaseModel]:
+    hints = typing.get_type_hints(method)
+    (model,) = typing.get_args(hints["return"])
+    return typing.cast("type[BaseModel]", model)
+
+
+def _timestamp_field(model: type[BaseModel]) -> str:
+    for name in TIMESTAMP_FIELDS:
+        if name in model.model_fields:
+            return name
+    raise TypeError(f"{model.__name__} has no timestamp field to merge shards on.")
+
+
+def plan_shards(
+    method: Callable[..., Any], params: Mapping[str, Any], shard_days: float
+) -> list[dict[str, Any]]:
+    """Build per-shard keyword arguments for *method*.
+
+    Each shard is sorted on the model's timestamp field (ascending unless the
+    caller's ``order_by`` sorts on it descending; sorting on anything else is
+    rejected). Shards cover disjoint windows, so concatenating them in the
+    returned order yields one stream in timestamp order.
+    """
+    key = _window_key(params)
+    field = _timestamp_field(_item_model(method))
+    order_by = params.get("order_by")
+    if order_by is None or isinstance(order_by, NotGiven):
+        order_by = [{"field": field, "direction": "ASC"}]
+    elif not order_by or order_by[0].get("field") != field:
+        raise ValueError(f"Sharded results are merged on {field!r}; order_by must sort on it.")
+    descending = str(order_by[0].get("direction", "ASC")).upper() == "DESC"
+
+    shards = [
+        {**params, key: window, "order_by": order_by}
+        for window in split_date_range(params[key], shard_days)
+    ]
+    if descending:
+        shards.reverse()
+    return shards
@@ -0,0 +1,194 @@
+from __future__ import annotations
+
+import functools
+import importlib.util
+import re
+import threading
+from collections.abc import Callable
+from typing import Generic, TypeVar
+
+import httpx
+
+from nansen._constants import (
+    DEFAULT_KEEPALIVE_EXPIRY,
+    DEFAULT_MAX_CONNECTIONS,
+    DEFAULT_MAX_KEEPALIVE_CONNECTIONS,
+)
+
+DEFAULT_CONNECTION_LIMITS = httpx.Limits(
+    max_connections=DEFAULT_MAX_CONNECTIONS,
+    max_keepalive_connections=DEFAULT_MAX_KEEPALIVE_CONNECTIONS,
+    keepalive_expiry=DEFAULT_KEEPALIVE_EXPIRY,
+)
+
+# Most to least preferred, with the packages httpx needs to decode each (any one of)
+# and the first httpx release able to decode it.
+_PREFERRED_ENCODINGS: tuple[tuple[str, tuple[str, ...], tuple[int, ...]], ...] = (
+    ("zstd", ("zstandard",), (0, 27, 1)),
+    ("br", ("brotli", "brotlicffi"), ()),
+    ("gzip", (), ()),
+    ("deflate", (), ()),
+)
+
+
+def _httpx_version() -> tuple[int, ...]:
+    return tuple(int(part) for part in re.findall(r"\d+", httpx.__version__)[:3])
+
+
+_TransportKey = tuple[int | None, int | None, float | None, bool]
+TransportT = TypeVar("TransportT", httpx.HTTPTransport, httpx.AsyncHTTPTransport)
+
+
+@functools.cache
+def accept_encoding() -> str:
+    """Return the ``accept-encoding`` header value for the installed decoders.
+
+    ``gzip`` and ``deflate`` are always available; ``br`` and ``zstd`` are
+    advertised when ``brotli`` (or ``brotlicffi``) / ``zstandard`` is
+    installed, and ``zstd`` only from httpx 0.27.1, the first release that
+    decodes it. httpx decodes these chunk by chunk as the body streams in.
+    """
+    version = _httpx_version()
+    return ", ".join(
+        encoding
+        for encoding, packages, since in _PREFERRED_ENCODINGS
+        if version >= since
+        and (not packages or any(importlib.util.find_spec(name) for name in packages))
+    )
+
+
+def _transport_key(limits: httpx.Limits, http2: bool) -> _TransportKey:
+    return (
+        limits.max_connections,
+        limits.max_keepalive_connections,
+        limits.keepalive_expiry,
+        http2,
+    )
+
+
+class _TransportPool(Generic[TransportT]):
+    """Reference-counted registry of transports shared between clients.
+
+    One transport (and therefore one connection pool) exists per distinct
+    ``(limits, http2)`` combination. Each client holds a lease; the pool is
+    closed when the last lease is released.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._entries: dict[_TransportKey, tuple[TransportT, int]] = {}
+
+    def acquire(self, key: _TransportKey, factory: Callable[[], TransportT]) -> TransportT:
+        """Return the shared transport for *key*, creating it with *factory* if absent."""
+        with self._lock:
+            existing = self._entries.get(key)
+            if existing is not None:
+                shared, refs = existing
+                self._entries[key] = (shared, refs + 1)
+                return shared
+            transport = factory()
+            self._entries[key] = (transport, 1)
+            return transport
+
+    def release(self, key: _TransportKey) -> TransportT | None:
+        """Drop one lease, returning the transport if it should now be closed."""
+        with self._lock:
+            existing = self._entries.get(key)
+            if existing is None:
+                return None
+            shared, refs = existing
+            if refs > 1:
+                self._entries[key] = (shared, refs - 1)
+                return None
+            del self._entries[key]
+            return shared
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+_SYNC_POOL: _TransportPool[httpx.HTTPTransport] = _TransportPool()
+_ASYNC_POOL: _TransportPool[httpx.AsyncHTTPTransport] = _TransportPool()
+
+
+class SharedTransport(httpx.BaseTransport):
+    """A lease on a process-wide ``httpx.HTTPTransport``.
+
+    Closing the lease only closes the underlying connection pool once every
+    other client sharing it has been closed too.
+    """
+
+    def __init__(self, *, limits: httpx.Limits, http2: bool = False) -> None:
+        self._key = _transport_key(limits, http2)
+        self._closed = False
+        self._transport = _SYNC_POOL.acquire(
+            self._key, lambda: httpx.HTTPTransport(limits=limits, http2=http2)
+        )
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        return self._transport.handle_request(request)
+
+    def close(self) -> None:
+        if self._closed:
+            return
+        self._closed = True
+        transport = _SYNC_POOL.release(self._key)
+        if transport is not None:
+            transport.close()
+
+
+class AsyncSharedTransport(httpx.AsyncBaseTransport):
+    """A lease on a process-wide ``httpx.AsyncHTTPTransport``.
+
+    Connections belong to the event loop that opened them, so share async
+    transports only between clients used on the same loop.
+    """
+
+    def __init__(self, *, limits: httpx.Limits, http2: bool = False) -> None:
+        self._key = _transport_key(limits, http2)
+        self._closed = False
+        self._transport = _ASYNC_POOL.acquire(
+            self._key, lambda: httpx.AsyncHTTPTransport(limits=limits, http2=http2)
+        )
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        return await self._transport.handle_async_request(request)
+
+    async def aclose(self) -> None:
+        if self._closed:
+            return
+        self._closed = True
+        transport = _ASYNC_POOL.release(self._key)
+        if transport is not None:
+            await transport.aclose()
+
+
+def build_http_client(
+    *,
+    timeout: float,
+    limits: httpx.Limits | None,
+    http2: bool,
+    share_transport: bool,
+) -> httpx.Client:
+    """Create the default ``httpx.Client`` for a synchronous API client."""
+    limits = limits or DEFAULT_CONNECTION_LIMITS
+    if share_transport:
+        return httpx.Client(timeout=timeout, transport=SharedTransport(limits=limits, http2=http2))
+    return httpx.Client(timeout=timeout, limits=limits, http2=http2)
+
+
+def build_async_http_client(
+    *,
+    timeout: float,
+    limits: httpx.Limits | None,
+    http2: bool,
+    share_transport: bool,
+) -> httpx.AsyncClient:
+    """Create the default ``httpx.AsyncClient`` for an asynchronous API client."""
+    limits = limits or DEFAULT_CONNECTION_LIMITS
+    if share_transport:
+        return httpx.AsyncClient(
+            timeout=timeout,
+            transport=AsyncSharedTransport(limits=limits, http2=http2),
+        )
+    return httpx.AsyncClient(timeout=timeout, limits=limits, http2=http2)
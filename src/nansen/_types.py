@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from typing import Literal
+from typing import Literal, get_args
 
 
 class _NotGiven:
@@ -32,6 +32,8 @@ Chain = Literal[
 ]
 # fmt: on
 
+ALL_CHAINS: tuple[Chain, ...] = get_args(Chain)
+
 SmartMoneyLabel = Literal[
     "smart_money",
     "fund",
@@ -43,6 +45,12 @@ SortDirection = Literal["asc", "desc"]
 
 Timeframe = Literal["5m", "10m", "1h", "6h", "24h", "7d", "30d"]
 
+ResultMode = Literal["model", "raw", "lazy", "compact"]
+"""How response rows are returned: validated models, decoded JSON, lazily validated
+models, or slotted compact records."""
+
+RESULT_MODES: tuple[ResultMode, ...] = get_args(ResultMode)
+
 HeaderTypes = dict[str, str]
 QueryTypes = dict[str, str | int | float | bool | None]
 BodyTypes = dict[str, object]
@@ -0,0 +1,91 @@
+from __future__ import annotations
+
+import contextvars
+from collections.abc import Awaitable, Callable
+from concurrent.futures import Executor, Future
+from typing import Any, TypeVar
+
+import anyio
+from anyio.abc import TaskGroup
+
+R = TypeVar("R")
+
+_Queued = tuple[anyio.CancelScope, Callable[..., Awaitable[Any]], tuple[Any, ...]]
+
+
+def submit_in_context(executor: Executor, fn: Callable[..., R], *args: Any) -> Future[R]:
+    """Submit *fn* to *executor* inside a copy of the caller's context.
+
+    Worker threads otherwise start with an empty context, which would drop
+    credit jobs and other ``contextvars`` state set by the caller.
+    """
+    context = contextvars.copy_context()
+    return executor.submit(context.run, fn, *args)
+
+
+def interrupted_error() -> RuntimeError:
+    """The error reported for a helper task cancelled from outside (client closed)."""
+    return RuntimeError("A background request was cancelled; was the client closed?")
+
+
+class TaskSpawner:
+    """Runs an async generator's helper tasks without a cancel scope spanning ``yield``.
+
+    A generator abandoned with ``break`` is finalized later, possibly from
+    another task, so it must not keep a task group open across ``yield``.
+    With a *task_group* owned elsewhere (an open client's), tasks start there
+    at once and keep running while the generator is suspended; :meth:`cancel`
+    stops them from whichever task closes the generator. Without one, tasks
+    are queued and :meth:`flush` runs them to completion in a local task
+    group, so work only overlaps within each batch.
+    """
+
+    def __init__(self, task_group: TaskGroup | None) -> None:
+        self._task_group = task_group
+        self._scopes: set[anyio.CancelScope] = set()
+        self._queued: list[_Queued] = []
+
+    @property
+    def background(self) -> bool:
+        """Whether tasks run in the background while the generator is suspended."""
+        return self._task_group is not None
+
+    def start_soon(self, func: Callable[..., Awaitable[Any]], *args: Any) -> None:
+        scope = anyio.CancelScope()
+        self._scopes.add(scope)
+        if self._task_group is None:
+            self._queued.append((scope, func, args))
+        else:
+            self._task_group.start_soon(self._run, scope, func, args)
+
+    async def flush(self) -> None:
+        """Run queued tasks to completion; a no-op with a background task group."""
+        queued, self._queued = self._queued, []
+        if queued:
+            async with anyio.create_task_group() as tg:
+                for scope, func, args in queued:
+                    tg.start_soon(self._run, scope, func, args)
+
+    async def wait(self, event: anyio.Event) -> None:
+        """Wait for *event*, first running queued tasks if it isn't set yet."""
+        if not event.is_set():
+            await self.flush()
+        await event.wait()
+
+    def cancel(self) -> None:
+        """Cancel every task started and not yet finished; safe from any task."""
+        self._queued.clear()
+        for scope in self._scopes:
+            scope.cancel()
+
+    async def _run(
+        self, scope: anyio.CancelScope, func: Callable[..., Awaitable[Any]], args: tuple[Any, ...]
+    ) -> None:
+        try:
+            with scope:
+                await func(*args)
+        except (anyio.BrokenResourceError, anyio.ClosedResourceError):
+            # The generator was closed while the task was handing over a result.
+            pass
+        finally:
+            self._scopes.discard(scope)
@@ -0,0 +1,38 @@
+from __future__ import annotations
+
+from collections.abc import Callable
+from typing import Any, Literal
+
+JSONBackend = Literal["pydantic", "orjson", "msgspec"]
+
+JSON_BACKENDS: tuple[str, ...] = ("pydantic", "orjson", "msgspec")
+
+
+def get_json_loader(backend: str) -> Callable[[bytes], Any] | None:
+    """Return a ``bytes -> object`` decoder for *backend*.
+
+    ``"pydantic"`` returns ``None``: responses are validated straight from
+    the raw bytes with ``TypeAdapter.validate_json`` and never decoded into
+    an intermediate dict. ``"orjson"`` and ``"msgspec"`` are optional
+    dependencies imported on first use.
+    """
+    if backend == "pydantic":
+        return None
+    if backend == "orjson":
+        try:
+            import orjson
+        except ImportError as exc:
+            raise ImportError(
+                'json_backend="orjson" requires the orjson package: pip install "nansen[orjson]"'
+            ) from exc
+        return orjson.loads
+    if backend == "msgspec":
+        try:
+            import msgspec
+        except ImportError as exc:
+            raise ImportError(
+                'json_backend="msgspec" requires the msgspec package: pip install "nansen[msgspec]"'
+            ) from exc
+        decoder = msgspec.json.Decoder()
+        return decoder.decode
+    raise ValueError(f"Unknown json_backend {backend!r}; expected one of {JSON_BACKENDS}.")
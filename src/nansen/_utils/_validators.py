@@ -0,0 +1,55 @@
+from __future__ import annotations
+
+import threading
+from collections.abc import Iterable
+from typing import Any
+
+from pydantic import TypeAdapter
+
+from nansen._models import BaseModel
+
+_ADAPTERS: dict[Any, TypeAdapter[Any]] = {}
+_LOCK = threading.Lock()
+
+
+def get_adapter(tp: Any) -> TypeAdapter[Any]:
+    """Return the compiled ``TypeAdapter`` for *tp*.
+
+    Adapters are built once per process and shared by every client, so the
+    pydantic-core schema for a model (or ``list[model]``) is only compiled
+    the first time it is seen.
+    """
+    adapter = _ADAPTERS.get(tp)
+    if adapter is None:
+        with _LOCK:
+            adapter = _ADAPTERS.get(tp)
+            if adapter is None:
+                adapter = TypeAdapter(tp)
+                _ADAPTERS[tp] = adapter
+    return adapter
+
+
+def response_models() -> list[type[BaseModel]]:
+    """Return every response model defined in ``nansen.types``."""
+    from nansen.types import points, portfolio, profiler, smart_money, tgm
+
+    models: list[type[BaseModel]] = []
+    for module in (points, portfolio, profiler, smart_money, tgm):
+        for value in vars(module).values():
+            if (
+                isinstance(value, type)
+                and issubclass(value, BaseModel)
+                and value.__module__ == module.__name__
+            ):
+                models.append(value)
+    return models
+
+
+def warmup_adapters(models: Iterable[type[BaseModel]]) -> None:
+    """Compile the single-object, list and page-envelope adapters for each model."""
+    from nansen._pagination import PageEnvelope
+
+    for model in models:
+        get_adapter(model)
+        get_adapter(list[model])  # type: ignore[valid-type]
+        get_adapter(PageEnvelope[model])  # type: ignore[valid-type]
@@ -5,7 +5,7 @@ from typing import TYPE_CHECKING, Any, TypeVar
 from nansen._models import BaseModel
 from nansen._pagination import AsyncPage, SyncPage
 from nansen._response import APIResponse
-from nansen._types import _NotGiven
+from nansen._types import NOT_GIVEN, NotGiven, _NotGiven
 
 if TYPE_CHECKING:
     from nansen._base_client import AsyncAPIClient, SyncAPIClient
@@ -39,11 +39,13 @@ class SyncAPIResource:
         *,
         body: dict[str, Any],
         model: type[T],
+        limit: int | NotGiven = NOT_GIVEN,
     ) -> SyncPage[T]:
         return self._client._request_page(
             path=path,
             body=_strip_not_given(body),
             model=model,
+            limit=None if isinstance(limit, _NotGiven) else limit,
         )
 
     def _get(
@@ -86,11 +88,13 @@ class AsyncAPIResource:
         *,
         body: dict[str, Any],
         model: type[T],
+        limit: int | NotGiven = NOT_GIVEN,
     ) -> AsyncPage[T]:
         return await self._client._request_page(
             path=path,
             body=_strip_not_given(body),
             model=model,
+            limit=None if isinstance(limit, _NotGiven) else limit,
         )
 
     async def _get(
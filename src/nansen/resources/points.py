@@ -1,7 +1,5 @@
 from __future__ import annotations
 
-from pydantic import TypeAdapter
-
 from nansen._constants import POINTS_BASE_URL
 from nansen._response import APIResponse
 from nansen._types import NOT_GIVEN, NotGiven, _NotGiven
@@ -36,7 +34,7 @@ class Points(SyncAPIResource):
             headers={"content-type": "application/json"},
             base_url=POINTS_BASE_URL,
         )
-        items = TypeAdapter(list[PointsLeaderboardEntry]).validate_python(response.json())
+        items = self._client._parse_list_response(response, PointsLeaderboardEntry)
         return APIResponse(data=items, http_response=response)
 
 
@@ -67,5 +65,5 @@ class AsyncPoints(AsyncAPIResource):
             headers={"content-type": "application/json"},
             base_url=POINTS_BASE_URL,
         )
-        items = TypeAdapter(list[PointsLeaderboardEntry]).validate_python(response.json())
+        items = self._client._parse_list_response(response, PointsLeaderboardEntry)
         return APIResponse(data=items, http_response=response)
@@ -1,7 +1,10 @@
 from __future__ import annotations
 
+from collections.abc import Iterable
 from typing import Any
 
+from nansen._constants import DEFAULT_FAN_OUT_CONCURRENCY
+from nansen._fanout import AsyncFanOutStream, FanOutStream
 from nansen._pagination import AsyncPage, SyncPage
 from nansen._response import APIResponse
 from nansen._types import NOT_GIVEN, NotGiven
@@ -28,6 +31,7 @@ class Address(SyncAPIResource):
         hide_spam_token: bool | NotGiven = NOT_GIVEN,
         filters: dict[str, Any] | NotGiven = NOT_GIVEN,
         pagination: dict[str, Any] | NotGiven = NOT_GIVEN,
+        limit: int | NotGiven = NOT_GIVEN,
         order_by: list[dict[str, str]] | NotGiven = NOT_GIVEN,
     ) -> SyncPage[ProfilerBalanceItem]:
         """Get current token balances for an address or entity.
@@ -39,6 +43,8 @@ class Address(SyncAPIResource):
             hide_spam_token: If ``True``, exclude tokens flagged as spam.
             filters: Field-level filters to narrow results.
             pagination: Pagination options (``page``, ``per_page``).
+            limit: Maximum number of items to fetch across all pages. The page
+                size is picked automatically unless ``pagination`` sets ``per_page``.
             order_by: List of ordering directives.
         """
         return self._post_page(
@@ -53,6 +59,7 @@ class Address(SyncAPIResource):
                 "order_by": order_by,
             },
             model=ProfilerBalanceItem,
+            limit=limit,
         )
 
     def historical_balances(
@@ -64,6 +71,7 @@ class Address(SyncAPIResource):
         entity_name: str | NotGiven = NOT_GIVEN,
         filters: dict[str, Any] | NotGiven = NOT_GIVEN,
         pagination: dict[str, Any] | NotGiven = NOT_GIVEN,
+        limit: int | NotGiven = NOT_GIVEN,
         order_by: list[dict[str, str]] | NotGiven = NOT_GIVEN,
     ) -> SyncPage[HistoricalBalanceItem]:
         """Get historical token balances for an address or entity.
@@ -75,6 +83,8 @@ class Address(SyncAPIResource):
             entity_name: Entity name to look up (alternative to ``address``).
             filters: Field-level filters to narrow results.
             pagination: Pagination options (``page``, ``per_page``).
+            limit: Maximum number of items to fetch across all pages. The page
+                size is picked automatically unless ``pagination`` sets ``per_page``.
             order_by: List of ordering directives.
         """
         return self._post_page(
@@ -89,6 +99,7 @@ class Address(SyncAPIResource):
                 "order_by": order_by,
             },
             model=HistoricalBalanceItem,
+            limit=limit,
         )
 
     def transactions(
@@ -100,6 +111,7 @@ class Address(SyncAPIResource):
         hide_spam_token: bool | NotGiven = NOT_GIVEN,
         filters: dict[str, Any] | NotGiven = NOT_GIVEN,
         pagination: dict[str, Any] | NotGiven = NOT_GIVEN,
+        limit: int | NotGiven = NOT_GIVEN,
         order_by: list[dict[str, str]] | NotGiven = NOT_GIVEN,
     ) -> SyncPage[TransactionItem]:
         """Get transaction history for an address.
@@ -111,6 +123,8 @@ class Address(SyncAPIResource):
             hide_spam_token: If ``True``, exclude transactions involving spam tokens.
             filters: Field-level filters to narrow results.
             pagination: Pagination options (``page``, ``per_page``).
+            limit: Maximum number of items to fetch across all pages. The page
+                size is picked automatically unless ``pagination`` sets ``per_page``.
             order_by: List of ordering directives.
         """
         return self._post_page(
@@ -125,6 +139,7 @@ class Address(SyncAPIResource):
                 "order_by": order_by,
             },
             model=TransactionItem,
+            limit=limit,
         )
 
     def counterparties(
@@ -138,6 +153,7 @@ class Address(SyncAPIResource):
         group_by: str | NotGiven = NOT_GIVEN,
         filters: dict[str, Any] | NotGiven = NOT_GIVEN,
         pagination: dict[str, Any] | NotGiven = NOT_GIVEN,
+        limit: int | NotGiven = NOT_GIVEN,
         order_by: list[dict[str, str]] | NotGiven = NOT_GIVEN,
     ) -> SyncPage[CounterpartyItem]:
         """Get counterparty data for an address or entity.
@@ -151,6 +167,8 @@ class Address(SyncAPIResource):
             group_by: Field to group counterparties by.
             filters: Field-level filters to narrow results.
             pagination: Pagination options (``page``, ``per_page``).
+            limit: Maximum number of items to fetch across all pages. The page
+                size is picked automatically unless ``pagination`` sets ``per_page``.
             order_by: List of ordering directives.
         """
         return self._post_page(
@@ -167,6 +185,7 @@ class Address(SyncAPIResource):
                 "order_by": order_by,
             },
             model=CounterpartyItem,
+            limit=limit,
         )
 
     def related_wallets(
@@ -175,6 +194,7 @@ class Address(SyncAPIResource):
         address: str,
         chain: str,
         pagination: dict[str, Any] | NotGiven = NOT_GIVEN,
+        limit: int | NotGiven = NOT_GIVEN,
         order_by: list[dict[str, str]] | NotGiven = NOT_GIVEN,
     ) -> SyncPage[RelatedWalletItem]:
         """Get wallets related to an address.
@@ -183,6 +203,8 @@ class Address(SyncAPIResource):
             address: Wallet address to look up.
             chain: Chain identifier (e.g. ``"ethereum"``).
             pagination: Pagination options (``page``, ``per_page``).
+            limit: Maximum number of items to fetch across all pages. The page
+                size is picked automatically unless ``pagination`` sets ``per_page``.
             order_by: List of ordering directives.
         """
         return self._post_page(
@@ -194,6 +216,7 @@ class Address(SyncAPIResource):
                 "order_by": order_by,
             },
             model=RelatedWalletItem,
+            limit=limit,
         )
 
     def labels(
@@ -230,19 +253,128 @@ class Address(SyncAPIResource):
 
         # Beta endpoint uses a different base path
 
-        from pydantic import TypeAdapter
-
         response = self._client._request(
             "POST",
             "/profiler/address/labels",
             body=body,
             base_url=self._client.base_url.replace("/api/v1", "/api/beta"),
         )
-        items = TypeAdapter(list[AddressLabelItem]).validate_python(response.json())
+        items = self._client._parse_list_response(response, AddressLabelItem)
         from nansen._response import APIResponse
 
         return APIResponse(data=items, http_response=response)
 
+    def current_balance_many(
+        self,
+        *,
+        addresses: Iterable[str],
+        chain: str,
+        hide_spam_token: bool | NotGiven = NOT_GIVEN,
+        filters: dict[str, Any] | NotGiven = NOT_GIVEN,
+        pagination: dict[str, Any] | NotGiven = NOT_GIVEN,
+        limit: int | NotGiven = NOT_GIVEN,
+        order_by: list[dict[str, str]] | NotGiven = NOT_GIVEN,
+        max_concurrency: int = DEFAULT_FAN_OUT_CONCURRENCY,
+    ) -> FanOutStream[str, SyncPage[ProfilerBalanceItem]]:
+        """Get current token balances for many addresses concurrently.
+
+        Duplicate addresses are fetched once, on worker threads, under the client's rate
+        limits. Iterate the result for ``(address, page)`` pairs as
+        they complete, or call ``collect()`` for a mapping keyed by address.
+        Per-address errors are collected in ``errors`` rather than raised.
+
+        Args:
+            addresses: Wallet addresses to look up.
+            chain: Chain identifier (e.g. ``"ethereum"``).
+            hide_spam_token: If ``True``, exclude tokens flagged as spam.
+            filters: Field-level filters to narrow results.
+            pagination: Pagination options (``page``, ``per_page``).
+            limit: Maximum number of items to fetch per address.
+            order_by: List of ordering directives.
+            max_concurrency: Maximum number of addresses in flight at once.
+        """
+        return FanOutStream(
+            lambda address: self.current_balance(
+                chain=chain,
+                address=address,
+                hide_spam_token=hide_spam_token,
+                filters=filters,
+                pagination=pagination,
+                limit=limit,
+                order_by=order_by,
+            ),
+            addresses,
+            max_concurrency=max_concurrency,
+        )
+
+    def related_wallets_many(
+        self,
+        *,
+        addresses: Iterable[str],
+        chain: str,
+        pagination: dict[str, Any] | NotGiven = NOT_GIVEN,
+        limit: int | NotGiven = NOT_GIVEN,
+        order_by: list[dict[str, str]] | NotGiven = NOT_GIVEN,
+        max_concurrency: int = DEFAULT_FAN_OUT_CONCURRENCY,
+    ) -> FanOutStream[str, SyncPage[RelatedWalletItem]]:
+        """Get related wallets for many addresses concurrently.
+
+        Behaves like :meth:`current_balance_many`.
+
+        Args:
+            addresses: Wallet addresses to look up.
+            chain: Chain identifier (e.g. ``"ethereum"``).
+            pagination: Pagination options (``page``, ``per_page``).
+            limit: Maximum number of items to fetch per address.
+            order_by: List of ordering directives.
+            max_concurrency: Maximum number of addresses in flight at once.
+        """
+        return FanOutStream(
+            lambda address: self.related_wallets(
+                address=address,
+                chain=chain,
+                pagination=pagination,
+                limit=limit,
+                order_by=order_by,
+            ),
+            addresses,
+            max_concurrency=max_concurrency,
+        )
+
+    def labels_many(
+        self,
+        *,
+        addresses: Iterable[str],
+        chain: str,
+        entity: str | NotGiven = NOT_GIVEN,
+        label: str | NotGiven = NOT_GIVEN,
+        pagination: dict[str, Any] | NotGiven = NOT_GIVEN,
+        max_concurrency: int = DEFAULT_FAN_OUT_CONCURRENCY,
+    ) -> FanOutStream[str, APIResponse[list[AddressLabelItem]]]:
+        """Get labels for many addresses concurrently (beta endpoint).
+
+        Behaves like :meth:`current_balance_many`.
+
+        Args:
+            addresses: Wallet addresses to look up.
+            chain: Chain identifier (e.g. ``"ethereum"``).
+            entity: Filter by entity name.
+            label: Filter by label name.
+            pagination: Pagination options (``page``, ``per_page``).
+            max_concurrency: Maximum number of addresses in flight at once.
+        """
+        return FanOutStream(
+            lambda address: self.labels(
+                chain=chain,
+                address=address,
+                entity=entity,
+                label=label,
+                pagination=pagination,
+            ),
+            addresses,
+            max_concurrency=max_concurrency,
+        )
+
 
 class AsyncAddress(AsyncAPIResource):
     """Address sub-resource for wallet-level profiler endpoints (async)."""
@@ -256,6 +388,7 @@ class AsyncAddress(AsyncAPIResource):
         hide_spam_token: bool | NotGiven = NOT_GIVEN,
         filters: dict[str, Any] | NotGiven = NOT_GIVEN,
         pagination: dict[str, Any] | NotGiven = NOT_GIVEN,
+        limit: int | NotGiven = NOT_GIVEN,
         order_by: list[dict[str, str]] | NotGiven = NOT_GIVEN,
     ) -> AsyncPage[ProfilerBalanceItem]:
         """Get current token balances for an address or entity.
@@ -267,6 +400,8 @@ class AsyncAddress(AsyncAPIResource):
             hide_spam_token: If ``True``, exclude tokens flagged as spam.
             filters: Field-level filters to narrow results.
             pagination: Pagination options (``page``, ``per_page``).
+            limit: Maximum number of items to fetch across all pages. The page
+                size is picked automatically unless ``pagination`` sets ``per_page``.
             order_by: List of ordering directives.
         """
         return await self._post_page(
@@ -281,6 +416,7 @@ class AsyncAddress(AsyncAPIResource):
                 "order_by": order_by,
             },
             model=ProfilerBalanceItem,
+            limit=limit,
         )
 
     async def historical_balances(
@@ -292,6 +428,7 @@ class AsyncAddress(AsyncAPIResource):
         entity_name: str | NotGiven = NOT_GIVEN,
         filters: dict[str, Any] | NotGiven = NOT_GIVEN,
         pagination: dict[str, Any] | NotGiven = NOT_GIVEN,
+        limit: int | NotGiven = NOT_GIVEN,
         order_by: list[dict[str, str]] | NotGiven = NOT_GIVEN,
     ) -> AsyncPage[HistoricalBalanceItem]:
         """Get historical token balances for an address or entity.
@@ -303,6 +440,8 @@ class AsyncAddress(AsyncAPIResource):
             entity_name: Entity name to look up (alternative to ``address``).
             filters: Field-level filters to narrow results.
             pagination: Pagination options (``page``, ``per_page``).
+            limit: Maximum number of items to fetch across all pages. The page
+                size is picked automatically unless ``pagination`` sets ``per_page``.
             order_by: List of ordering directives.
         """
         return await self._post_page(
@@ -317,6 +456,7 @@ class AsyncAddress(AsyncAPIResource):
                 "order_by": order_by,
             },
             model=HistoricalBalanceItem,
+            limit=limit,
         )
 
     async def transactions(
@@ -328,6 +468,7 @@ class AsyncAddress(AsyncAPIResource):
         hide_spam_token: bool | NotGiven = NOT_GIVEN,
         filters: dict[str, Any] | NotGiven = NOT_GIVEN,
         pagination: dict[str, Any] | NotGiven = NOT_GIVEN,
+        limit: int | NotGiven = NOT_GIVEN,
         order_by: list[dict[str, str]] | NotGiven = NOT_GIVEN,
     ) -> AsyncPage[TransactionItem]:
         """Get transaction history for an address.
@@ -339,6 +480,8 @@ class AsyncAddress(AsyncAPIResource):
             hide_spam_token: If ``True``, exclude transactions involving spam tokens.
             filters: Field-level filters to narrow results.
             pagination: Pagination options (``page``, ``per_page``).
+            limit: Maximum number of items to fetch across all pages. The page
+                size is picked automatically unless ``pagination`` sets ``per_page``.
             order_by: List of ordering directives.
         """
         return await self._post_page(
@@ -353,6 +496,7 @@ class AsyncAddress(AsyncAPIResource):
                 "order_by": order_by,
             },
             model=TransactionItem,
+            limit=limit,
         )
 
     async def counterparties(
@@ -366,6 +510,7 @@ class AsyncAddress(AsyncAPIResource):
         group_by: str | NotGiven = NOT_GIVEN,
         filters: dict[str, Any] | NotGiven = NOT_GIVEN,
         pagination: dict[str, Any] | NotGiven = NOT_GIVEN,
+        limit: int | NotGiven = NOT_GIVEN,
         order_by: list[dict[str, str]] | NotGiven = NOT_GIVEN,
     ) -> AsyncPage[CounterpartyItem]:
         """Get counterparty data for an address or entity.
@@ -379,6 +524,8 @@ class AsyncAddress(AsyncAPIResource):
             group_by: Field to group counterparties by.
             filters: Field-level filters to narrow results.
             pagination: Pagination options (``page``, ``per_page``).
+            limit: Maximum number of items to fetch across all pages. The page
+                size is picked automatically unless ``pagination`` sets ``per_page``.
             order_by: List of ordering directives.
         """
         return await self._post_page(
@@ -395,6 +542,7 @@ class AsyncAddress(AsyncAPIResource):
                 "order_by": order_by,
             },
             model=CounterpartyItem,
+            limit=limit,
         )
 
     async def related_wallets(
@@ -403,6 +551,7 @@ class AsyncAddress(AsyncAPIResource):
         address: str,
         chain: str,
         pagination: dict[str, Any] | NotGiven = NOT_GIVEN,
+        limit: int | NotGiven = NOT_GIVEN,
         order_by: list[dict[str, str]] | NotGiven = NOT_GIVEN,
     ) -> AsyncPage[RelatedWalletItem]:
         """Get wallets related to an address.
@@ -411,6 +560,8 @@ class AsyncAddress(AsyncAPIResource):
             address: Wallet address to look up.
             chain: Chain identifier (e.g. ``"ethereum"``).
             pagination: Pagination options (``page``, ``per_page``).
+            limit: Maximum number of items to fetch across all pages. The page
+                size is picked automatically unless ``pagination`` sets ``per_page``.
             order_by: List of ordering directives.
         """
         return await self._post_page(
@@ -422,6 +573,7 @@ class AsyncAddress(AsyncAPIResource):
                 "order_by": order_by,
             },
             model=RelatedWalletItem,
+            limit=limit,
         )
 
     async def labels(
@@ -456,15 +608,127 @@ class AsyncAddress(AsyncAPIResource):
         if not isinstance(pagination, NotGiven):
             body["pagination"] = pagination
 
-        from pydantic import TypeAdapter
-
         response = await self._client._request(
             "POST",
             "/profiler/address/labels",
             body=body,
             base_url=self._client.base_url.replace("/api/v1", "/api/beta"),
         )
-        items = TypeAdapter(list[AddressLabelItem]).validate_python(response.json())
+        items = self._client._parse_list_response(response, AddressLabelItem)
         from nansen._response import APIResponse
 
         return APIResponse(data=items, http_response=response)
+
+    def current_balance_many(
+        self,
+        *,
+        addresses: Iterable[str],
+        chain: str,
+        hide_spam_token: bool | NotGiven = NOT_GIVEN,
+        filters: dict[str, Any] | NotGiven = NOT_GIVEN,
+        pagination: dict[str, Any] | NotGiven = NOT_GIVEN,
+        limit: int | NotGiven = NOT_GIVEN,
+        order_by: list[dict[str, str]] | NotGiven = NOT_GIVEN,
+        max_concurrency: int = DEFAULT_FAN_OUT_CONCURRENCY,
+    ) -> AsyncFanOutStream[str, AsyncPage[ProfilerBalanceItem]]:
+        """Get current token balances for many addresses concurrently.
+
+        Duplicate addresses are fetched once, as tasks, under the client's rate
+        limits. ``async for`` over the result for ``(address, page)`` pairs as
+        they complete, or call ``await collect()`` for a mapping keyed by address.
+        Per-address errors are collected in ``errors`` rather than raised.
+
+        Args:
+            addresses: Wallet addresses to look up.
+            chain: Chain identifier (e.g. ``"ethereum"``).
+            hide_spam_token: If ``True``, exclude tokens flagged as spam.
+            filters: Field-level filters to narrow results.
+            pagination: Pagination options (``page``, ``per_page``).
+            limit: Maximum number of items to fetch per address.
+            order_by: List of ordering directives.
+            max_concurrency: Maximum number of addresses in flight at once.
+        """
+        return AsyncFanOutStream(
+            lambda address: self.current_balance(
+                chain=chain,
+                address=address,
+                hide_spam_token=hide_spam_token,
+                filters=filters,
+                pagination=pagination,
+                limit=limit,
+                order_by=order_by,
+            ),
+            addresses,
+            max_concurrency=max_concurrency,
+            task_group=self._client._background,
+        )
+
+    def related_wallets_many(
+        self,
+        *,
+        addresses: Iterable[str],
+        chain: str,
+        pagination: dict[str, Any] | NotGiven = NOT_GIVEN,
+        limit: int | NotGiven = NOT_GIVEN,
+        order_by: list[dict[str, str]] | NotGiven = NOT_GIVEN,
+        max_concurrency: int = DEFAULT_FAN_OUT_CONCURRENCY,
+    ) -> AsyncFanOutStream[str, AsyncPage[RelatedWalletItem]]:
+        """Get related wallets for many addresses concurrently.
+
+        Behaves like :meth:`current_balance_many`.
+
+        Args:
+            addresses: Wallet addresses to look up.
+            chain: Chain identifier (e.g. ``"ethereum"``).
+            pagination: Pagination options (``page``, ``per_page``).
+            limit: Maximum number of items to fetch per address.
+            order_by: List of ordering directives.
+            max_concurrency: Maximum number of addresses in flight at once.
+        """
+        return AsyncFanOutStream(
+            lambda address: self.related_wallets(
+                address=address,
+                chain=chain,
+                pagination=pagination,
+                limit=limit,
+                order_by=order_by,
+            ),
+            addresses,
+            max_concurrency=max_concurrency,
+            task_group=self._client._background,
+        )
+
+    def labels_many(
+        self,
+        *,
+        addresses: Iterable[str],
+        chain: str,
+        entity: str | NotGiven = NOT_GIVEN,
+        label: str | NotGiven = NOT_GIVEN,
+        pagination: dict[str, Any] | NotGiven = NOT_GIVEN,
+        max_concurrency: int = DEFAULT_FAN_OUT_CONCURRENCY,
+    ) -> AsyncFanOutStream[str, APIResponse[list[AddressLabelItem]]]:
+        """Get labels for many addresses concurrently (beta endpoint).
+
+        Behaves like :meth:`current_balance_many`.
+
+        Args:
+            addresses: Wallet addresses to look up.
+            chain: Chain identifier (e.g. ``"ethereum"``).
+            entity: Filter by entity name.
+            label: Filter by label name.
+            pagination: Pagination options (``page``, ``per_page``).
+            max_concurrency: Maximum number of addresses in flight at once.
+        """
+        return AsyncFanOutStream(
+            lambda address: self.labels(
+                chain=chain,
+                address=address,
+                entity=entity,
+                label=label,
+                pagination=pagination,
+            ),
+            addresses,
+            max_concurrency=max_concurrency,
+            task_group=self._client._background,
+        )
@@ -64,6 +64,7 @@ class Profiler(SyncAPIResource):
         date: dict[str, str] | NotGiven = NOT_GIVEN,
         filters: dict[str, Any] | NotGiven = NOT_GIVEN,
         pagination: dict[str, Any] | NotGiven = NOT_GIVEN,
+        limit: int | NotGiven = NOT_GIVEN,
         order_by: list[dict[str, str]] | NotGiven = NOT_GIVEN,
     ) -> SyncPage[PnlItem]:
         """Get detailed PnL data for an address or entity.
@@ -77,6 +78,8 @@ class Profiler(SyncAPIResource):
             date: Date range with ``"from"`` and ``"to"`` keys.
             filters: Field-level filters to narrow results.
             pagination: Pagination options (``page``, ``per_page``).
+            limit: Maximum number of items to fetch across all pages. The page
+                size is picked automatically unless ``pagination`` sets ``per_page``.
             order_by: List of ordering directives.
         """
         return self._post_page(
@@ -91,6 +94,7 @@ class Profiler(SyncAPIResource):
                 "order_by": order_by,
             },
             model=PnlItem,
+            limit=limit,
         )
 
     def perp_positions(
@@ -124,6 +128,7 @@ class Profiler(SyncAPIResource):
         date: dict[str, str],
         filters: dict[str, Any] | NotGiven = NOT_GIVEN,
         pagination: dict[str, Any] | NotGiven = NOT_GIVEN,
+        limit: int | NotGiven = NOT_GIVEN,
         order_by: list[dict[str, str]] | NotGiven = NOT_GIVEN,
     ) -> SyncPage[ProfilerPerpTradeItem]:
         """Get perpetual futures trade history for an address.
@@ -133,6 +138,8 @@ class Profiler(SyncAPIResource):
             date: Date range with ``"from"`` and ``"to"`` keys.
             filters: Field-level filters to narrow results.
             pagination: Pagination options (``page``, ``per_page``).
+            limit: Maximum number of items to fetch across all pages. The page
+                size is picked automatically unless ``pagination`` sets ``per_page``.
             order_by: List of ordering directives.
         """
         return self._post_page(
@@ -145,6 +152,7 @@ class Profiler(SyncAPIResource):
                 "order_by": order_by,
             },
             model=ProfilerPerpTradeItem,
+            limit=limit,
         )
 
     def entity_search(
@@ -158,16 +166,12 @@ class Profiler(SyncAPIResource):
             search_query: Search term to match against entity names.
         """
 
-        from pydantic import TypeAdapter
-
         response = self._client._request(
             "POST",
             "/search/entity-name",
             body={"search_query": search_query},
         )
-        body = response.json()
-        raw_data = body.get("data", [])
-        items = TypeAdapter(list[EntitySearchItem]).validate_python(raw_data)
+        items, _ = self._client._parse_page_response(response, EntitySearchItem)
         from nansen._response import APIResponse
 
         return APIResponse(data=items, http_response=response)
@@ -178,6 +182,7 @@ class Profiler(SyncAPIResource):
         date: dict[str, str],
         filters: dict[str, Any] | NotGiven = NOT_GIVEN,
         pagination: dict[str, Any] | NotGiven = NOT_GIVEN,
+        limit: int | NotGiven = NOT_GIVEN,
         order_by: list[dict[str, str]] | NotGiven = NOT_GIVEN,
     ) -> SyncPage[PerpLeaderboardItem]:
         """Get the perpetual futures leaderboard.
@@ -186,6 +191,8 @@ class Profiler(SyncAPIResource):
             date: Date range with ``"from"`` and ``"to"`` keys.
             filters: Field-level filters to narrow results.
             pagination: Pagination options (``page``, ``per_page``).
+            limit: Maximum number of items to fetch across all pages. The page
+                size is picked automatically unless ``pagination`` sets ``per_page``.
             order_by: List of ordering directives.
         """
         return self._post_page(
@@ -197,6 +204,7 @@ class Profiler(SyncAPIResource):
                 "order_by": order_by,
             },
             model=PerpLeaderboardItem,
+            limit=limit,
         )
 
 
@@ -246,6 +254,7 @@ class AsyncProfiler(AsyncAPIResource):
         date: dict[str, str] | NotGiven = NOT_GIVEN,
         filters: dict[str, Any] | NotGiven = NOT_GIVEN,
         pagination: dict[str, Any] | NotGiven = NOT_GIVEN,
+        limit: int | NotGiven = NOT_GIVEN,
         order_by: list[dict[str, str]] | NotGiven = NOT_GIVEN,
     ) -> AsyncPage[PnlItem]:
         """Get detailed PnL data for an address or entity.
@@ -259,6 +268,8 @@ class AsyncProfiler(AsyncAPIResource):
             date: Date range with ``"from"`` and ``"to"`` keys.
             filters: Field-level filters to narrow results.
             pagination: Pagination options (``page``, ``per_page``).
+            limit: Maximum number of items to fetch across all pages. The page
+                size is picked automatically unless ``pagination`` sets ``per_page``.
             order_by: List of ordering directives.
         """
         return await self._post_page(
@@ -273,6 +284,7 @@ class AsyncProfiler(AsyncAPIResource):
                 "order_by": order_by,
             },
             model=PnlItem,
+            limit=limit,
         )
 
     async def perp_positions(
@@ -306,6 +318,7 @@ class AsyncProfiler(AsyncAPIResource):
         date: dict[str, str],
         filters: dict[str, Any] | NotGiven = NOT_GIVEN,
         pagination: dict[str, Any] | NotGiven = NOT_GIVEN,
+        limit: int | NotGiven = NOT_GIVEN,
         order_by: list[dict[str, str]] | NotGiven = NOT_GIVEN,
     ) -> AsyncPage[ProfilerPerpTradeItem]:
         """Get perpetual futures trade history for an address.
@@ -315,6 +328,8 @@ class AsyncProfiler(AsyncAPIResource):
             date: Date range with ``"from"`` and ``"to"`` keys.
             filters: Field-level filters to narrow results.
             pagination: Pagination options (``page``, ``per_page``).
+            limit: Maximum number of items to fetch across all pages. The page
+                size is picked automatically unless ``pagination`` sets ``per_page``.
             order_by: List of ordering directives.
         """
         return await self._post_page(
@@ -327,6 +342,7 @@ class AsyncProfiler(AsyncAPIResource):
                 "order_by": order_by,
             },
             model=ProfilerPerpTradeItem,
+            limit=limit,
         )
 
     async def entity_search(
@@ -340,16 +356,12 @@ class AsyncProfiler(AsyncAPIResource):
             search_query: Search term to match against entity names.
         """
 
-        from pydantic import TypeAdapter
-
         response = await self._client._request(
             "POST",
             "/search/entity-name",
             body={"search_query": search_query},
         )
-        body = response.json()
-        raw_data = body.get("data", [])
-        items = TypeAdapter(list[EntitySearchItem]).validate_python(raw_data)
+        items, _ = self._client._parse_page_response(response, EntitySearchItem)
         from nansen._response import APIResponse
 
         return APIResponse(data=items, http_response=response)
@@ -360,6 +372,7 @@ class AsyncProfiler(AsyncAPIResource):
         date: dict[str, str],
         filters: dict[str, Any] | NotGiven = NOT_GIVEN,
         pagination: dict[str, Any] | NotGiven = NOT_GIVEN,
+        limit: int | NotGiven = NOT_GIVEN,
         order_by: list[dict[str, str]] | NotGiven = NOT_GIVEN,
     ) -> AsyncPage[PerpLeaderboardItem]:
         """Get the perpetual futures leaderboard.
@@ -368,6 +381,8 @@ class AsyncProfiler(AsyncAPIResource):
             date: Date range with ``"from"`` and ``"to"`` keys.
             filters: Field-level filters to narrow results.
             pagination: Pagination options (``page``, ``per_page``).
+            limit: Maximum number of items to fetch across all pages. The page
+                size is picked automatically unless ``pagination`` sets ``per_page``.
             order_by: List of ordering directives.
         """
         return await self._post_page(
@@ -379,4 +394,5 @@ class AsyncProfiler(AsyncAPIResource):
                 "order_by": order_by,
             },
             model=PerpLeaderboardItem,
+            limit=limit,
         )
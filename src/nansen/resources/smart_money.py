@@ -24,6 +24,7 @@ class SmartMoney(SyncAPIResource):
         chains: list[str],
         filters: dict[str, Any] | NotGiven = NOT_GIVEN,
         pagination: dict[str, Any] | NotGiven = NOT_GIVEN,
+        limit: int | NotGiven = NOT_GIVEN,
         order_by: list[dict[str, str]] | NotGiven = NOT_GIVEN,
     ) -> SyncPage[SmartMoneyNetflowItem]:
         """Get smart money netflow data across chains.
@@ -32,6 +33,8 @@ class SmartMoney(SyncAPIResource):
             chains: List of chain identifiers (e.g. ``["ethereum"]``).
             filters: Field-level filters to narrow results.
             pagination: Pagination options (``page``, ``per_page``).
+            limit: Maximum number of items to fetch across all pages. The page
+                size is picked automatically unless ``pagination`` sets ``per_page``.
             order_by: List of ordering directives.
         """
         return self._post_page(
@@ -43,6 +46,7 @@ class SmartMoney(SyncAPIResource):
                 "order_by": order_by,
             },
             model=SmartMoneyNetflowItem,
+            limit=limit,
         )
 
     def dex_trades(
@@ -51,6 +55,7 @@ class SmartMoney(SyncAPIResource):
         chains: list[str],
         filters: dict[str, Any] | NotGiven = NOT_GIVEN,
         pagination: dict[str, Any] | NotGiven = NOT_GIVEN,
+        limit: int | NotGiven = NOT_GIVEN,
         order_by: list[dict[str, str]] | NotGiven = NOT_GIVEN,
     ) -> SyncPage[SmartMoneyDexTradeItem]:
         """Get smart money DEX trades across chains.
@@ -59,6 +64,8 @@ class SmartMoney(SyncAPIResource):
             chains: List of chain identifiers (e.g. ``["ethereum"]``).
             filters: Field-level filters to narrow results.
             pagination: Pagination options (``page``, ``per_page``).
+            limit: Maximum number of items to fetch across all pages. The page
+                size is picked automatically unless ``pagination`` sets ``per_page``.
             order_by: List of ordering directives.
         """
         return self._post_page(
@@ -70,6 +77,7 @@ class SmartMoney(SyncAPIResource):
                 "order_by": order_by,
             },
             model=SmartMoneyDexTradeItem,
+            limit=limit,
         )
 
     def perp_trades(
@@ -78,6 +86,7 @@ class SmartMoney(SyncAPIResource):
         filters: dict[str, Any] | NotGiven = NOT_GIVEN,
         only_new_positions: bool | NotGiven = NOT_GIVEN,
         pagination: dict[str, Any] | NotGiven = NOT_GIVEN,
+        limit: int | NotGiven = NOT_GIVEN,
         order_by: list[dict[str, str]] | NotGiven = NOT_GIVEN,
     ) -> SyncPage[SmartMoneyPerpTradeItem]:
         """Get smart money perpetual futures trades.
@@ -86,6 +95,8 @@ class SmartMoney(SyncAPIResource):
             filters: Field-level filters to narrow results.
             only_new_positions: If ``True``, only return trades that open new positions.
             pagination: Pagination options (``page``, ``per_page``).
+            limit: Maximum number of items to fetch across all pages. The page
+                size is picked automatically unless ``pagination`` sets ``per_page``.
             order_by: List of ordering directives.
         """
         return self._post_page(
@@ -97,6 +108,7 @@ class SmartMoney(SyncAPIResource):
                 "order_by": order_by,
             },
             model=SmartMoneyPerpTradeItem,
+            limit=limit,
         )
 
     def dcas(
@@ -104,6 +116,7 @@ class SmartMoney(SyncAPIResource):
         *,
         filters: dict[str, Any] | NotGiven = NOT_GIVEN,
         pagination: dict[str, Any] | NotGiven = NOT_GIVEN,
+        limit: int | NotGiven = NOT_GIVEN,
         order_by: list[dict[str, str]] | NotGiven = NOT_GIVEN,
     ) -> SyncPage[SmartMoneyDcaItem]:
         """Get smart money DCA orders.
@@ -111,6 +124,8 @@ class SmartMoney(SyncAPIResource):
         Args:
             filters: Field-level filters to narrow results.
             pagination: Pagination options (``page``, ``per_page``).
+            limit: Maximum number of items to fetch across all pages. The page
+                size is picked automatically unless ``pagination`` sets ``per_page``.
             order_by: List of ordering directives.
         """
         return self._post_page(
@@ -121,6 +136,7 @@ class SmartMoney(SyncAPIResource):
                 "order_by": order_by,
             },
             model=SmartMoneyDcaItem,
+            limit=limit,
         )
 
     def holdings(
@@ -129,6 +145,7 @@ class SmartMoney(SyncAPIResource):
         chains: list[str],
         filters: dict[str, Any] | NotGiven = NOT_GIVEN,
         pagination: dict[str, Any] | NotGiven = NOT_GIVEN,
+        limit: int | NotGiven = NOT_GIVEN,
         order_by: list[dict[str, str]] | NotGiven = NOT_GIVEN,
     ) -> SyncPage[SmartMoneyHoldingItem]:
         """Get current smart money holdings across chains.
@@ -137,6 +154,8 @@ class SmartMoney(SyncAPIResource):
             chains: List of chain identifiers (e.g. ``["ethereum"]``).
             filters: Field-level filters to narrow results.
             pagination: Pagination options (``page``, ``per_page``).
+            limit: Maximum number of items to fetch across all pages. The page
+                size is picked automatically unless ``pagination`` sets ``per_page``.
             order_by: List of ordering directives.
         """
         return self._post_page(
@@ -148,6 +167,7 @@ class SmartMoney(SyncAPIResource):
                 "order_by": order_by,
             },
             model=SmartMoneyHoldingItem,
+            limit=limit,
         )
 
     def historical_holdings(
@@ -157,6 +177,7 @@ class SmartMoney(SyncAPIResource):
         chains: list[str],
         filters: dict[str, Any] | NotGiven = NOT_GIVEN,
         pagination: dict[str, Any] | NotGiven = NOT_GIVEN,
+        limit: int | NotGiven = NOT_GIVEN,
         order_by: list[dict[str, str]] | NotGiven = NOT_GIVEN,
     ) -> SyncPage[SmartMoneyHistoricalHoldingItem]:
         """Get historical smart money holdings across chains.
@@ -166,6 +187,8 @@ class SmartMoney(SyncAPIResource):
             chains: List of chain identifiers (e.g. ``["ethereum"]``).
             filters: Field-level filters to narrow results.
             pagination: Pagination options (``page``, ``per_page``).
+            limit: Maximum number of items to fetch across all pages. The page
+                size is picked automatically unless ``pagination`` sets ``per_page``.
             order_by: List of ordering directives.
         """
         return self._post_page(
@@ -178,6 +201,7 @@ class SmartMoney(SyncAPIResource):
                 "order_by": order_by,
             },
             model=SmartMoneyHistoricalHoldingItem,
+            limit=limit,
         )
 
 
@@ -190,6 +214,7 @@ class AsyncSmartMoney(AsyncAPIResource):
         chains: list[str],
         filters: dict[str, Any] | NotGiven = NOT_GIVEN,
         pagination: dict[str, Any] | NotGiven = NOT_GIVEN,
+        limit: int | NotGiven = NOT_GIVEN,
         order_by: list[dict[str, str]] | NotGiven = NOT_GIVEN,
     ) -> AsyncPage[SmartMoneyNetflowItem]:
         """Get smart money netflow data across chains.
@@ -198,6 +223,8 @@ class AsyncSmartMoney(AsyncAPIResource):
             chains: List of chain identifiers (e.g. ``["ethereum"]``).
             filters: Field-level filters to narrow results.
             pagination: Pagination options (``page``, ``per_page``).
+            limit: Maximum number of items to fetch across all pages. The page
+                size is picked automatically unless ``pagination`` sets ``per_page``.
             order_by: List of ordering directives.
         """
         return await self._post_page(
@@ -209,6 +236,7 @@ class AsyncSmartMoney(AsyncAPIResource):
                 "order_by": order_by,
             },
             model=SmartMoneyNetflowItem,
+            limit=limit,
         )
 
     async def dex_trades(
@@ -217,6 +245,7 @@ class AsyncSmartMoney(AsyncAPIResource):
         chains: list[str],
         filters: dict[str, Any] | NotGiven = NOT_GIVEN,
         pagination: dict[str, Any] | NotGiven = NOT_GIVEN,
+        limit: int | NotGiven = NOT_GIVEN,
         order_by: list[dict[str, str]] | NotGiven = NOT_GIVEN,
     ) -> AsyncPage[SmartMoneyDexTradeItem]:
         """Get smart money DEX trades across chains.
@@ -225,6 +254,8 @@ class AsyncSmartMoney(AsyncAPIResource):
             chains: List of chain identifiers (e.g. ``["ethereum"]``).
             filters: Field-level filters to narrow results.
             pagination: Pagination options (``page``, ``per_page``).
+            limit: Maximum number of items to fetch across all pages. The page
+                size is picked automatically unless ``pagination`` sets ``per_page``.
             order_by: List of ordering directives.
         """
         return await self._post_page(
@@ -236,6 +267,7 @@ class AsyncSmartMoney(AsyncAPIResource):
                 "order_by": order_by,
             },
             model=SmartMoneyDexTradeItem,
+            limit=limit,
         )
 
     async def perp_trades(
@@ -244,6 +276,7 @@ class AsyncSmartMoney(AsyncAPIResource):
         filters: dict[str, Any] | NotGiven = NOT_GIVEN,
         only_new_positions: bool | NotGiven = NOT_GIVEN,
         pagination: dict[str, Any] | NotGiven = NOT_GIVEN,
+        limit: int | NotGiven = NOT_GIVEN,
         order_by: list[dict[str, str]] | NotGiven = NOT_GIVEN,
     ) -> AsyncPage[SmartMoneyPerpTradeItem]:
         """Get smart money perpetual futures trades.
@@ -252,6 +285,8 @@ class AsyncSmartMoney(AsyncAPIResource):
             filters: Field-level filters to narrow results.
             only_new_positions: If ``True``, only return trades that open new positions.
             pagination: Pagination options (``page``, ``per_page``).
+            limit: Maximum number of items to fetch across all pages. The page
+                size is picked automatically unless ``pagination`` sets ``per_page``.
             order_by: List of ordering directives.
         """
         return await self._post_page(
@@ -263,6 +298,7 @@ class AsyncSmartMoney(AsyncAPIResource):
                 "order_by": order_by,
             },
             model=SmartMoneyPerpTradeItem,
+            limit=limit,
         )
 
     async def dcas(
@@ -270,6 +306,7 @@ class AsyncSmartMoney(AsyncAPIResource):
         *,
         filters: dict[str, Any] | NotGiven = NOT_GIVEN,
         pagination: dict[str, Any] | NotGiven = NOT_GIVEN,
+        limit: int | NotGiven = NOT_GIVEN,
         order_by: list[dict[str, str]] | NotGiven = NOT_GIVEN,
     ) -> AsyncPage[SmartMoneyDcaItem]:
         """Get smart money DCA orders.
@@ -277,6 +314,8 @@ class AsyncSmartMoney(AsyncAPIResource):
         Args:
             filters: Field-level filters to narrow results.
             pagination: Pagination options (``page``, ``per_page``).
+            limit: Maximum number of items to fetch across all pages. The page
+                size is picked automatically unless ``pagination`` sets ``per_page``.
             order_by: List of ordering directives.
         """
         return await self._post_page(
@@ -287,6 +326,7 @@ class AsyncSmartMoney(AsyncAPIResource):
                 "order_by": order_by,
             },
             model=SmartMoneyDcaItem,
+            limit=limit,
         )
 
     async def holdings(
@@ -295,6 +335,7 @@ class AsyncSmartMoney(AsyncAPIResource):
         chains: list[str],
         filters: dict[str, Any] | NotGiven = NOT_GIVEN,
         pagination: dict[str, Any] | NotGiven = NOT_GIVEN,
+        limit: int | NotGiven = NOT_GIVEN,
         order_by: list[dict[str, str]] | NotGiven = NOT_GIVEN,
     ) -> AsyncPage[SmartMoneyHoldingItem]:
         """Get current smart money holdings across chains.
@@ -303,6 +344,8 @@ class AsyncSmartMoney(AsyncAPIResource):
             chains: List of chain identifiers (e.g. ``["ethereum"]``).
             filters: Field-level filters to narrow results.
             pagination: Pagination options (``page``, ``per_page``).
+            limit: Maximum number of items to fetch across all pages. The page
+                size is picked automatically unless ``pagination`` sets ``per_page``.
             order_by: List of ordering directives.
         """
         return await self._post_page(
@@ -314,6 +357,7 @@ class AsyncSmartMoney(AsyncAPIResource):
                 "order_by": order_by,
             },
             model=SmartMoneyHoldingItem,
+            limit=limit,
         )
 
     async def historical_holdings(
@@ -323,6 +367,7 @@ class AsyncSmartMoney(AsyncAPIResource):
         chains: list[str],
         filters: dict[str, Any] | NotGiven = NOT_GIVEN,
         pagination: dict[str, Any] | NotGiven = NOT_GIVEN,
+        limit: int | NotGiven = NOT_GIVEN,
         order_by: list[dict[str, str]] | NotGiven = NOT_GIVEN,
     ) -> AsyncPage[SmartMoneyHistoricalHoldingItem]:
         """Get historical smart money holdings across chains.
@@ -332,6 +377,8 @@ class AsyncSmartMoney(AsyncAPIResource):
             chains: List of chain identifiers (e.g. ``["ethereum"]``).
             filters: Field-level filters to narrow results.
             pagination: Pagination options (``page``, ``per_page``).
+            limit: Maximum number of items to fetch across all pages. The page
+                size is picked automatically unless ``pagination`` sets ``per_page``.
             order_by: List of ordering directives.
         """
         return await self._post_page(
@@ -344,4 +391,5 @@ class AsyncSmartMoney(AsyncAPIResource):
                 "order_by": order_by,
             },
             model=SmartMoneyHistoricalHoldingItem,
+            limit=limit,
         )
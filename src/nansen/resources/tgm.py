@@ -1,10 +1,18 @@
 from __future__ import annotations
 
-from typing import Any
+from collections.abc import Iterable
+from typing import TYPE_CHECKING, Any
 
+from nansen._constants import (
+    DEFAULT_FAN_OUT_CONCURRENCY,
+    TOKEN_INFO_CACHE_SIZE,
+    TOKEN_INFO_CACHE_TTL,
+)
+from nansen._fanout import fan_out, fan_out_async
 from nansen._pagination import AsyncPage, SyncPage
 from nansen._response import APIResponse
 from nansen._types import NOT_GIVEN, NotGiven
+from nansen._utils._ttl_cache import TTLCache
 from nansen.resources._base import AsyncAPIResource, SyncAPIResource
 from nansen.types.tgm import (
     FlowIntelItem,
@@ -23,10 +31,29 @@ from nansen.types.tgm import (
     WhoBoughtSoldItem,
 )
 
+if TYPE_CHECKING:
+    from nansen._base_client import AsyncAPIClient, SyncAPIClient
+
+_TokenKey = tuple[str, str, str]
+
+
+def _token_key(token: tuple[str, str], timeframe: str) -> _TokenKey:
+    chain, address = token
+    # EVM addresses are case-insensitive; other chains' addresses are not.
+    return (chain, address.lower() if address.startswith("0x") else address, timeframe)
+
+
+def _token_info_cache() -> TTLCache[_TokenKey, TokenInformationResponse]:
+    return TTLCache(maxsize=TOKEN_INFO_CACHE_SIZE, ttl=TOKEN_INFO_CACHE_TTL)
+
 
 class TGM(SyncAPIResource):
     """Token God Mode resource for token-level analytics."""
 
+    def __init__(self, client: SyncAPIClient) -> None:
+        super().__init__(client)
+        self._token_info_cache = _token_info_cache()
+
     def token_screener(
         self,
         *,
@@ -35,6 +62,7 @@ class TGM(SyncAPIResource):
         date: dict[str, str] | NotGiven = NOT_GIVEN,
         filters: dict[str, Any] | NotGiven = NOT_GIVEN,
         pagination: dict[str, Any] | NotGiven = NOT_GIVEN,
+        limit: int | NotGiven = NOT_GIVEN,
         order_by: list[dict[str, str]] | NotGiven = NOT_GIVEN,
     ) -> SyncPage[TokenScreenerItem]:
         """Screen tokens across one or more chains.
@@ -45,6 +73,8 @@ class TGM(SyncAPIResource):
             date: Date range filter with ``"from"`` and ``"to"`` keys.
             filters: Field-level filters to narrow results.
             pagination: Pagination options (``page``, ``per_page``).
+            limit: Maximum number of items to fetch across all pages. The page
+                size is picked automatically unless ``pagination`` sets ``per_page``.
             order_by: List of ordering directives
                 (e.g. ``[{"field": "volume", "direction": "desc"}]``).
         """
@@ -59,6 +89,7 @@ class TGM(SyncAPIResource):
                 "order_by": order_by,
             },
             model=TokenScreenerItem,
+            limit=limit,
         )
 
     def token_information(
@@ -85,6 +116,47 @@ class TGM(SyncAPIResource):
             model=TokenInformationResponse,
         )
 
+    def token_information_many(
+        self,
+        *,
+        tokens: Iterable[tuple[str, str]],
+        timeframe: str,
+        max_concurrency: int = DEFAULT_FAN_OUT_CONCURRENCY,
+    ) -> dict[tuple[str, str], TokenInformationResponse]:
+        """Get token information for many ``(chain, token_address)`` pairs.
+
+        Duplicate pairs are looked up once, results seen within the last
+        few minutes are served from a per-client cache, and the remaining
+        tokens are fetched concurrently. If any lookup fails, the first
+        error is raised after the others have completed and been cached.
+
+        Args:
+            tokens: ``(chain, token_address)`` pairs to look up.
+            timeframe: Timeframe for the data (e.g. ``"24h"``).
+            max_concurrency: Maximum number of requests in flight at once.
+
+        Returns:
+            A dict keyed by the pairs as given.
+        """
+        keys = {token: _token_key(token, timeframe) for token in tokens}
+        found: dict[_TokenKey, TokenInformationResponse] = {}
+        for key in keys.values():
+            cached = self._token_info_cache.get(key)
+            if cached is not None:
+                found[key] = cached
+        fetched = fan_out(
+            lambda key: (
+                self.token_information(chain=key[0], token_address=key[1], timeframe=timeframe).data
+            ),
+            (key for key in keys.values() if key not in found),
+            max_concurrency=max_concurrency,
+        )
+        for key, info in fetched.results.items():
+            self._token_info_cache.set(key, info)
+            found[key] = info
+        fetched.raise_for_errors()
+        return {token: found[key] for token, key in keys.items()}
+
     def flow_intel(
         self,
         *,
@@ -123,6 +195,7 @@ class TGM(SyncAPIResource):
         aggregate_by_entity: bool | NotGiven = NOT_GIVEN,
         filters: dict[str, Any] | NotGiven = NOT_GIVEN,
         pagination: dict[str, Any] | NotGiven = NOT_GIVEN,
+        limit: int | NotGiven = NOT_GIVEN,
         order_by: list[dict[str, str]] | NotGiven = NOT_GIVEN,
     ) -> SyncPage[HolderItem]:
         """Get holder data for a token.
@@ -134,6 +207,8 @@ class TGM(SyncAPIResource):
             aggregate_by_entity: If ``True``, aggregate holdings by entity.
             filters: Field-level filters to narrow results.
             pagination: Pagination options (``page``, ``per_page``).
+            limit: Maximum number of items to fetch across all pages. The page
+                size is picked automatically unless ``pagination`` sets ``per_page``.
             order_by: List of ordering directives.
         """
         return self._post_page(
@@ -148,6 +223,7 @@ class TGM(SyncAPIResource):
                 "order_by": order_by,
             },
             model=HolderItem,
+            limit=limit,
         )
 
     def flows(
@@ -159,6 +235,7 @@ class TGM(SyncAPIResource):
         label: str | NotGiven = NOT_GIVEN,
         filters: dict[str, Any] | NotGiven = NOT_GIVEN,
         pagination: dict[str, Any] | NotGiven = NOT_GIVEN,
+        limit: int | NotGiven = NOT_GIVEN,
         order_by: list[dict[str, str]] | NotGiven = NOT_GIVEN,
     ) -> SyncPage[FlowItem]:
         """Get token flow data within a date range.
@@ -170,6 +247,8 @@ class TGM(SyncAPIResource):
             label: Filter flows by wallet label.
             filters: Field-level filters to narrow results.
             pagination: Pagination options (``page``, ``per_page``).
+            limit: Maximum number of items to fetch across all pages. The page
+                size is picked automatically unless ``pagination`` sets ``per_page``.
             order_by: List of ordering directives.
         """
         return self._post_page(
@@ -184,6 +263,7 @@ class TGM(SyncAPIResource):
                 "order_by": order_by,
             },
             model=FlowItem,
+            limit=limit,
         )
 
     def who_bought_sold(
@@ -195,6 +275,7 @@ class TGM(SyncAPIResource):
         buy_or_sell: str | NotGiven = NOT_GIVEN,
         filters: dict[str, Any] | NotGiven = NOT_GIVEN,
         pagination: dict[str, Any] | NotGiven = NOT_GIVEN,
+        limit: int | NotGiven = NOT_GIVEN,
         order_by: list[dict[str, str]] | NotGiven = NOT_GIVEN,
     ) -> SyncPage[WhoBoughtSoldItem]:
         """Get buy/sell activity for a token.
@@ -206,6 +287,8 @@ class TGM(SyncAPIResource):
             buy_or_sell: Filter by ``"buy"`` or ``"sell"`` side.
             filters: Field-level filters to narrow results.
             pagination: Pagination options (``page``, ``per_page``).
+            limit: Maximum number of items to fetch across all pages. The page
+                size is picked automatically unless ``pagination`` sets ``per_page``.
             order_by: List of ordering directives.
         """
         return self._post_page(
@@ -220,6 +303,7 @@ class TGM(SyncAPIResource):
                 "order_by": order_by,
             },
             model=WhoBoughtSoldItem,
+            limit=limit,
         )
 
     def dex_trades(
@@ -231,6 +315,7 @@ class TGM(SyncAPIResource):
         only_smart_money: bool | NotGiven = NOT_GIVEN,
         filters: dict[str, Any] | NotGiven = NOT_GIVEN,
         pagination: dict[str, Any] | NotGiven = NOT_GIVEN,
+        limit: int | NotGiven = NOT_GIVEN,
         order_by: list[dict[str, str]] | NotGiven = NOT_GIVEN,
     ) -> SyncPage[TgmDexTradeItem]:
         """Get DEX trade history for a token.
@@ -242,6 +327,8 @@ class TGM(SyncAPIResource):
             only_smart_money: If ``True``, only return trades from smart money wallets.
             filters: Field-level filters to narrow results.
             pagination: Pagination options (``page``, ``per_page``).
+            limit: Maximum number of items to fetch across all pages. The page
+                size is picked automatically unless ``pagination`` sets ``per_page``.
             order_by: List of ordering directives.
         """
         return self._post_page(
@@ -256,6 +343,7 @@ class TGM(SyncAPIResource):
                 "order_by": order_by,
             },
             model=TgmDexTradeItem,
+            limit=limit,
         )
 
     def transfers(
@@ -266,6 +354,7 @@ class TGM(SyncAPIResource):
         date: dict[str, str],
         filters: dict[str, Any] | NotGiven = NOT_GIVEN,
         pagination: dict[str, Any] | NotGiven = NOT_GIVEN,
+        limit: int | NotGiven = NOT_GIVEN,
         order_by: list[dict[str, str]] | NotGiven = NOT_GIVEN,
     ) -> SyncPage[TransferItem]:
         """Get transfer history for a token.
@@ -276,6 +365,8 @@ class TGM(SyncAPIResource):
             date: Date range with ``"from"`` and ``"to"`` keys.
             filters: Field-level filters to narrow results.
             pagination: Pagination options (``page``, ``per_page``).
+            limit: Maximum number of items to fetch across all pages. The page
+                size is picked automatically unless ``pagination`` sets ``per_page``.
             order_by: List of ordering directives.
         """
         return self._post_page(
@@ -289,6 +380,7 @@ class TGM(SyncAPIResource):
                 "order_by": order_by,
             },
             model=TransferItem,
+            limit=limit,
         )
 
     def dcas(
@@ -297,6 +389,7 @@ class TGM(SyncAPIResource):
         token_address: str,
         filters: dict[str, Any] | NotGiven = NOT_GIVEN,
         pagination: dict[str, Any] | NotGiven = NOT_GIVEN,
+        limit: int | NotGiven = NOT_GIVEN,
     ) -> SyncPage[TgmDcaItem]:
         """Get Jupiter DCA orders for a token (Solana only).
 
@@ -304,6 +397,8 @@ class TGM(SyncAPIResource):
             token_address: Token mint address.
             filters: Field-level filters to narrow results.
             pagination: Pagination options (``page``, ``per_page``).
+            limit: Maximum number of items to fetch across all pages. The page
+                size is picked automatically unless ``pagination`` sets ``per_page``.
         """
         return self._post_page(
             "/tgm/jup-dca",
@@ -313,6 +408,7 @@ class TGM(SyncAPIResource):
                 "pagination": pagination,
             },
             model=TgmDcaItem,
+            limit=limit,
         )
 
     def pnl_leaderboard(
@@ -323,6 +419,7 @@ class TGM(SyncAPIResource):
         date: dict[str, str],
         filters: dict[str, Any] | NotGiven = NOT_GIVEN,
         pagination: dict[str, Any] | NotGiven = NOT_GIVEN,
+        limit: int | NotGiven = NOT_GIVEN,
         order_by: list[dict[str, str]] | NotGiven = NOT_GIVEN,
     ) -> SyncPage[PnlLeaderboardItem]:
         """Get the PnL leaderboard for a token.
@@ -333,6 +430,8 @@ class TGM(SyncAPIResource):
             date: Date range with ``"from"`` and ``"to"`` keys.
             filters: Field-level filters to narrow results.
             pagination: Pagination options (``page``, ``per_page``).
+            limit: Maximum number of items to fetch across all pages. The page
+                size is picked automatically unless ``pagination`` sets ``per_page``.
             order_by: List of ordering directives.
         """
         return self._post_page(
@@ -346,6 +445,7 @@ class TGM(SyncAPIResource):
                 "order_by": order_by,
             },
             model=PnlLeaderboardItem,
+            limit=limit,
         )
 
     def perp_screener(
@@ -354,6 +454,7 @@ class TGM(SyncAPIResource):
         date: dict[str, str],
         filters: dict[str, Any] | NotGiven = NOT_GIVEN,
         pagination: dict[str, Any] | NotGiven = NOT_GIVEN,
+        limit: int | NotGiven = NOT_GIVEN,
         order_by: list[dict[str, str]] | NotGiven = NOT_GIVEN,
     ) -> SyncPage[PerpScreenerItem]:
         """Screen perpetual futures contracts.
@@ -362,6 +463,8 @@ class TGM(SyncAPIResource):
             date: Date range with ``"from"`` and ``"to"`` keys.
             filters: Field-level filters to narrow results.
             pagination: Pagination options (``page``, ``per_page``).
+            limit: Maximum number of items to fetch across all pages. The page
+                size is picked automatically unless ``pagination`` sets ``per_page``.
             order_by: List of ordering directives.
         """
         return self._post_page(
@@ -373,6 +476,7 @@ class TGM(SyncAPIResource):
                 "order_by": order_by,
             },
             model=PerpScreenerItem,
+            limit=limit,
         )
 
     def perp_pnl_leaderboard(
@@ -382,6 +486,7 @@ class TGM(SyncAPIResource):
         date: dict[str, str],
         filters: dict[str, Any] | NotGiven = NOT_GIVEN,
         pagination: dict[str, Any] | NotGiven = NOT_GIVEN,
+        limit: int | NotGiven = NOT_GIVEN,
         order_by: list[dict[str, str]] | NotGiven = NOT_GIVEN,
     ) -> SyncPage[PerpPnlLeaderboardItem]:
         """Get the perpetual futures PnL leaderboard for a token.
@@ -391,6 +496,8 @@ class TGM(SyncAPIResource):
             date: Date range with ``"from"`` and ``"to"`` keys.
             filters: Field-level filters to narrow results.
             pagination: Pagination options (``page``, ``per_page``).
+            limit: Maximum number of items to fetch across all pages. The page
+                size is picked automatically unless ``pagination`` sets ``per_page``.
             order_by: List of ordering directives.
         """
         return self._post_page(
@@ -403,6 +510,7 @@ class TGM(SyncAPIResource):
                 "order_by": order_by,
             },
             model=PerpPnlLeaderboardItem,
+            limit=limit,
         )
 
     def perp_positions(
@@ -412,6 +520,7 @@ class TGM(SyncAPIResource):
         label_type: str | NotGiven = NOT_GIVEN,
         filters: dict[str, Any] | NotGiven = NOT_GIVEN,
         pagination: dict[str, Any] | NotGiven = NOT_GIVEN,
+        limit: int | NotGiven = NOT_GIVEN,
         order_by: list[dict[str, str]] | NotGiven = NOT_GIVEN,
     ) -> SyncPage[TgmPerpPositionItem]:
         """Get open perpetual futures positions for a token.
@@ -421,6 +530,8 @@ class TGM(SyncAPIResource):
             label_type: Filter positions by wallet label type.
             filters: Field-level filters to narrow results.
             pagination: Pagination options (``page``, ``per_page``).
+            limit: Maximum number of items to fetch across all pages. The page
+                size is picked automatically unless ``pagination`` sets ``per_page``.
             order_by: List of ordering directives.
         """
         return self._post_page(
@@ -433,6 +544,7 @@ class TGM(SyncAPIResource):
                 "order_by": order_by,
             },
             model=TgmPerpPositionItem,
+            limit=limit,
         )
 
     def perp_trades(
@@ -442,6 +554,7 @@ class TGM(SyncAPIResource):
         date: dict[str, str],
         filters: dict[str, Any] | NotGiven = NOT_GIVEN,
         pagination: dict[str, Any] | NotGiven = NOT_GIVEN,
+        limit: int | NotGiven = NOT_GIVEN,
         order_by: list[dict[str, str]] | NotGiven = NOT_GIVEN,
     ) -> SyncPage[TgmPerpTradeItem]:
         """Get perpetual futures trade history for a token.
@@ -451,6 +564,8 @@ class TGM(SyncAPIResource):
             date: Date range with ``"from"`` and ``"to"`` keys.
             filters: Field-level filters to narrow results.
             pagination: Pagination options (``page``, ``per_page``).
+            limit: Maximum number of items to fetch across all pages. The page
+                size is picked automatically unless ``pagination`` sets ``per_page``.
             order_by: List of ordering directives.
         """
         return self._post_page(
@@ -463,12 +578,17 @@ class TGM(SyncAPIResource):
                 "order_by": order_by,
             },
             model=TgmPerpTradeItem,
+            limit=limit,
         )
 
 
 class AsyncTGM(AsyncAPIResource):
     """Token God Mode resource for token-level analytics (async)."""
 
+    def __init__(self, client: AsyncAPIClient) -> None:
+        super().__init__(client)
+        self._token_info_cache = _token_info_cache()
+
     async def token_screener(
         self,
         *,
@@ -477,6 +597,7 @@ class AsyncTGM(AsyncAPIResource):
         date: dict[str, str] | NotGiven = NOT_GIVEN,
         filters: dict[str, Any] | NotGiven = NOT_GIVEN,
         pagination: dict[str, Any] | NotGiven = NOT_GIVEN,
+        limit: int | NotGiven = NOT_GIVEN,
         order_by: list[dict[str, str]] | NotGiven = NOT_GIVEN,
     ) -> AsyncPage[TokenScreenerItem]:
         """Screen tokens across one or more chains.
@@ -487,6 +608,8 @@ class AsyncTGM(AsyncAPIResource):
             date: Date range filter with ``"from"`` and ``"to"`` keys.
             filters: Field-level filters to narrow results.
             pagination: Pagination options (``page``, ``per_page``).
+            limit: Maximum number of items to fetch across all pages. The page
+                size is picked automatically unless ``pagination`` sets ``per_page``.
             order_by: List of ordering directives
                 (e.g. ``[{"field": "volume", "direction": "desc"}]``).
         """
@@ -501,6 +624,7 @@ class AsyncTGM(AsyncAPIResource):
                 "order_by": order_by,
             },
             model=TokenScreenerItem,
+            limit=limit,
         )
 
     async def token_information(
@@ -527,6 +651,53 @@ class AsyncTGM(AsyncAPIResource):
             model=TokenInformationResponse,
         )
 
+    async def token_information_many(
+        self,
+        *,
+        tokens: Iterable[tuple[str, str]],
+        timeframe: str,
+        max_concurrency: int = DEFAULT_FAN_OUT_CONCURRENCY,
+    ) -> dict[tuple[str, str], TokenInformationResponse]:
+        """Get token information for many ``(chain, token_address)`` pairs.
+
+        Duplicate pairs are looked up once, results seen within the last
+        few minutes are served from a per-client cache, and the remaining
+        tokens are fetched concurrently. If any lookup fails, the first
+        error is raised after the others have completed and been cached.
+
+        Args:
+            tokens: ``(chain, token_address)`` pairs to look up.
+            timeframe: Timeframe for the data (e.g. ``"24h"``).
+            max_concurrency: Maximum number of requests in flight at once.
+
+        Returns:
+            A dict keyed by the pairs as given.
+        """
+        keys = {token: _token_key(token, timeframe) for token in tokens}
+        found: dict[_TokenKey, TokenInformationResponse] = {}
+        for key in keys.values():
+            cached = self._token_info_cache.get(key)
+            if cached is not None:
+                found[key] = cached
+        fetched = await fan_out_async(
+            lambda key: self._token_information_data(key, timeframe),
+            (key for key in keys.values() if key not in found),
+            max_concurrency=max_concurrency,
+        )
+        for key, info in fetched.results.items():
+            self._token_info_cache.set(key, info)
+            found[key] = info
+        fetched.raise_for_errors()
+        return {token: found[key] for token, key in keys.items()}
+
+    async def _token_information_data(
+        self, key: _TokenKey, timeframe: str
+    ) -> TokenInformationResponse:
+        response = await self.token_information(
+            chain=key[0], token_address=key[1], timeframe=timeframe
+        )
+        return response.data
+
     async def flow_intel(
         self,
         *,
@@ -565,6 +736,7 @@ class AsyncTGM(AsyncAPIResource):
         aggregate_by_entity: bool | NotGiven = NOT_GIVEN,
         filters: dict[str, Any] | NotGiven = NOT_GIVEN,
         pagination: dict[str, Any] | NotGiven = NOT_GIVEN,
+        limit: int | NotGiven = NOT_GIVEN,
         order_by: list[dict[str, str]] | NotGiven = NOT_GIVEN,
     ) -> AsyncPage[HolderItem]:
         """Get holder data for a token.
@@ -576,6 +748,8 @@ class AsyncTGM(AsyncAPIResource):
             aggregate_by_entity: If ``True``, aggregate holdings by entity.
             filters: Field-level filters to narrow results.
             pagination: Pagination options (``page``, ``per_page``).
+            limit: Maximum number of items to fetch across all pages. The page
+                size is picked automatically unless ``pagination`` sets ``per_page``.
             order_by: List of ordering directives.
         """
         return await self._post_page(
@@ -590,6 +764,7 @@ class AsyncTGM(AsyncAPIResource):
                 "order_by": order_by,
             },
             model=HolderItem,
+            limit=limit,
         )
 
     async def flows(
@@ -601,6 +776,7 @@ class AsyncTGM(AsyncAPIResource):
         label: str | NotGiven = NOT_GIVEN,
         filters: dict[str, Any] | NotGiven = NOT_GIVEN,
         pagination: dict[str, Any] | NotGiven = NOT_GIVEN,
+        limit: int | NotGiven = NOT_GIVEN,
         order_by: list[dict[str, str]] | NotGiven = NOT_GIVEN,
     ) -> AsyncPage[FlowItem]:
         """Get token flow data within a date range.
@@ -612,6 +788,8 @@ class AsyncTGM(AsyncAPIResource):
             label: Filter flows by wallet label.
             filters: Field-level filters to narrow results.
             pagination: Pagination options (``page``, ``per_page``).
+            limit: Maximum number of items to fetch across all pages. The page
+                size is picked automatically unless ``pagination`` sets ``per_page``.
             order_by: List of ordering directives.
         """
         return await self._post_page(
@@ -626,6 +804,7 @@ class AsyncTGM(AsyncAPIResource):
                 "order_by": order_by,
             },
             model=FlowItem,
+            limit=limit,
         )
 
     async def who_bought_sold(
@@ -637,6 +816,7 @@ class AsyncTGM(AsyncAPIResource):
         buy_or_sell: str | NotGiven = NOT_GIVEN,
         filters: dict[str, Any] | NotGiven = NOT_GIVEN,
         pagination: dict[str, Any] | NotGiven = NOT_GIVEN,
+        limit: int | NotGiven = NOT_GIVEN,
         order_by: list[dict[str, str]] | NotGiven = NOT_GIVEN,
     ) -> AsyncPage[WhoBoughtSoldItem]:
         """Get buy/sell activity for a token.
@@ -648,6 +828,8 @@ class AsyncTGM(AsyncAPIResource):
             buy_or_sell: Filter by ``"buy"`` or ``"sell"`` side.
             filters: Field-level filters to narrow results.
             pagination: Pagination options (``page``, ``per_page``).
+            limit: Maximum number of items to fetch across all pages. The page
+                size is picked automatically unless ``pagination`` sets ``per_page``.
             order_by: List of ordering directives.
         """
         return await self._post_page(
@@ -662,6 +844,7 @@ class AsyncTGM(AsyncAPIResource):
                 "order_by": order_by,
             },
             model=WhoBoughtSoldItem,
+            limit=limit,
         )
 
     async def dex_trades(
@@ -673,6 +856,7 @@ class AsyncTGM(AsyncAPIResource):
         only_smart_money: bool | NotGiven = NOT_GIVEN,
         filters: dict[str, Any] | NotGiven = NOT_GIVEN,
         pagination: dict[str, Any] | NotGiven = NOT_GIVEN,
+        limit: int | NotGiven = NOT_GIVEN,
         order_by: list[dict[str, str]] | NotGiven = NOT_GIVEN,
     ) -> AsyncPage[TgmDexTradeItem]:
         """Get DEX trade history for a token.
@@ -684,6 +868,8 @@ class AsyncTGM(AsyncAPIResource):
             only_smart_money: If ``True``, only return trades from smart money wallets.
             filters: Field-level filters to narrow results.
             pagination: Pagination options (``page``, ``per_page``).
+            limit: Maximum number of items to fetch across all pages. The page
+                size is picked automatically unless ``pagination`` sets ``per_page``.
             order_by: List of ordering directives.
         """
         return await self._post_page(
@@ -698,6 +884,7 @@ class AsyncTGM(AsyncAPIResource):
                 "order_by": order_by,
             },
             model=TgmDexTradeItem,
+            limit=limit,
         )
 
     async def transfers(
@@ -708,6 +895,7 @@ class AsyncTGM(AsyncAPIResource):
         date: dict[str, str],
         filters: dict[str, Any] | NotGiven = NOT_GIVEN,
         pagination: dict[str, Any] | NotGiven = NOT_GIVEN,
+        limit: int | NotGiven = NOT_GIVEN,
         order_by: list[dict[str, str]] | NotGiven = NOT_GIVEN,
     ) -> AsyncPage[TransferItem]:
         """Get transfer history for a token.
@@ -718,6 +906,8 @@ class AsyncTGM(AsyncAPIResource):
             date: Date range with ``"from"`` and ``"to"`` keys.
             filters: Field-level filters to narrow results.
             pagination: Pagination options (``page``, ``per_page``).
+            limit: Maximum number of items to fetch across all pages. The page
+                size is picked automatically unless ``pagination`` sets ``per_page``.
             order_by: List of ordering directives.
         """
         return await self._post_page(
@@ -731,6 +921,7 @@ class AsyncTGM(AsyncAPIResource):
                 "order_by": order_by,
             },
             model=TransferItem,
+            limit=limit,
         )
 
     async def dcas(
@@ -739,6 +930,7 @@ class AsyncTGM(AsyncAPIResource):
         token_address: str,
         filters: dict[str, Any] | NotGiven = NOT_GIVEN,
         pagination: dict[str, Any] | NotGiven = NOT_GIVEN,
+        limit: int | NotGiven = NOT_GIVEN,
     ) -> AsyncPage[TgmDcaItem]:
         """Get Jupiter DCA orders for a token (Solana only).
 
@@ -746,6 +938,8 @@ class AsyncTGM(AsyncAPIResource):
             token_address: Token mint address.
             filters: Field-level filters to narrow results.
             pagination: Pagination options (``page``, ``per_page``).
+            limit: Maximum number of items to fetch across all pages. The page
+                size is picked automatically unless ``pagination`` sets ``per_page``.
         """
         return await self._post_page(
             "/tgm/jup-dca",
@@ -755,6 +949,7 @@ class AsyncTGM(AsyncAPIResource):
                 "pagination": pagination,
             },
             model=TgmDcaItem,
+            limit=limit,
         )
 
     async def pnl_leaderboard(
@@ -765,6 +960,7 @@ class AsyncTGM(AsyncAPIResource):
         date: dict[str, str],
         filters: dict[str, Any] | NotGiven = NOT_GIVEN,
         pagination: dict[str, Any] | NotGiven = NOT_GIVEN,
+        limit: int | NotGiven = NOT_GIVEN,
         order_by: list[dict[str, str]] | NotGiven = NOT_GIVEN,
     ) -> AsyncPage[PnlLeaderboardItem]:
         """Get the PnL leaderboard for a token.
@@ -775,6 +971,8 @@ class AsyncTGM(AsyncAPIResource):
             date: Date range with ``"from"`` and ``"to"`` keys.
             filters: Field-level filters to narrow results.
             pagination: Pagination options (``page``, ``per_page``).
+            limit: Maximum number of items to fetch across all pages. The page
+                size is picked automatically unless ``pagination`` sets ``per_page``.
             order_by: List of ordering directives.
         """
         return await self._post_page(
@@ -788,6 +986,7 @@ class AsyncTGM(AsyncAPIResource):
                 "order_by": order_by,
             },
             model=PnlLeaderboardItem,
+            limit=limit,
         )
 
     async def perp_screener(
@@ -796,6 +995,7 @@ class AsyncTGM(AsyncAPIResource):
         date: dict[str, str],
         filters: dict[str, Any] | NotGiven = NOT_GIVEN,
         pagination: dict[str, Any] | NotGiven = NOT_GIVEN,
+        limit: int | NotGiven = NOT_GIVEN,
         order_by: list[dict[str, str]] | NotGiven = NOT_GIVEN,
     ) -> AsyncPage[PerpScreenerItem]:
         """Screen perpetual futures contracts.
@@ -804,6 +1004,8 @@ class AsyncTGM(AsyncAPIResource):
             date: Date range with ``"from"`` and ``"to"`` keys.
             filters: Field-level filters to narrow results.
             pagination: Pagination options (``page``, ``per_page``).
+            limit: Maximum number of items to fetch across all pages. The page
+                size is picked automatically unless ``pagination`` sets ``per_page``.
             order_by: List of ordering directives.
         """
         return await self._post_page(
@@ -815,6 +1017,7 @@ class AsyncTGM(AsyncAPIResource):
                 "order_by": order_by,
             },
             model=PerpScreenerItem,
+            limit=limit,
         )
 
     async def perp_pnl_leaderboard(
@@ -824,6 +1027,7 @@ class AsyncTGM(AsyncAPIResource):
         date: dict[str, str],
         filters: dict[str, Any] | NotGiven = NOT_GIVEN,
         pagination: dict[str, Any] | NotGiven = NOT_GIVEN,
+        limit: int | NotGiven = NOT_GIVEN,
         order_by: list[dict[str, str]] | NotGiven = NOT_GIVEN,
     ) -> AsyncPage[PerpPnlLeaderboardItem]:
         """Get the perpetual futures PnL leaderboard for a token.
@@ -833,6 +1037,8 @@ class AsyncTGM(AsyncAPIResource):
             date: Date range with ``"from"`` and ``"to"`` keys.
             filters: Field-level filters to narrow results.
             pagination: Pagination options (``page``, ``per_page``).
+            limit: Maximum number of items to fetch across all pages. The page
+                size is picked automatically unless ``pagination`` sets ``per_page``.
             order_by: List of ordering directives.
         """
         return await self._post_page(
@@ -845,6 +1051,7 @@ class AsyncTGM(AsyncAPIResource):
                 "order_by": order_by,
             },
             model=PerpPnlLeaderboardItem,
+            limit=limit,
         )
 
     async def perp_positions(
@@ -854,6 +1061,7 @@ class AsyncTGM(AsyncAPIResource):
         label_type: str | NotGiven = NOT_GIVEN,
         filters: dict[str, Any] | NotGiven = NOT_GIVEN,
         pagination: dict[str, Any] | NotGiven = NOT_GIVEN,
+        limit: int | NotGiven = NOT_GIVEN,
         order_by: list[dict[str, str]] | NotGiven = NOT_GIVEN,
     ) -> AsyncPage[TgmPerpPositionItem]:
         """Get open perpetual futures positions for a token.
@@ -863,6 +1071,8 @@ class AsyncTGM(AsyncAPIResource):
             label_type: Filter positions by wallet label type.
             filters: Field-level filters to narrow results.
             pagination: Pagination options (``page``, ``per_page``).
+            limit: Maximum number of items to fetch across all pages. The page
+                size is picked automatically unless ``pagination`` sets ``per_page``.
             order_by: List of ordering directives.
         """
         return await self._post_page(
@@ -875,6 +1085,7 @@ class AsyncTGM(AsyncAPIResource):
                 "order_by": order_by,
             },
             model=TgmPerpPositionItem,
+            limit=limit,
         )
 
     async def perp_trades(
@@ -884,6 +1095,7 @@ class AsyncTGM(AsyncAPIResource):
         date: dict[str, str],
         filters: dict[str, Any] | NotGiven = NOT_GIVEN,
         pagination: dict[str, Any] | NotGiven = NOT_GIVEN,
+        limit: int | NotGiven = NOT_GIVEN,
         order_by: list[dict[str, str]] | NotGiven = NOT_GIVEN,
     ) -> AsyncPage[TgmPerpTradeItem]:
         """Get perpetual futures trade history for a token.
@@ -893,6 +1105,8 @@ class AsyncTGM(AsyncAPIResource):
             date: Date range with ``"from"`` and ``"to"`` keys.
             filters: Field-level filters to narrow results.
             pagination: Pagination options (``page``, ``per_page``).
+            limit: Maximum number of items to fetch across all pages. The page
+                size is picked automatically unless ``pagination`` sets ``per_page``.
             order_by: List of ordering directives.
         """
         return await self._post_page(
@@ -905,4 +1119,5 @@ class AsyncTGM(AsyncAPIResource):
                 "order_by": order_by,
             },
             model=TgmPerpTradeItem,
+            limit=limit,
         )
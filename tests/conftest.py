@@ -1,3 +1,7 @@
+import json
+from collections.abc import Callable
+
+import httpx
 import pytest
 import respx
 
@@ -19,3 +23,28 @@ def async_client():
 def mock_api():
     with respx.mock(base_url="https://api.nansen.ai/api/v1") as mock:
         yield mock
+
+
+@pytest.fixture
+def holdings_route():
+    """Factory mocking ``/smart-money/holdings`` with *pages* pages of ``rows(page)``."""
+
+    def factory(respx_mock, rows: Callable[[int], list[dict]], *, pages: int = 2):
+        def handler(request: httpx.Request) -> httpx.Response:
+            page = json.loads(request.content).get("pagination", {}).get("page", 1)
+            data = rows(page)
+            return httpx.Response(
+                200,
+                json={
+                    "data": data,
+                    "pagination": {
+                        "page": page,
+                        "per_page": len(data),
+                        "is_last_page": page == pages,
+                    },
+                },
+            )
+
+        return respx_mock.post("/smart-money/holdings").mock(side_effect=handler)
+
+    return factory
@@ -0,0 +1,386 @@
+import asyncio
+import json
+import logging
+import threading
+import time
+
+import anyio
+import httpx
+import pytest
+import respx
+
+from nansen import AsyncNansen, CacheStats, Nansen, ResponseCache, SQLiteCache
+from nansen._cache import CachedResponse, cache_key
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _cached(content: bytes = b"{}") -> CachedResponse:
+    return CachedResponse(
+        status_code=200, headers=(), content=content, url="https://x/y", method="POST"
+    )
+
+
+def _pages(respx_mock):
+    def handler(request: httpx.Request) -> httpx.Response:
+        page = json.loads(request.content).get("pagination", {}).get("page", 1)
+        return httpx.Response(
+            200,
+            json={
+                "data": [{"token_symbol": f"T{page}"}],
+                "pagination": {"page": page, "per_page": 1, "is_last_page": page == 3},
+            },
+            headers={"x-nansen-credits-used": "5"},
+        )
+
+    return respx_mock.post("/smart-money/holdings").mock(side_effect=handler)
+
+
+class TestResponseCache:
+    def test_key_ignores_body_key_order(self):
+        first = cache_key("POST", "https://a", "/p", {"a": 1, "b": {"x": 1, "y": 2}}, None)
+        second = cache_key("post", "https://a", "/p", {"b": {"y": 2, "x": 1}, "a": 1}, None)
+        assert first == second
+        assert first != cache_key("POST", "https://b", "/p", {"a": 1, "b": {"x": 1}}, None)
+
+    def test_key_depends_on_api_key(self):
+        first = cache_key("POST", "https://a", "/p", {"a": 1}, None, api_key="one")
+        assert first == cache_key("POST", "https://a", "/p", {"a": 1}, None, api_key="one")
+        assert first != cache_key("POST", "https://a", "/p", {"a": 1}, None, api_key="two")
+
+    def test_per_endpoint_ttl(self):
+        clock = FakeClock()
+        cache = ResponseCache(ttl=10, ttls={"/slow": 100, "/never": 0}, clock=clock)
+        cache.set("fast", "/fast", _cached())
+        cache.set("slow", "/slow", _cached())
+        cache.set("never", "/never", _cached())
+        assert cache.ttl_for("/profiler/address/labels") == 3600
+        clock.now = 50
+        assert cache.get("fast", "/fast") is None
+        assert cache.get("slow", "/slow") is not None
+        assert cache.get("never", "/never") is None
+        assert cache.stats == CacheStats(
+            hits=1, misses=2, evictions=0, expirations=1, size=1, maxsize=1024
+        )
+
+    def test_lru_eviction(self):
+        cache = ResponseCache(maxsize=2)
+        cache.set("a", "/p", _cached(b"a"))
+        cache.set("b", "/p", _cached(b"b"))
+        cache.get("a", "/p")
+        cache.set("c", "/p", _cached(b"c"))
+        assert cache.get("b", "/p") is None
+        assert cache.get("a", "/p") is not None
+        assert cache.stats.evictions == 1
+        assert len(cache) == 2
+
+    def test_stale_within_grace(self):
+        clock = FakeClock()
+        cache = ResponseCache(ttl=10, stale_grace=20, stale_graces={"/strict": 0}, clock=clock)
+        cache.set("k", "/p", _cached())
+        cache.set("s", "/strict", _cached())
+        clock.now = 15
+        hit = cache.get("k", "/p")
+        assert hit is not None
+        assert hit.stale
+        assert hit.age == 15
+        assert cache.get("s", "/strict") is None
+        clock.now = 30
+        assert cache.get("k", "/p") is None
+        assert cache.stats.stale_hits == 1
+        assert cache.stats.expirations == 2
+
+    def test_invalid_maxsize(self):
+        with pytest.raises(ValueError):
+            ResponseCache(maxsize=0)
+
+
+class TestSQLiteCache:
+    def test_round_trip_compressed(self, tmp_path):
+        disk = SQLiteCache(tmp_path / "cache" / "responses.sqlite")
+        response = CachedResponse(
+            status_code=200,
+            headers=(("content-type", "application/json"),),
+            content=b'{"data": "' + b"x" * 10_000 + b'"}',
+            url="https://x/y",
+            method="POST",
+        )
+        disk.set("k", response, ttl=60)
+        stored = disk.get("k")
+        assert stored is not None
+        assert stored[0] == response
+        assert 0 <= stored[1] < 1
+        assert 0 < stored[2] <= 60
+        assert disk.size_bytes < len(response.content) // 10
+
+    def test_expiry(self, tmp_path):
+        clock = FakeClock()
+        disk = SQLiteCache(tmp_path / "responses.sqlite", clock=clock)
+        disk.set("k", _cached(), ttl=10)
+        clock.now = 10
+        assert disk.get("k") is None
+
+    def test_grace(self, tmp_path):
+        clock = FakeClock()
+        disk = SQLiteCache(tmp_path / "responses.sqlite", clock=clock)
+        disk.set("k", _cached(), ttl=10)
+        clock.now = 15
+        assert disk.get("k") is None
+        stored = disk.get("k", grace=10)
+        assert stored is not None
+        assert stored[1:] == (15, -5)
+
+    def test_size_eviction_drops_oldest(self, tmp_path):
+        clock = FakeClock()
+        disk = SQLiteCache(tmp_path / "responses.sqlite", max_bytes=50, clock=clock)
+        for index in range(4):
+            clock.now = index
+            disk.set(f"k{index}", _cached(bytes(range(index * 20, index * 20 + 20))), ttl=100)
+        assert disk.size_bytes <= 50
+        assert disk.get("k0") is None
+        assert disk.get("k3") is not None
+
+    def test_concurrent_writers(self, tmp_path):
+        path = tmp_path / "responses.sqlite"
+
+        def worker(worker_id: int) -> None:
+            disk = SQLiteCache(path)
+            for index in range(50):
+                disk.set(f"{worker_id}-{index}", _cached(), ttl=60)
+            disk.close()
+
+        threads = [threading.Thread(target=worker, args=(n,)) for n in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        assert len(SQLiteCache(path)) == 200
+
+    @respx.mock(base_url="https://api.nansen.ai/api/v1")
+    def test_shared_between_clients(self, respx_mock, tmp_path):
+        route = _pages(respx_mock)
+        path = tmp_path / "responses.sqlite"
+        with Nansen(
+            api_key="test-key", rate_limiter=None, cache=ResponseCache(disk=SQLiteCache(path))
+        ) as client:
+            client.smart_money.holdings(chains=["ethereum"])
+        cache = ResponseCache(disk=SQLiteCache(path))
+        with Nansen(api_key="test-key", rate_limiter=None, cache=cache) as client:
+            page = client.smart_money.holdings(chains=["ethereum"])
+            client.smart_money.holdings(chains=["ethereum"])
+        assert page.data[0].token_symbol == "T1"
+        assert route.call_count == 1
+        assert cache.stats.hits == 2
+        assert cache.stats.disk_hits == 1
+
+
+class TestClientCache:
+    @respx.mock(base_url="https://api.nansen.ai/api/v1")
+    def test_pages_cached_individually(self, respx_mock):
+        route = _pages(respx_mock)
+        cache = ResponseCache()
+        with Nansen(api_key="test-key", rate_limiter=None, cache=cache) as client:
+            first = [item.token_symbol for item in client.smart_money.holdings(chains=["ethereum"])]
+            again = [item.token_symbol for item in client.smart_money.holdings(chains=["ethereum"])]
+            assert first == again == ["T1", "T2", "T3"]
+            assert route.call_count == 3
+            assert cache.stats.hits == 3
+            # Cache hits spend no credits.
+            assert client.credits.spent == 15
+
+    @respx.mock(base_url="https://api.nansen.ai/api/v1")
+    def test_not_shared_across_api_keys(self, respx_mock):
+        route = _pages(respx_mock)
+        cache = ResponseCache()
+        with Nansen(api_key="key-a", rate_limiter=None, cache=cache) as client:
+            client.smart_money.holdings(chains=["ethereum"])
+        with Nansen(api_key="key-b", rate_limiter=None, cache=cache) as client:
+            client.smart_money.holdings(chains=["ethereum"])
+            assert route.call_count == 2
+            assert route.calls[1].request.headers["apikey"] == "key-b"
+            client.smart_money.holdings(chains=["ethereum"])
+            assert route.call_count == 2
+
+    @respx.mock(base_url="https://api.nansen.ai/api/v1")
+    def test_bypass_per_call(self, respx_mock):
+        route = _pages(respx_mock)
+        cache = ResponseCache()
+        with Nansen(api_key="test-key", rate_limiter=None, cache=cache) as client:
+            client.smart_money.holdings(chains=["ethereum"])
+            fresh = client.with_options(use_cache=False)
+            fresh.smart_money.holdings(chains=["ethereum"])
+            assert route.call_count == 2
+            assert fresh.smart_money is not client.smart_money
+            assert fresh.credits is client.credits
+            client.smart_money.holdings(chains=["ethereum"])
+            assert route.call_count == 2
+
+    @respx.mock(base_url="https://api.nansen.ai/api/v1")
+    def test_hits_do_not_share_results(self, respx_mock):
+        _pages(respx_mock)
+        with Nansen(api_key="test-key", rate_limiter=None, cache=ResponseCache()) as client:
+            first = client.smart_money.holdings(chains=["ethereum"])
+            first.data[0].token_symbol = "MUTATED"
+            first.data.append(first.data[0])
+            again = client.smart_money.holdings(chains=["ethereum"])
+        assert again.data is not first.data
+        assert [item.token_symbol for item in again.data] == ["T1"]
+
+    @respx.mock(base_url="https://api.nansen.ai/api/v1")
+    def test_errors_not_cached(self, respx_mock):
+        route = respx_mock.post("/smart-money/holdings").mock(
+            return_value=httpx.Response(404, json={"error": {"message": "missing"}})
+        )
+        with Nansen(api_key="test-key", rate_limiter=None, cache=ResponseCache()) as client:
+            for _ in range(2):
+                with pytest.raises(Exception, match="missing"):
+                    client.smart_money.holdings(chains=["ethereum"])
+        assert route.call_count == 2
+
+    @respx.mock(base_url="https://api.nansen.ai/api/v1")
+    async def test_async_cache(self, respx_mock):
+        route = _pages(respx_mock)
+        cache = ResponseCache()
+        async with AsyncNansen(api_key="test-key", rate_limiter=None, cache=cache) as client:
+            for _ in range(2):
+                page = await client.smart_money.holdings(chains=["ethereum"])
+                assert page.data[0].token_symbol == "T1"
+            assert route.call_count == 1
+            await client.with_options(use_cache=False).smart_money.holdings(chains=["ethereum"])
+            assert route.call_count == 2
+        assert cache.stats.hits == 1
+
+
+def _versioned_token_route(respx_mock, *, delay: float = 0.0, fail_after: int | None = None):
+    calls = {"count": 0}
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls["count"] += 1
+        version = calls["count"]
+        time.sleep(delay)
+        if fail_after is not None and version > fail_after:
+            return httpx.Response(500, json={"error": {"message": "upstream down"}})
+        return httpx.Response(
+            200, json={"data": {"name": f"v{version}", "symbol": "T", "contract_address": "0x"}}
+        )
+
+    return respx_mock.post("/tgm/token-information").mock(side_effect=handler)
+
+
+def _wait_for(condition, timeout: float = 2.0) -> None:
+    deadline = time.monotonic() + timeout
+    while not condition():
+        assert time.monotonic() < deadline, "timed out"
+        time.sleep(0.01)
+
+
+class TestStaleWhileRevalidate:
+    @staticmethod
+    def _lookup(client):
+        return client.tgm.token_information(
+            chain="ethereum", token_address="0xabc", timeframe="24h"
+        )
+
+    @respx.mock(base_url="https://api.nansen.ai/api/v1")
+    def test_serves_stale_and_refreshes_once(self, respx_mock):
+        route = _versioned_token_route(respx_mock, delay=0.1)
+        clock = FakeClock()
+        cache = ResponseCache(ttls={"/tgm/token-information": 10}, stale_grace=60, clock=clock)
+        with Nansen(api_key="test-key", rate_limiter=None, cache=cache) as client:
+            fresh = self._lookup(client)
+            assert fresh.cache_age is None
+            assert not fresh.is_stale
+            clock.now = 15
+            stale = [self._lookup(client) for _ in range(5)]
+            assert all(resp.data.data.name == "v1" for resp in stale)
+            assert stale[0].is_stale
+            assert stale[0].cache_age == 15
+            _wait_for(lambda: not client._inflight)
+            assert route.call_count == 2
+            refreshed = self._lookup(client)
+        assert refreshed.data.data.name == "v2"
+        assert not refreshed.is_stale
+        assert refreshed.cache_age == 0
+
+    @respx.mock(base_url="https://api.nansen.ai/api/v1")
+    def test_failed_refresh_keeps_stale_value(self, respx_mock, caplog):
+        _versioned_token_route(respx_mock, fail_after=1)
+        clock = FakeClock()
+        cache = ResponseCache(ttls={"/tgm/token-information": 10}, stale_grace=60, clock=clock)
+        with Nansen(api_key="test-key", rate_limiter=None, max_retries=0, cache=cache) as client:
+            self._lookup(client)
+            clock.now = 15
+            with caplog.at_level(logging.WARNING, logger="nansen"):
+                self._lookup(client)
+                _wait_for(lambda: not client._inflight)
+            assert "Background refresh of /tgm/token-information failed" in caplog.text
+            again = self._lookup(client)
+        assert again.data.data.name == "v1"
+        assert again.is_stale
+
+    @respx.mock(base_url="https://api.nansen.ai/api/v1")
+    async def test_async_revalidate(self, respx_mock):
+        route = _versioned_token_route(respx_mock)
+        clock = FakeClock()
+        cache = ResponseCache(ttls={"/tgm/token-information": 10}, stale_grace=60, clock=clock)
+        async with AsyncNansen(api_key="test-key", rate_limiter=None, cache=cache) as client:
+            await self._lookup(client)
+            clock.now = 15
+            stale = await asyncio.gather(*(self._lookup(client) for _ in range(3)))
+            assert [resp.meta.stale for resp in stale] == [True] * 3
+            while client._inflight:
+                await asyncio.sleep(0)
+            assert route.call_count == 2
+            refreshed = await self._lookup(client)
+        assert refreshed.data.data.name == "v2"
+
+    @respx.mock(base_url="https://api.nansen.ai/api/v1")
+    async def test_async_requires_context_manager(self, respx_mock):
+        cache = ResponseCache(
+            ttls={"/tgm/token-information": 10},
+            stale_graces={"/tgm/token-information": 60},
+        )
+        client = AsyncNansen(api_key="test-key", rate_limiter=None, cache=cache)
+        try:
+            with pytest.raises(RuntimeError, match="async with"):
+                await self._lookup(client)
+            # Endpoints without a grace window are unaffected.
+            respx_mock.post("/smart-money/holdings").mock(
+                return_value=httpx.Response(
+                    200,
+                    json={
+                        "data": [],
+                        "pagination": {"page": 1, "per_page": 10, "is_last_page": True},
+                    },
+                )
+            )
+            await client.smart_money.holdings(chains=["ethereum"])
+        finally:
+            await client.close()
+
+    @respx.mock(base_url="https://api.nansen.ai/api/v1")
+    def test_trio_revalidate(self, respx_mock):
+        pytest.importorskip("trio")
+        route = _versioned_token_route(respx_mock)
+        clock = FakeClock()
+        cache = ResponseCache(ttls={"/tgm/token-information": 10}, stale_grace=60, clock=clock)
+
+        async def main() -> tuple:
+            async with AsyncNansen(api_key="test-key", rate_limiter=None, cache=cache) as client:
+                await self._lookup(client)
+                clock.now = 15
+                stale = await self._lookup(client)
+                while client._inflight:
+                    await anyio.sleep(0)
+                return stale, await self._lookup(client)
+
+        stale, refreshed = anyio.run(main, backend="trio")
+        assert stale.is_stale
+        assert refreshed.data.data.name == "v2"
+        assert route.call_count == 2
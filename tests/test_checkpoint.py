@@ -0,0 +1,145 @@
+import json
+import threading
+
+import httpx
+import pytest
+import respx
+
+from nansen import AsyncNansen, Nansen, PageCursor
+from nansen.types.smart_money import SmartMoneyHoldingItem
+
+
+def _paged_route(respx_mock, last_page: int):
+    def handler(request: httpx.Request) -> httpx.Response:
+        page = json.loads(request.content).get("pagination", {}).get("page", 1)
+        return httpx.Response(
+            200,
+            json={
+                "data": [{"token_symbol": f"T{page}"}],
+                "pagination": {"page": page, "per_page": 1, "is_last_page": page == last_page},
+            },
+        )
+
+    return respx_mock.post("/smart-money/holdings").mock(side_effect=handler)
+
+
+class TestPageCursor:
+    def test_token_round_trip(self):
+        cursor = PageCursor.for_page(
+            path="/smart-money/holdings",
+            body={"chains": ["ethereum"], "pagination": {"page": 7, "per_page": 100}},
+            model=SmartMoneyHoldingItem,
+        )
+        token = cursor.to_token()
+        assert isinstance(token, str)
+        restored = PageCursor.from_token(token)
+        assert restored == cursor
+        assert restored.page == 7
+        assert restored.resolve_model() is SmartMoneyHoldingItem
+
+    def test_file_round_trip(self, tmp_path):
+        cursor = PageCursor.for_page(
+            path="/smart-money/holdings",
+            body={"pagination": {"page": 3}},
+            model=SmartMoneyHoldingItem,
+        )
+        file = tmp_path / "export.ckpt"
+        cursor.save(file)
+        assert PageCursor.load(file) == cursor
+        assert [p.name for p in tmp_path.iterdir()] == ["export.ckpt"]
+
+    def test_corrupt_token(self):
+        with pytest.raises(ValueError):
+            PageCursor.from_token("not-a-token")
+
+    def test_foreign_model_rejected(self):
+        cursor = PageCursor(path="/x", body={}, model="os:system")
+        with pytest.raises(ValueError):
+            cursor.resolve_model()
+
+
+class TestResume:
+    @respx.mock(base_url="https://api.nansen.ai/api/v1")
+    def test_resume_with_fresh_client(self, respx_mock):
+        _paged_route(respx_mock, last_page=4)
+        with Nansen(api_key="test-key") as client:
+            page = client.smart_money.holdings(chains=["ethereum"])
+            assert page.cursor().page == 1
+            token = page.next_page().next_cursor().to_token()
+
+        with Nansen(api_key="test-key") as fresh:
+            resumed = fresh.resume_page(token)
+            assert resumed.pagination.page == 3
+            assert [item.token_symbol for item in resumed] == ["T3", "T4"]
+            assert resumed.next_cursor() is not None
+            assert resumed.next_page().next_cursor() is None
+
+        body = json.loads(respx_mock.calls[-1].request.content)
+        assert body["chains"] == ["ethereum"]
+
+    @respx.mock(base_url="https://api.nansen.ai/api/v1")
+    def test_auto_checkpoint(self, respx_mock, tmp_path):
+        _paged_route(respx_mock, last_page=6)
+        file = tmp_path / "export.ckpt"
+        with Nansen(api_key="test-key") as client:
+            page = client.smart_money.holdings(chains=["ethereum"])
+            for p in page.iter_pages(checkpoint=file, checkpoint_every=2):
+                if p.pagination.page == 5:
+                    break
+            # Pages 1-4 were fully processed; page 5 was interrupted.
+            assert PageCursor.load(file).page == 5
+
+            resumed = client.resume_page(PageCursor.load(file))
+            numbers = [p.pagination.page for p in resumed.iter_pages(checkpoint=file)]
+        assert numbers == [5, 6]
+        assert not file.exists()
+
+    @respx.mock(base_url="https://api.nansen.ai/api/v1")
+    def test_auto_checkpoint_with_prefetch(self, respx_mock, tmp_path):
+        _paged_route(respx_mock, last_page=5)
+        file = tmp_path / "export.ckpt"
+        with Nansen(api_key="test-key") as client:
+            page = client.smart_money.holdings(chains=["ethereum"])
+            for p in page.iter_pages(prefetch=2, checkpoint=file):
+                if p.pagination.page == 3:
+                    break
+        assert PageCursor.load(file).page == 3
+
+    @respx.mock(base_url="https://api.nansen.ai/api/v1")
+    async def test_async_resume_and_checkpoint(self, respx_mock, tmp_path):
+        _paged_route(respx_mock, last_page=4)
+        file = tmp_path / "export.ckpt"
+        async with AsyncNansen(api_key="test-key") as client:
+            page = await client.smart_money.holdings(chains=["ethereum"])
+            async for p in page.iter_pages(checkpoint=file):
+                if p.pagination.page == 2:
+                    break
+            assert PageCursor.load(file).page == 2
+
+        async with AsyncNansen(api_key="test-key") as fresh:
+            resumed = await fresh.resume_page(PageCursor.load(file))
+            numbers = [p.pagination.page async for p in resumed.iter_pages(checkpoint=file)]
+        assert numbers == [2, 3, 4]
+        assert not file.exists()
+
+    @respx.mock(base_url="https://api.nansen.ai/api/v1")
+    async def test_async_checkpoint_written_off_event_loop(self, respx_mock, tmp_path, monkeypatch):
+        _paged_route(respx_mock, last_page=3)
+        loop_thread = threading.get_ident()
+        writers: list[int] = []
+        save = PageCursor.save
+
+        def recording_save(self, file):
+            writers.append(threading.get_ident())
+            save(self, file)
+
+        monkeypatch.setattr(PageCursor, "save", recording_save)
+        file = tmp_path / "export.ckpt"
+        async with AsyncNansen(api_key="test-key") as client:
+            page = await client.smart_money.holdings(chains=["ethereum"])
+            async for p in page.iter_pages(checkpoint=file):
+                if p.pagination.page == 2:
+                    assert PageCursor.load(file).page == 2
+        assert len(writers) == 2
+        assert loop_thread not in writers
+        assert not file.exists()
@@ -64,8 +64,13 @@ class TestHeaders:
         assert headers["apikey"] == "my-api-key"
         assert headers["content-type"] == "application/json"
         assert "nansen-python/" in headers["user-agent"]
+        assert "gzip" in headers["accept-encoding"]
         client.close()
 
+    def test_compression_disabled(self):
+        with Nansen(api_key="my-api-key", compression=False) as client:
+            assert client._build_headers()["accept-encoding"] == "identity"
+
 
 class TestResourceAccess:
     def test_smart_money(self, client):
@@ -0,0 +1,153 @@
+import asyncio
+import json
+import threading
+import time
+
+import anyio
+import httpx
+import pytest
+import respx
+
+from nansen import AsyncNansen, BadRequestError
+
+
+def _token_route(respx_mock, *, delay: float = 0.0, status: int = 200):
+    def handler(request: httpx.Request) -> httpx.Response:
+        time.sleep(delay)
+        if status != 200:
+            return httpx.Response(status, json={"error": {"message": "bad token"}})
+        body = json.loads(request.content)
+        return httpx.Response(
+            200,
+            json={"data": {"name": body["token_address"], "symbol": "T", "contract_address": "0x"}},
+        )
+
+    return respx_mock.post("/tgm/token-information").mock(side_effect=handler)
+
+
+def _in_threads(count: int, call):
+    results: list = [None] * count
+    errors: list = [None] * count
+    barrier = threading.Barrier(count)
+
+    def worker(index: int) -> None:
+        barrier.wait()
+        try:
+            results[index] = call()
+        except Exception as exc:
+            errors[index] = exc
+
+    threads = [threading.Thread(target=worker, args=(n,)) for n in range(count)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return results, errors
+
+
+class TestSyncCoalescing:
+    @respx.mock(base_url="https://api.nansen.ai/api/v1")
+    def test_identical_calls_share_one_request(self, respx_mock, client):
+        route = _token_route(respx_mock, delay=0.2)
+        results, errors = _in_threads(
+            8,
+            lambda: client.tgm.token_information(
+                chain="ethereum", token_address="0xabc", timeframe="24h"
+            ),
+        )
+        assert errors == [None] * 8
+        assert route.call_count == 1
+        assert all(resp.data is results[0].data for resp in results)
+        # Once it has landed, the next call goes to the network again.
+        client.tgm.token_information(chain="ethereum", token_address="0xabc", timeframe="24h")
+        assert route.call_count == 2
+
+    @respx.mock(base_url="https://api.nansen.ai/api/v1")
+    def test_distinct_bodies_not_coalesced(self, respx_mock, client):
+        route = _token_route(respx_mock, delay=0.1)
+        counter = iter(range(4))
+        lock = threading.Lock()
+
+        def call():
+            with lock:
+                index = next(counter)
+            return client.tgm.token_information(
+                chain="ethereum", token_address=f"0x{index}", timeframe="24h"
+            )
+
+        results, _ = _in_threads(4, call)
+        assert route.call_count == 4
+        assert sorted(resp.data.data.name for resp in results) == ["0x0", "0x1", "0x2", "0x3"]
+
+    @respx.mock(base_url="https://api.nansen.ai/api/v1")
+    def test_error_shared_by_followers(self, respx_mock, client):
+        route = _token_route(respx_mock, delay=0.2, status=400)
+        _, errors = _in_threads(
+            4,
+            lambda: client.tgm.token_information(
+                chain="ethereum", token_address="0xabc", timeframe="24h"
+            ),
+        )
+        assert all(isinstance(error, BadRequestError) for error in errors)
+        assert route.call_count == 1
+
+
+class TestAsyncCoalescing:
+    @respx.mock(base_url="https://api.nansen.ai/api/v1")
+    async def test_identical_calls_share_one_request(self, respx_mock):
+        route = _token_route(respx_mock)
+        async with AsyncNansen(api_key="test-key", rate_limiter=None) as client:
+            results = await asyncio.gather(
+                *(
+                    client.tgm.token_information(
+                        chain="ethereum", token_address="0xabc", timeframe="24h"
+                    )
+                    for _ in range(5)
+                )
+            )
+        assert route.call_count == 1
+        assert all(resp.data is results[0].data for resp in results)
+
+    @respx.mock(base_url="https://api.nansen.ai/api/v1")
+    async def test_cancelled_caller_does_not_fail_others(self, respx_mock):
+        route = _token_route(respx_mock)
+        async with AsyncNansen(api_key="test-key", rate_limiter=None) as client:
+
+            def call():
+                return client.tgm.token_information(
+                    chain="ethereum", token_address="0xabc", timeframe="24h"
+                )
+
+            first = asyncio.ensure_future(call())
+            second = asyncio.ensure_future(call())
+            await asyncio.sleep(0)
+            first.cancel()
+            resp = await second
+            with pytest.raises(asyncio.CancelledError):
+                await first
+        assert resp.data.data.name == "0xabc"
+        assert route.call_count == 1
+
+    @respx.mock(base_url="https://api.nansen.ai/api/v1")
+    def test_trio_backend(self, respx_mock):
+        pytest.importorskip("trio")
+        route = _token_route(respx_mock)
+        results: list = []
+
+        async def main() -> None:
+            async with AsyncNansen(api_key="test-key", rate_limiter=None) as client:
+
+                async def call() -> None:
+                    results.append(
+                        await client.tgm.token_information(
+                            chain="ethereum", token_address="0xabc", timeframe="24h"
+                        )
+                    )
+
+                async with anyio.create_task_group() as tg:
+                    for _ in range(3):
+                        tg.start_soon(call)
+
+        anyio.run(main, backend="trio")
+        assert len(results) == 3
+        assert route.call_count == 1
@@ -0,0 +1,94 @@
+import pytest
+import respx
+
+from nansen import AsyncNansen, Categorical, ColumnBatch, Nansen
+from nansen._columnar import columns_from_rows
+from nansen.types.smart_money import SmartMoneyHoldingItem
+
+np = pytest.importorskip("numpy")
+
+ROWS = [
+    {"chain": "ethereum", "token_symbol": "AAA", "value_usd": 10.5, "holders_count": 3},
+    {"chain": "base", "token_symbol": None, "value_usd": None, "holders_count": None},
+    {"chain": "ethereum", "token_sectors": ["DeFi"], "value_usd": 2, "extra": "skipped"},
+]
+
+
+def _rows(page: int) -> list[dict]:
+    return [{"chain": "ethereum", "value_usd": float(page), "holders_count": page}]
+
+
+class TestColumnsFromRows:
+    def test_numeric_columns_with_null_masks(self):
+        batch = columns_from_rows(ROWS, SmartMoneyHoldingItem)
+        assert isinstance(batch, ColumnBatch)
+        assert len(batch) == 3
+        assert batch.names == list(SmartMoneyHoldingItem.model_fields)
+        assert batch["value_usd"].dtype == np.float64
+        assert np.isnan(batch["value_usd"][1])
+        assert batch["holders_count"].dtype == np.int64
+        assert batch.masks["holders_count"].tolist() == [False, True, True]
+        assert batch.masked("value_usd").sum() == 12.5
+
+    def test_string_and_other_columns_are_objects(self):
+        batch = columns_from_rows(ROWS, SmartMoneyHoldingItem)
+        assert batch["token_symbol"].dtype == object
+        assert batch["token_symbol"].tolist() == ["AAA", None, None]
+        assert batch["token_sectors"].tolist() == [None, None, ["DeFi"]]
+        assert "extra" not in batch.names
+        assert "token_symbol" not in batch.masks
+
+    def test_categorical(self):
+        batch = columns_from_rows(
+            [*ROWS, {"chain": None}], SmartMoneyHoldingItem, categorical=["chain"]
+        )
+        chain = batch["chain"]
+        assert isinstance(chain, Categorical)
+        assert chain.categories.tolist() == ["base", "ethereum"]
+        assert chain.codes.tolist() == [1, 0, 1, -1]
+        assert chain.to_object().tolist() == ["ethereum", "base", "ethereum", None]
+
+    def test_model_rows_match_raw_rows(self):
+        models = [SmartMoneyHoldingItem.model_validate(row) for row in ROWS]
+        from_models = columns_from_rows(models, SmartMoneyHoldingItem)
+        from_raw = columns_from_rows(ROWS, SmartMoneyHoldingItem)
+        assert from_models["holders_count"].tolist() == from_raw["holders_count"].tolist()
+        assert from_models["token_symbol"].tolist() == from_raw["token_symbol"].tolist()
+
+    def test_unexpected_values_fall_back_to_objects(self):
+        batch = columns_from_rows([{"value_usd": "n/a"}], SmartMoneyHoldingItem)
+        assert batch["value_usd"].tolist() == ["n/a"]
+
+    def test_integers_beyond_int64_fall_back_to_objects(self):
+        batch = columns_from_rows([{"holders_count": 2**70}, {}], SmartMoneyHoldingItem)
+        assert batch["holders_count"].dtype == object
+        assert batch["holders_count"].tolist() == [2**70, None]
+
+    def test_fractional_floats_not_truncated_in_int_columns(self):
+        batch = columns_from_rows([{"holders_count": 1.5}], SmartMoneyHoldingItem)
+        assert batch["holders_count"].tolist() == [1.5]
+        whole = columns_from_rows([{"holders_count": 2.0}], SmartMoneyHoldingItem)
+        assert whole["holders_count"].dtype == np.int64
+        assert whole["holders_count"].tolist() == [2]
+
+
+class TestPageColumns:
+    @respx.mock(base_url="https://api.nansen.ai/api/v1")
+    def test_iter_column_batches(self, respx_mock, holdings_route):
+        route = holdings_route(respx_mock, _rows, pages=3)
+        with Nansen(api_key="test-key", rate_limiter=None) as client:
+            page = client.smart_money.holdings(chains=["ethereum"])
+            assert page.to_columns()["holders_count"].tolist() == [1]
+            batches = list(page.iter_column_batches(categorical=["chain"]))
+            assert client.result_mode == "model"
+        assert [batch["value_usd"].tolist() for batch in batches] == [[1.0], [2.0], [3.0]]
+        assert isinstance(batches[2]["chain"], Categorical)
+        assert route.call_count == 3
+
+    @respx.mock(base_url="https://api.nansen.ai/api/v1")
+    async def test_async_iter_column_batches(self, respx_mock, holdings_route):
+        holdings_route(respx_mock, _rows, pages=2)
+        async with AsyncNansen(api_key="test-key", rate_limiter=None) as client:
+            page = await client.smart_money.holdings(chains=["ethereum"])
+            batches = [batch async for batch in page.iter_column_batches(prefetch=1)]
+        assert [batch["holders_count"].tolist() for batch in batches] == [[1], [2]]
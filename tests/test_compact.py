@@ -0,0 +1,91 @@
+import pickle
+import tracemalloc
+
+import httpx
+import respx
+
+from nansen import CompactRecord, Nansen, compact_type
+from nansen.types.profiler import TokenTransfer, TransactionItem
+from nansen.types.tgm import TgmDexTradeItem
+
+TRADE = {
+    "block_timestamp": "2024-01-01T00:00:00",
+    "transaction_hash": "0xabc",
+    "trader_address": "0x1",
+    "action": "BUY",
+    "token_amount": 12.5,
+    "estimated_value_usd": 31000.0,
+}
+TRANSACTION = {
+    "chain": "ethereum",
+    "tokens_sent": [{"token_symbol": "USDC", "value_usd": 100.0}],
+    "tokens_received": None,
+    "volume_usd": 100.0,
+    "new_field": "kept",
+}
+
+
+class TestCompactRecord:
+    def test_same_attributes_without_dict(self):
+        record = compact_type(TgmDexTradeItem).from_dict(TRADE)
+        assert isinstance(record, CompactRecord)
+        assert type(record).__name__ == "CompactTgmDexTradeItem"
+        assert not hasattr(record, "__dict__")
+        assert record.action == "BUY"
+        assert record.trader_address_label is None
+        assert compact_type(TgmDexTradeItem) is type(record)
+
+    def test_nested_and_extra_round_trip(self):
+        model = TransactionItem.model_validate(TRANSACTION)
+        record = compact_type(TransactionItem).from_model(model)
+        assert type(record.tokens_sent[0]) is compact_type(TokenTransfer)
+        assert record.tokens_sent[0].token_symbol == "USDC"
+        assert record.to_model() == model
+        assert record == compact_type(TransactionItem).from_dict(TRANSACTION)
+        assert record.to_dict()["new_field"] == "kept"
+
+    def test_pickle(self):
+        record = compact_type(TransactionItem).from_dict(TRANSACTION)
+        assert pickle.loads(pickle.dumps(record)) == record
+
+    def test_several_times_smaller(self):
+        rows = [dict(TRADE, transaction_hash=f"0x{n}") for n in range(5000)]
+        CompactTrade = compact_type(TgmDexTradeItem)
+
+        def traced(build):
+            tracemalloc.start()
+            try:
+                kept = build()
+                size = tracemalloc.get_traced_memory()[0]
+            finally:
+                tracemalloc.stop()
+            del kept
+            return size
+
+        models = traced(lambda: [TgmDexTradeItem.model_validate(row) for row in rows])
+        records = traced(lambda: [CompactTrade.from_dict(row) for row in rows])
+        assert models > 3 * records
+
+
+class TestCompactMode:
+    @respx.mock(base_url="https://api.nansen.ai/api/v1")
+    def test_pages_yield_records(self, respx_mock):
+        respx_mock.post("/tgm/dex-trades").mock(
+            return_value=httpx.Response(
+                200,
+                json={
+                    "data": [TRADE, TRADE],
+                    "pagination": {"page": 1, "per_page": 2, "is_last_page": True},
+                },
+            )
+        )
+        with Nansen(api_key="test-key", rate_limiter=None, result_mode="compact") as client:
+            items = list(
+                client.tgm.dex_trades(
+                    chain="ethereum",
+                    token_address="0xabc",
+                    date={"from": "2024-01-01", "to": "2024-01-02"},
+                )
+            )
+        assert [type(item) for item in items] == [compact_type(TgmDexTradeItem)] * 2
+        assert items[0].estimated_value_usd == 31000.0
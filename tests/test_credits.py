@@ -0,0 +1,182 @@
+import asyncio
+import contextvars
+import json
+import threading
+import time
+
+import httpx
+import pytest
+import respx
+
+from nansen import AsyncNansen, CreditBudgetExceededError, CreditLedger, CreditUsage, Nansen
+
+
+def _page(page: int, *, last: bool, credits: int = 5) -> httpx.Response:
+    return httpx.Response(
+        200,
+        json={
+            "data": [{"token_symbol": f"T{page}"}],
+            "pagination": {"page": page, "per_page": 1, "is_last_page": last},
+        },
+        headers={
+            "x-nansen-credits-used": str(credits),
+            "x-nansen-credits-remaining": str(1000 - page * credits),
+        },
+    )
+
+
+class TestCreditLedger:
+    def test_record_breakdowns(self):
+        ledger = CreditLedger()
+        ledger.record("/tgm/transfers", credits_used=5, credits_remaining=95)
+        ledger.record("/tgm/holders", credits_used=2)
+        ledger.record("/smart-money/holdings", credits_used=None)
+        assert ledger.total == CreditUsage(requests=3, credits=7)
+        assert ledger.by_path["/tgm/transfers"] == CreditUsage(requests=1, credits=5)
+        assert ledger.by_resource["tgm"] == CreditUsage(requests=2, credits=7)
+        assert ledger.by_resource["smart-money"] == CreditUsage(requests=1, credits=0)
+        assert ledger.credits_remaining == 95
+
+    def test_nested_jobs(self):
+        ledger = CreditLedger()
+        with ledger.job("outer") as outer:
+            ledger.record("/tgm/transfers", credits_used=5)
+            with ledger.job("inner") as inner:
+                ledger.record("/tgm/transfers", credits_used=5)
+        ledger.record("/tgm/transfers", credits_used=5)
+        assert inner.spent == 5
+        assert outer.spent == 10
+        assert ledger.spent == 15
+
+    def test_budget_uses_last_cost_estimate(self):
+        ledger = CreditLedger()
+        with ledger.job("export", budget=12) as job:
+            reservation = ledger.check("/tgm/transfers")  # unknown cost: one credit
+            assert reservation.estimate == 1
+            ledger.record("/tgm/transfers", credits_used=5, reservation=reservation)
+            reservation = ledger.check("/tgm/transfers")
+            ledger.record("/tgm/transfers", credits_used=5, reservation=reservation)
+            with pytest.raises(CreditBudgetExceededError) as exc_info:
+                ledger.check("/tgm/transfers")
+        assert exc_info.value.scope == "export"
+        assert exc_info.value.spent == 10
+        assert exc_info.value.estimate == 5
+        assert job.remaining_budget == 2
+
+    def test_in_flight_requests_count_against_budget(self):
+        ledger = CreditLedger()
+        ledger.record("/tgm/transfers", credits_used=2)
+        with ledger.job("export", budget=5):
+            first = ledger.check("/tgm/transfers")
+            second = ledger.check("/tgm/transfers")
+            with pytest.raises(CreditBudgetExceededError):
+                ledger.check("/tgm/transfers")
+            first.release()
+            first.release()  # idempotent
+            third = ledger.check("/tgm/transfers")
+            ledger.record("/tgm/transfers", credits_used=2, reservation=second)
+            ledger.record("/tgm/transfers", credits_used=2, reservation=third)
+            with pytest.raises(CreditBudgetExceededError):
+                ledger.check("/tgm/transfers")
+
+    def test_concurrent_checks_stay_within_budget(self):
+        ledger = CreditLedger()
+        barrier = threading.Barrier(16)
+        rejected = []
+
+        def worker() -> None:
+            barrier.wait()
+            try:
+                reservation = ledger.check("/tgm/transfers")
+            except CreditBudgetExceededError:
+                rejected.append(True)
+                return
+            time.sleep(0.01)
+            ledger.record("/tgm/transfers", credits_used=1, reservation=reservation)
+
+        with ledger.job("export", budget=5) as job:
+            threads = [
+                threading.Thread(target=contextvars.copy_context().run, args=(worker,))
+                for _ in range(16)
+            ]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+        assert job.spent == 5
+        assert len(rejected) == 11
+
+    def test_negative_budget_rejected(self):
+        with pytest.raises(ValueError):
+            CreditLedger(budget=-1)
+
+
+class TestClientCredits:
+    @respx.mock(base_url="https://api.nansen.ai/api/v1")
+    def test_pagination_stops_before_budget(self, respx_mock):
+        route = respx_mock.post("/tgm/transfers").mock(
+            side_effect=[_page(i, last=False) for i in range(1, 10)]
+        )
+        with Nansen(api_key="test-key") as client:
+            seen = []
+            with client.credits.job("export", budget=17) as job:
+                with pytest.raises(CreditBudgetExceededError):
+                    for item in client.tgm.transfers(
+                        chain="ethereum",
+                        token_address="0xabc",
+                        date={"from": "2024-01-01", "to": "2024-01-31"},
+                    ):
+                        seen.append(item)
+            assert route.call_count == 3
+            assert len(seen) == 3
+            assert job.spent == 15
+            assert client.credits.by_path["/tgm/transfers"].requests == 3
+            assert client.credits.credits_remaining == 985
+
+    @respx.mock(base_url="https://api.nansen.ai/api/v1")
+    def test_client_budget(self, respx_mock):
+        respx_mock.post("/smart-money/holdings").mock(return_value=_page(1, last=True, credits=4))
+        with Nansen(api_key="test-key", credit_budget=8) as client:
+            client.smart_money.holdings(chains=["ethereum"])
+            client.smart_money.holdings(chains=["ethereum"])
+            with pytest.raises(CreditBudgetExceededError):
+                client.smart_money.holdings(chains=["ethereum"])
+            assert client.credits.spent == 8
+
+    @respx.mock(base_url="https://api.nansen.ai/api/v1")
+    async def test_jobs_cover_async_tasks(self, respx_mock):
+        respx_mock.post("/smart-money/holdings").mock(return_value=_page(1, last=True, credits=3))
+        async with AsyncNansen(api_key="test-key") as client:
+            with client.credits.job("fan-out") as job:
+                await asyncio.gather(
+                    *(
+                        client.smart_money.holdings(chains=[chain])
+                        for chain in ("ethereum", "base", "solana", "arbitrum")
+                    )
+                )
+            assert job.spent == 12
+            assert job.total.requests == 4
+
+    @respx.mock(base_url="https://api.nansen.ai/api/v1")
+    def test_bulk_calls_stay_within_job_budget(self, respx_mock):
+        def handler(request: httpx.Request) -> httpx.Response:
+            time.sleep(0.01)
+            address = json.loads(request.content)["address"]
+            return httpx.Response(
+                200,
+                json={
+                    "data": [{"address": address}],
+                    "pagination": {"page": 1, "per_page": 10, "is_last_page": True},
+                },
+                headers={"x-nansen-credits-used": "1"},
+            )
+
+        respx_mock.post("/profiler/address/current-balance").mock(side_effect=handler)
+        with Nansen(api_key="test-key", rate_limiter=None) as client:
+            with client.credits.job("bulk", budget=5) as job:
+                outcome = client.profiler.address.current_balance_many(
+                    addresses=[f"0x{i}" for i in range(40)], chain="ethereum", max_concurrency=8
+                ).collect()
+        assert job.spent == 5
+        assert len(outcome.results) == 5
+        assert all(isinstance(exc, CreditBudgetExceededError) for exc in outcome.errors.values())
@@ -0,0 +1,122 @@
+import json
+
+import httpx
+import pytest
+import respx
+
+from nansen import AsyncNansen, Nansen, arrow_schema
+from nansen.types.profiler import TransactionItem
+from nansen.types.smart_money import SmartMoneyHoldingItem
+
+pa = pytest.importorskip("pyarrow")
+
+
+def _rows(page: int) -> list[dict]:
+    return [
+        {"token_symbol": f"T{page}", "value_usd": float(page), "holders_count": page},
+        {"token_symbol": None, "token_sectors": ["DeFi"], "new_field": "x"},
+    ]
+
+
+class TestArrowSchema:
+    def test_scalar_and_list_fields(self):
+        schema = arrow_schema(SmartMoneyHoldingItem)
+        assert schema.names == list(SmartMoneyHoldingItem.model_fields)
+        assert schema.field("value_usd").type == pa.float64()
+        assert schema.field("holders_count").type == pa.int64()
+        assert schema.field("token_sectors").type == pa.list_(pa.string())
+
+    def test_nested_models_become_structs(self):
+        tokens_sent = arrow_schema(TransactionItem).field("tokens_sent").type
+        assert pa.types.is_list(tokens_sent)
+        assert pa.types.is_struct(tokens_sent.value_type)
+        assert tokens_sent.value_type.field("token_symbol").type == pa.string()
+
+
+class TestPageExport:
+    @respx.mock(base_url="https://api.nansen.ai/api/v1")
+    def test_to_arrow(self, respx_mock, holdings_route):
+        route = holdings_route(respx_mock, _rows, pages=3)
+        with Nansen(api_key="test-key", rate_limiter=None) as client:
+            page = client.smart_money.holdings(chains=["ethereum"])
+            first = page.to_arrow()
+            table = page.to_arrow(all_pages=True)
+        assert first.num_rows == 2
+        assert table.schema == arrow_schema(SmartMoneyHoldingItem)
+        assert table.column("value_usd").to_pylist() == [1.0, None, 2.0, None, 3.0, None]
+        assert table.column("token_sectors").to_pylist()[1] == ["DeFi"]
+        assert "new_field" not in table.column_names
+        assert route.call_count == 3
+
+    @respx.mock(base_url="https://api.nansen.ai/api/v1")
+    def test_iter_record_batches_in_raw_mode(self, respx_mock, holdings_route):
+        holdings_route(respx_mock, _rows, pages=2)
+        with Nansen(api_key="test-key", rate_limiter=None, result_mode="compact") as client:
+            page = client.smart_money.holdings(chains=["ethereum"])
+            batches = list(page.iter_record_batches(prefetch=1))
+        assert [batch.num_rows for batch in batches] == [2, 2]
+        assert batches[1].column("holders_count").to_pylist() == [2, None]
+
+    @respx.mock(base_url="https://api.nansen.ai/api/v1")
+    def test_raw_values_coerced_like_the_model(self, respx_mock):
+        respx_mock.post("/smart-money/holdings").mock(
+            return_value=httpx.Response(
+                200,
+                json={
+                    "data": [{"holders_count": "12", "value_usd": "1.5"}, {"holders_count": 3}],
+                    "pagination": {"page": 1, "per_page": 2, "is_last_page": True},
+                },
+            )
+        )
+        with Nansen(api_key="test-key", rate_limiter=None, result_mode="raw") as client:
+            table = client.smart_money.holdings(chains=["ethereum"]).to_arrow()
+        assert table.schema == arrow_schema(SmartMoneyHoldingItem)
+        assert table.column("holders_count").to_pylist() == [12, 3]
+        assert table.column("value_usd").to_pylist() == [1.5, None]
+
+    @respx.mock(base_url="https://api.nansen.ai/api/v1")
+    def test_values_beyond_arrow_type_kept_as_text(self, respx_mock):
+        def handler(request: httpx.Request) -> httpx.Response:
+            page = json.loads(request.content).get("pagination", {}).get("page", 1)
+            count = 2**70 if page == 2 else page
+            return httpx.Response(
+                200,
+                json={
+                    "data": [{"holders_count": count}],
+                    "pagination": {"page": page, "per_page": 1, "is_last_page": page == 2},
+                },
+            )
+
+        respx_mock.post("/smart-money/holdings").mock(side_effect=handler)
+        with Nansen(api_key="test-key", rate_limiter=None, result_mode="raw") as client:
+            table = client.smart_money.holdings(chains=["ethereum"]).to_arrow(all_pages=True)
+        assert table.schema.field("holders_count").type == pa.string()
+        assert table.column("holders_count").to_pylist() == ["1", str(2**70)]
+        assert table.schema.field("value_usd").type == pa.float64()
+
+    @respx.mock(base_url="https://api.nansen.ai/api/v1")
+    def test_to_pandas(self, respx_mock, holdings_route):
+        pytest.importorskip("pandas")
+        holdings_route(respx_mock, _rows, pages=2)
+        with Nansen(api_key="test-key", rate_limiter=None) as client:
+            frame = client.smart_money.holdings(chains=["ethereum"]).to_pandas(all_pages=True)
+        assert frame["token_symbol"].isna().tolist() == [False, True, False, True]
+        assert frame["token_symbol"][2] == "T2"
+        assert frame["value_usd"].dtype == "float64"
+
+    @respx.mock(base_url="https://api.nansen.ai/api/v1")
+    def test_to_polars(self, respx_mock, holdings_route):
+        pl = pytest.importorskip("polars")
+        holdings_route(respx_mock, _rows, pages=2)
+        with Nansen(api_key="test-key", rate_limiter=None) as client:
+            frame = client.smart_money.holdings(chains=["ethereum"]).to_polars(all_pages=True)
+        assert frame.height == 4
+        assert frame.schema["holders_count"] == pl.Int64
+
+    @respx.mock(base_url="https://api.nansen.ai/api/v1")
+    async def test_async_to_arrow(self, respx_mock, holdings_route):
+        holdings_route(respx_mock, _rows, pages=2)
+        async with AsyncNansen(api_key="test-key", rate_limiter=None) as client:
+            page = await client.smart_money.holdings(chains=["ethereum"])
+            table = await page.to_arrow(all_pages=True)
+        assert table.column("holders_count").to_pylist() == [1, None, 2, None]
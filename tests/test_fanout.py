@@ -0,0 +1,226 @@
+import json
+import threading
+import time
+
+import anyio
+import httpx
+import pytest
+import respx
+
+from nansen import AsyncNansen, BadRequestError, FanOutResult, NotFoundError
+from nansen._types import ALL_CHAINS
+
+
+def _balance_route(respx_mock, *, failing=(), delay: float = 0.0):
+    state = {"active": 0, "peak": 0}
+    lock = threading.Lock()
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        chain = json.loads(request.content)["chain"]
+        with lock:
+            state["active"] += 1
+            state["peak"] = max(state["peak"], state["active"])
+        time.sleep(delay)
+        with lock:
+            state["active"] -= 1
+        if chain in failing:
+            return httpx.Response(400, json={"error": {"message": f"{chain} unsupported"}})
+        return httpx.Response(
+            200,
+            json={
+                "data": [{"token_symbol": f"{chain}-A"}, {"token_symbol": f"{chain}-B"}],
+                "pagination": {"page": 1, "per_page": 10, "is_last_page": True},
+            },
+        )
+
+    route = respx_mock.post("/profiler/address/current-balance").mock(side_effect=handler)
+    return route, state
+
+
+class TestAcrossChains:
+    @respx.mock(base_url="https://api.nansen.ai/api/v1")
+    def test_per_chain_results_and_merged_stream(self, respx_mock, client):
+        route, _ = _balance_route(respx_mock)
+        outcome = client.across_chains(
+            client.profiler.address.current_balance,
+            chains=["ethereum", "base", "ethereum"],
+            address="0xabc",
+        )
+        assert isinstance(outcome, FanOutResult)
+        assert outcome.ok
+        assert list(outcome.results) == ["ethereum", "base"]
+        assert route.call_count == 2
+        assert [(chain, item.token_symbol) for chain, item in outcome.iter_items()] == [
+            ("ethereum", "ethereum-A"),
+            ("ethereum", "ethereum-B"),
+            ("base", "base-A"),
+            ("base", "base-B"),
+        ]
+        body = json.loads(route.calls[0].request.content)
+        assert body["address"] == "0xabc"
+
+    @respx.mock(base_url="https://api.nansen.ai/api/v1")
+    def test_defaults_to_all_chains_concurrently(self, respx_mock, client):
+        route, state = _balance_route(respx_mock, delay=0.02)
+        outcome = client.across_chains(
+            client.profiler.address.current_balance, address="0xabc", max_concurrency=6
+        )
+        assert list(outcome.results) == list(ALL_CHAINS)
+        assert route.call_count == len(ALL_CHAINS)
+        assert 1 < state["peak"] <= 6
+
+    @respx.mock(base_url="https://api.nansen.ai/api/v1")
+    def test_errors_do_not_abort_other_chains(self, respx_mock, client):
+        _balance_route(respx_mock, failing=("ton",))
+        outcome = client.across_chains(
+            client.profiler.address.current_balance,
+            chains=["ethereum", "ton", "solana"],
+            address="0xabc",
+        )
+        assert not outcome.ok
+        assert list(outcome.results) == ["ethereum", "solana"]
+        assert isinstance(outcome.errors["ton"], BadRequestError)
+        with pytest.raises(BadRequestError):
+            outcome.raise_for_errors()
+
+    @respx.mock(base_url="https://api.nansen.ai/api/v1")
+    async def test_async_across_chains(self, respx_mock):
+        _balance_route(respx_mock, failing=("sui",))
+        async with AsyncNansen(api_key="test-key", rate_limiter=None) as client:
+            outcome = await client.across_chains(
+                client.profiler.address.current_balance,
+                chains=["ethereum", "sui", "base"],
+                address="0xabc",
+                max_concurrency=2,
+            )
+        assert list(outcome.results) == ["ethereum", "base"]
+        assert list(outcome.errors) == ["sui"]
+        assert len(list(outcome.iter_items())) == 4
+
+
+def _per_address_route(respx_mock, path: str, *, delays=None, failing=()):
+    delays = delays or {}
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        body = json.loads(request.content)
+        address = body.get("address") or body["parameters"]["address"]
+        time.sleep(delays.get(address, 0.0))
+        if address in failing:
+            return httpx.Response(404, json={"error": {"message": f"{address} not found"}})
+        if "parameters" in body:
+            return httpx.Response(200, json=[{"label": f"label-{address}"}])
+        return httpx.Response(
+            200,
+            json={
+                "data": [{"address": address, "token_symbol": address}],
+                "pagination": {"page": 1, "per_page": 10, "is_last_page": True},
+            },
+        )
+
+    return respx_mock.post(path).mock(side_effect=handler)
+
+
+class TestAddressMany:
+    @respx.mock(base_url="https://api.nansen.ai/api/v1")
+    def test_streams_in_completion_order(self, respx_mock, client):
+        route = _per_address_route(
+            respx_mock,
+            "/profiler/address/current-balance",
+            delays={"0xslow": 0.3, "0xfast": 0.0, "0xmid": 0.1},
+        )
+        stream = client.profiler.address.current_balance_many(
+            addresses=["0xslow", "0xfast", "0xmid", "0xfast"], chain="ethereum"
+        )
+        order = [address for address, _ in stream]
+        assert order == ["0xfast", "0xmid", "0xslow"]
+        assert route.call_count == 3
+        assert stream.results["0xmid"].data[0].token_symbol == "0xmid"
+
+    @respx.mock(base_url="https://api.nansen.ai/api/v1")
+    def test_collect_maps_results_and_errors(self, respx_mock, client):
+        _per_address_route(respx_mock, "/profiler/address/related-wallets", failing=("0xbad",))
+        outcome = client.profiler.address.related_wallets_many(
+            addresses=["0xa", "0xbad", "0xb"], chain="ethereum", max_concurrency=2
+        ).collect()
+        assert list(outcome.results) == ["0xa", "0xb"]
+        assert isinstance(outcome.errors["0xbad"], NotFoundError)
+
+    @respx.mock(base_url="https://api.nansen.ai/api/v1")
+    def test_collect_after_partial_iteration(self, respx_mock, client):
+        _per_address_route(respx_mock, "/profiler/address/current-balance")
+        stream = client.profiler.address.current_balance_many(
+            addresses=[f"0x{i}" for i in range(10)], chain="ethereum", max_concurrency=3
+        )
+        first = next(iter(stream))
+        outcome = stream.collect()
+        assert first[0] in outcome.results
+        assert list(outcome.results) == [f"0x{i}" for i in range(10)]
+
+    @respx.mock(base_url="https://api.nansen.ai/api/beta")
+    def test_labels_many(self, respx_mock, client):
+        _per_address_route(respx_mock, "/profiler/address/labels")
+        outcome = client.profiler.address.labels_many(
+            addresses=["0xa", "0xb"], chain="ethereum"
+        ).collect()
+        assert outcome.results["0xb"].data[0].label == "label-0xb"
+
+    @respx.mock(base_url="https://api.nansen.ai/api/v1")
+    async def test_async_many(self, respx_mock):
+        _per_address_route(
+            respx_mock,
+            "/profiler/address/current-balance",
+            failing=("0xbad",),
+        )
+        async with AsyncNansen(api_key="test-key", rate_limiter=None) as client:
+            stream = client.profiler.address.current_balance_many(
+                addresses=["0xa", "0xbad", "0xb", "0xa"], chain="ethereum", max_concurrency=2
+            )
+            seen = [address async for address, _ in stream]
+            outcome = await stream.collect()
+        assert sorted(seen) == ["0xa", "0xb"]
+        assert list(outcome.results) == ["0xa", "0xb"]
+        assert list(outcome.errors) == ["0xbad"]
+
+    @respx.mock(base_url="https://api.nansen.ai/api/v1")
+    async def test_async_early_exit_cancels_remaining(self, respx_mock):
+        route = _per_address_route(respx_mock, "/profiler/address/current-balance")
+        async with AsyncNansen(api_key="test-key", rate_limiter=None) as client:
+            stream = client.profiler.address.current_balance_many(
+                addresses=[f"0x{i}" for i in range(10)], chain="ethereum", max_concurrency=2
+            )
+            async for _ in stream:
+                break
+            await anyio.sleep(0.05)
+        assert route.call_count <= 3
+
+    @respx.mock(base_url="https://api.nansen.ai/api/v1")
+    async def test_async_without_context_manager(self, respx_mock):
+        _per_address_route(respx_mock, "/profiler/address/current-balance", failing=("0x3",))
+        client = AsyncNansen(api_key="test-key", rate_limiter=None)
+        addresses = [f"0x{i}" for i in range(5)]
+        stream = client.profiler.address.current_balance_many(
+            addresses=addresses, chain="ethereum", max_concurrency=2
+        )
+        seen = [address async for address, _ in stream]
+        outcome = await client.profiler.address.current_balance_many(
+            addresses=addresses, chain="ethereum", max_concurrency=2
+        ).collect()
+        await client.close()
+        assert sorted(seen) == ["0x0", "0x1", "0x2", "0x4"]
+        assert list(outcome.results) == ["0x0", "0x1", "0x2", "0x4"]
+        assert list(outcome.errors) == ["0x3"]
+
+    @respx.mock(base_url="https://api.nansen.ai/api/v1")
+    def test_trio_many(self, respx_mock):
+        pytest.importorskip("trio")
+        _per_address_route(respx_mock, "/profiler/address/current-balance", failing=("0xbad",))
+
+        async def main() -> FanOutResult:
+            async with AsyncNansen(api_key="test-key", rate_limiter=None) as client:
+                return await client.profiler.address.current_balance_many(
+                    addresses=["0xa", "0xbad", "0xb"], chain="ethereum", max_concurrency=2
+                ).collect()
+
+        outcome = anyio.run(main, backend="trio")
+        assert list(outcome.results) == ["0xa", "0xb"]
+        assert list(outcome.errors) == ["0xbad"]
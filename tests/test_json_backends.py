@@ -0,0 +1,68 @@
+import httpx
+import pytest
+import respx
+
+from nansen import AsyncNansen, Nansen
+
+BACKENDS = ["pydantic", "orjson", "msgspec"]
+
+PAGE_BODY = {
+    "data": [
+        {"token_symbol": "ETH", "value_usd": 1000.0, "new_future_field": "hello"},
+        {"token_symbol": "BTC", "value_usd": 2000.0},
+    ],
+    "pagination": {"page": 1, "per_page": 2, "is_last_page": True},
+    "meta": {"ignored": True},
+}
+
+
+class TestJSONBackends:
+    @pytest.mark.parametrize("backend", BACKENDS)
+    @respx.mock(base_url="https://api.nansen.ai/api/v1")
+    def test_page_parsing(self, respx_mock, backend):
+        pytest.importorskip(backend)
+        respx_mock.post("/smart-money/holdings").mock(
+            return_value=httpx.Response(200, json=PAGE_BODY)
+        )
+        with Nansen(api_key="test-key", json_backend=backend) as client:
+            page = client.smart_money.holdings(chains=["ethereum"])
+        assert [item.token_symbol for item in page.data] == ["ETH", "BTC"]
+        assert page.data[0].new_future_field == "hello"  # type: ignore[attr-defined]
+        assert page.pagination.per_page == 2
+        assert not page.has_next_page
+
+    @pytest.mark.parametrize("backend", BACKENDS)
+    @respx.mock(base_url="https://api.nansen.ai/api/v1")
+    def test_object_parsing(self, respx_mock, backend):
+        pytest.importorskip(backend)
+        respx_mock.post("/tgm/token-information").mock(
+            return_value=httpx.Response(200, json={"data": {"name": "Ether", "symbol": "ETH"}})
+        )
+        with Nansen(api_key="test-key", json_backend=backend) as client:
+            resp = client.tgm.token_information(
+                chain="ethereum", token_address="0xabc", timeframe="24h"
+            )
+        assert resp.data.data is not None
+        assert resp.data.data.symbol == "ETH"
+
+    @respx.mock(base_url="https://api.nansen.ai/api/v1")
+    def test_missing_sections_use_defaults(self, respx_mock):
+        respx_mock.post("/smart-money/holdings").mock(return_value=httpx.Response(200, json={}))
+        with Nansen(api_key="test-key") as client:
+            page = client.smart_money.holdings(chains=["ethereum"])
+        assert page.data == []
+        assert page.pagination.is_last_page
+
+    @respx.mock(base_url="https://api.nansen.ai/api/v1")
+    async def test_async_client_backend(self, respx_mock):
+        pytest.importorskip("orjson")
+        respx_mock.post("/smart-money/holdings").mock(
+            return_value=httpx.Response(200, json=PAGE_BODY)
+        )
+        async with AsyncNansen(api_key="test-key", json_backend="orjson") as client:
+            page = await client.smart_money.holdings(chains=["ethereum"])
+        assert len(page) == 2
+
+    def test_unknown_backend_raises(self):
+        with pytest.raises(ValueError, match="Unknown json_backend"):
+            Nansen(api_key="test-key", json_backend="simdjson")  # type: ignore[arg-type]
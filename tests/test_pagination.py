@@ -1,14 +1,17 @@
+import asyncio
+import gc
+import json
+import time
+
+import anyio
 import httpx
 import pytest
 import respx
 
-from nansen import Nansen
-
-
-@pytest.fixture
-def client():
-    with Nansen(api_key="test-key") as c:
-        yield c
+from nansen import AsyncNansen, BadRequestError, Nansen, SyncPage
+from nansen._models import BaseModel
+from nansen._pagination import PaginationInfo
+from nansen.types.smart_money import SmartMoneyHoldingItem
 
 
 class TestPagination:
@@ -121,3 +124,536 @@ class TestPagination:
         assert item.token_symbol == "ETH"
         # extra="allow" means unknown fields don't raise
         assert item.new_future_field == "hello"  # type: ignore[attr-defined]
+
+
+def _holdings_page(page: int, *, last_page: int) -> httpx.Response:
+    return httpx.Response(
+        200,
+        json={
+            "data": [{"token_symbol": f"T{page}"}],
+            "pagination": {"page": page, "per_page": 1, "is_last_page": page == last_page},
+        },
+    )
+
+
+def _paged_route(respx_mock, last_page: int):
+    def handler(request: httpx.Request) -> httpx.Response:
+        page = json.loads(request.content).get("pagination", {}).get("page", 1)
+        return _holdings_page(page, last_page=last_page)
+
+    return respx_mock.post("/smart-money/holdings").mock(side_effect=handler)
+
+
+class TestPrefetch:
+    @respx.mock(base_url="https://api.nansen.ai/api/v1")
+    def test_order_preserved(self, respx_mock, client):
+        _paged_route(respx_mock, last_page=6)
+        page = client.smart_money.holdings(chains=["ethereum"])
+        pages = list(page.iter_pages(prefetch=2))
+        assert [p.pagination.page for p in pages] == [1, 2, 3, 4, 5, 6]
+        assert [p.data[0].token_symbol for p in pages] == ["T1", "T2", "T3", "T4", "T5", "T6"]
+
+    @respx.mock(base_url="https://api.nansen.ai/api/v1")
+    def test_reads_ahead_while_consumer_works(self, respx_mock, client):
+        route = _paged_route(respx_mock, last_page=5)
+        page = client.smart_money.holdings(chains=["ethereum"])
+        pages = page.iter_pages(prefetch=2)
+        next(pages)
+        deadline = time.monotonic() + 2
+        while route.call_count < 3 and time.monotonic() < deadline:
+            time.sleep(0.01)
+        # Page 1 plus two read-ahead pages, fetched without the consumer asking.
+        assert route.call_count == 3
+        pages.close()
+
+    @respx.mock(base_url="https://api.nansen.ai/api/v1")
+    def test_early_stop(self, respx_mock, client):
+        route = _paged_route(respx_mock, last_page=50)
+        page = client.smart_money.holdings(chains=["ethereum"])
+        for p in page.iter_pages(prefetch=2):
+            if p.pagination.page == 2:
+                break
+        time.sleep(0.3)
+        assert route.call_count < 10
+
+    @respx.mock(base_url="https://api.nansen.ai/api/v1")
+    def test_error_propagates(self, respx_mock, client):
+        respx_mock.post("/smart-money/holdings").mock(
+            side_effect=[
+                _holdings_page(1, last_page=3),
+                httpx.Response(400, json={"error": {"message": "bad"}}),
+            ]
+        )
+        page = client.smart_money.holdings(chains=["ethereum"])
+        seen = []
+        with pytest.raises(BadRequestError):
+            for p in page.iter_pages(prefetch=2):
+                seen.append(p.pagination.page)
+        assert seen == [1]
+
+    @respx.mock(base_url="https://api.nansen.ai/api/v1")
+    def test_user_pagination_not_mutated(self, respx_mock, client):
+        _paged_route(respx_mock, last_page=2)
+        pagination = {"page": 1, "per_page": 1}
+        page = client.smart_money.holdings(chains=["ethereum"], pagination=pagination)
+        list(page.iter_pages(prefetch=1))
+        assert pagination == {"page": 1, "per_page": 1}
+
+
+class TestAsyncPrefetch:
+    @respx.mock(base_url="https://api.nansen.ai/api/v1")
+    async def test_order_preserved(self, respx_mock):
+        _paged_route(respx_mock, last_page=5)
+        async with AsyncNansen(api_key="test-key") as client:
+            page = await client.smart_money.holdings(chains=["ethereum"])
+            numbers = [p.pagination.page async for p in page.iter_pages(prefetch=3)]
+        assert numbers == [1, 2, 3, 4, 5]
+
+    @respx.mock(base_url="https://api.nansen.ai/api/v1")
+    async def test_early_stop_cancels_producer(self, respx_mock):
+        route = _paged_route(respx_mock, last_page=50)
+        async with AsyncNansen(api_key="test-key") as client:
+            page = await client.smart_money.holdings(chains=["ethereum"])
+            async for p in page.iter_pages(prefetch=2):
+                if p.pagination.page == 2:
+                    break
+            await asyncio.sleep(0.01)
+            calls = route.call_count
+            await asyncio.sleep(0.05)
+            assert route.call_count == calls
+            assert calls <= 5
+
+    @respx.mock(base_url="https://api.nansen.ai/api/v1")
+    async def test_error_raised_unwrapped(self, respx_mock):
+        def handler(request: httpx.Request) -> httpx.Response:
+            page = json.loads(request.content).get("pagination", {}).get("page", 1)
+            if page > 3:
+                return httpx.Response(400, json={"error": {"message": "page out of range"}})
+            return _holdings_page(page, last_page=10)
+
+        respx_mock.post("/smart-money/holdings").mock(side_effect=handler)
+        async with AsyncNansen(api_key="test-key", max_retries=0) as client:
+            page = await client.smart_money.holdings(chains=["ethereum"])
+            seen = []
+            with pytest.raises(BadRequestError):
+                async for p in page.iter_pages(prefetch=2):
+                    seen.append(p.pagination.page)
+        assert seen == [1, 2, 3]
+
+    @respx.mock(base_url="https://api.nansen.ai/api/v1")
+    def test_trio_backend(self, respx_mock):
+        pytest.importorskip("trio")
+        _paged_route(respx_mock, last_page=4)
+
+        async def main() -> list[int]:
+            async with AsyncNansen(api_key="test-key") as client:
+                page = await client.smart_money.holdings(chains=["ethereum"])
+                return [p.pagination.page async for p in page.iter_pages(prefetch=2)]
+
+        assert anyio.run(main, backend="trio") == [1, 2, 3, 4]
+
+    @respx.mock(base_url="https://api.nansen.ai/api/v1")
+    def test_trio_break(self, respx_mock):
+        pytest.importorskip("trio")
+        _paged_route(respx_mock, last_page=50)
+
+        async def main() -> int:
+            async with AsyncNansen(api_key="test-key") as client:
+                page = await client.smart_money.holdings(chains=["ethereum"])
+                async for p in page.iter_pages(prefetch=2):
+                    if p.pagination.page == 2:
+                        break
+                await anyio.sleep(0.01)
+                return p.pagination.page
+
+        assert anyio.run(main, backend="trio") == 2
+
+    @respx.mock(base_url="https://api.nansen.ai/api/v1")
+    async def test_without_context_manager_fetches_on_demand(self, respx_mock):
+        route = _paged_route(respx_mock, last_page=5)
+        client = AsyncNansen(api_key="test-key")
+        page = await client.smart_money.holdings(chains=["ethereum"])
+        async for p in page.iter_pages(prefetch=3):
+            if p.pagination.page == 2:
+                break
+        await client.close()
+        assert route.call_count == 2
+
+
+def _bounded_route(respx_mock, last_page: int, *, partial: bool = False):
+    """Serve pages 1..last_page and reject anything beyond, like an out-of-range page."""
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        page = json.loads(request.content).get("pagination", {}).get("page", 1)
+        if page > last_page:
+            return httpx.Response(400, json={"error": {"message": "page out of range"}})
+        rows = 1 if partial else 2
+        return httpx.Response(
+            200,
+            json={
+                "data": [{"token_symbol": f"T{page}"}] * rows,
+                "pagination": {"page": page, "per_page": 2, "is_last_page": page == last_page},
+            },
+        )
+
+    return respx_mock.post("/smart-money/holdings").mock(side_effect=handler)
+
+
+class TestFanOut:
+    @respx.mock(base_url="https://api.nansen.ai/api/v1")
+    def test_waves_widen_and_overshoot_is_discarded(self, respx_mock, client):
+        route = _bounded_route(respx_mock, last_page=8)
+        page = client.smart_money.holdings(chains=["ethereum"])
+        pages = list(page.iter_pages_fan_out(initial_wave=2, max_wave=16))
+        assert [p.pagination.page for p in pages] == list(range(1, 9))
+        # Waves of 2, 4 and 8 after the first page: pages 9-15 are overshoot.
+        assert route.call_count <= 15
+
+    @respx.mock(base_url="https://api.nansen.ai/api/v1")
+    def test_wave_stays_narrow_for_partial_pages(self, respx_mock, client):
+        route = _bounded_route(respx_mock, last_page=5, partial=True)
+        page = client.smart_money.holdings(chains=["ethereum"])
+        pages = list(page.iter_pages_fan_out(initial_wave=2))
+        assert [p.pagination.page for p in pages] == [1, 2, 3, 4, 5]
+        assert route.call_count <= 7
+
+    @respx.mock(base_url="https://api.nansen.ai/api/v1")
+    def test_single_page(self, respx_mock, client):
+        route = _bounded_route(respx_mock, last_page=1)
+        page = client.smart_money.holdings(chains=["ethereum"])
+        assert list(page.iter_pages_fan_out()) == [page]
+        assert route.call_count == 1
+
+    @respx.mock(base_url="https://api.nansen.ai/api/v1")
+    def test_error_before_last_page_raises(self, respx_mock, client):
+        respx_mock.post("/smart-money/holdings").mock(
+            side_effect=[
+                _holdings_page(1, last_page=9),
+                httpx.Response(400, json={"error": {"message": "bad"}}),
+                _holdings_page(3, last_page=9),
+            ]
+        )
+        page = client.smart_money.holdings(chains=["ethereum"])
+        with pytest.raises(BadRequestError):
+            list(page.iter_pages_fan_out(initial_wave=2))
+
+    def test_invalid_wave(self, client):
+        page = SyncPage(
+            data=[],
+            pagination=PaginationInfo(),
+            client=client,
+            path="/x",
+            body={},
+            model=BaseModel,
+        )
+        with pytest.raises(ValueError):
+            list(page.iter_pages_fan_out(initial_wave=4, max_wave=2))
+
+    @respx.mock(base_url="https://api.nansen.ai/api/v1")
+    async def test_async_fan_out(self, respx_mock):
+        route = _bounded_route(respx_mock, last_page=6)
+        async with AsyncNansen(api_key="test-key") as client:
+            page = await client.smart_money.holdings(chains=["ethereum"])
+            numbers = [p.pagination.page async for p in page.iter_pages_fan_out(max_wave=4)]
+        assert numbers == [1, 2, 3, 4, 5, 6]
+        assert route.call_count <= 11
+
+    @respx.mock(base_url="https://api.nansen.ai/api/v1")
+    async def test_async_error_before_last_page_raises(self, respx_mock):
+        respx_mock.post("/smart-money/holdings").mock(
+            side_effect=[
+                _holdings_page(1, last_page=9),
+                httpx.Response(400, json={"error": {"message": "bad"}}),
+                _holdings_page(3, last_page=9),
+            ]
+        )
+        async with AsyncNansen(api_key="test-key", max_retries=0) as client:
+            page = await client.smart_money.holdings(chains=["ethereum"])
+            with pytest.raises(BadRequestError):
+                async for _ in page.iter_pages_fan_out(initial_wave=2):
+                    pass
+
+    @respx.mock(base_url="https://api.nansen.ai/api/v1")
+    def test_trio_fan_out(self, respx_mock):
+        pytest.importorskip("trio")
+        _bounded_route(respx_mock, last_page=5)
+
+        async def main() -> list[int]:
+            async with AsyncNansen(api_key="test-key") as client:
+                page = await client.smart_money.holdings(chains=["ethereum"])
+                return [p.pagination.page async for p in page.iter_pages_fan_out(max_wave=4)]
+
+        assert anyio.run(main, backend="trio") == [1, 2, 3, 4, 5]
+
+    @respx.mock(base_url="https://api.nansen.ai/api/v1")
+    async def test_async_break_cancels_overshoot(self, respx_mock):
+        route = _bounded_route(respx_mock, last_page=40)
+        async with AsyncNansen(api_key="test-key") as client:
+            page = await client.smart_money.holdings(chains=["ethereum"])
+            async for p in page.iter_pages_fan_out(initial_wave=4):
+                if p.pagination.page == 3:
+                    break
+            await asyncio.sleep(0.01)
+            calls = route.call_count
+            await asyncio.sleep(0.05)
+            assert route.call_count == calls
+        assert calls <= 13
+
+    @respx.mock(base_url="https://api.nansen.ai/api/v1")
+    async def test_async_without_context_manager(self, respx_mock):
+        route = _bounded_route(respx_mock, last_page=6)
+        client = AsyncNansen(api_key="test-key")
+        page = await client.smart_money.holdings(chains=["ethereum"])
+        numbers = [p.pagination.page async for p in page.iter_pages_fan_out(max_wave=4)]
+        await client.close()
+        assert numbers == [1, 2, 3, 4, 5, 6]
+        assert route.call_count <= 11
+
+
+def _live_holdings() -> int:
+    return sum(isinstance(obj, SmartMoneyHoldingItem) for obj in gc.get_objects())
+
+
+class TestStreamItems:
+    @respx.mock(base_url="https://api.nansen.ai/api/v1")
+    def test_yields_all_items_in_order(self, respx_mock, client):
+        _paged_route(respx_mock, last_page=4)
+        page = client.smart_money.holdings(chains=["ethereum"])
+        symbols = [item.token_symbol for item in page.stream_items()]
+        assert symbols == ["T1", "T2", "T3", "T4"]
+        assert page.data[0].token_symbol == "T1"
+
+    @respx.mock(base_url="https://api.nansen.ai/api/v1")
+    def test_memory_stays_flat(self, respx_mock, client):
+        def handler(request: httpx.Request) -> httpx.Response:
+            number = json.loads(request.content).get("pagination", {}).get("page", 1)
+            return httpx.Response(
+                200,
+                json={
+                    "data": [{"token_symbol": f"T{number}-{i}"} for i in range(50)],
+                    "pagination": {"page": number, "per_page": 50, "is_last_page": number == 20},
+                },
+            )
+
+        respx_mock.post("/smart-money/holdings").mock(side_effect=handler)
+        page = client.smart_money.holdings(chains=["ethereum"])
+        gc.collect()
+        baseline = _live_holdings()
+        peak = 0
+        count = 0
+        for item in page.stream_items():
+            count += 1
+            del item
+            if count % 50 == 25:
+                gc.collect()
+                peak = max(peak, _live_holdings() - baseline)
+        assert count == 1000
+        # Never more than the page being consumed is alive (beyond the first page).
+        assert peak <= 50
+
+    @respx.mock(base_url="https://api.nansen.ai/api/v1")
+    def test_leaves_fetched_pages_intact(self, respx_mock, client, monkeypatch):
+        # Fetched pages may be shared, e.g. by requests coalesced into one flight.
+        _paged_route(respx_mock, last_page=3)
+        fetched: list[SyncPage] = []
+        fetch_page = SyncPage._fetch_page
+
+        def spy(self, number):
+            page = fetch_page(self, number)
+            fetched.append(page)
+            return page
+
+        monkeypatch.setattr(SyncPage, "_fetch_page", spy)
+        page = client.smart_money.holdings(chains=["ethereum"])
+        assert len(list(page.stream_items())) == 3
+        assert [p.data[0].token_symbol for p in fetched] == ["T2", "T3"]
+
+    @respx.mock(base_url="https://api.nansen.ai/api/v1")
+    async def test_async_stream_items(self, respx_mock):
+        _paged_route(respx_mock, last_page=3)
+        async with AsyncNansen(api_key="test-key") as client:
+            page = await client.smart_money.holdings(chains=["ethereum"])
+            symbols = [item.token_symbol async for item in page.stream_items()]
+        assert symbols == ["T1", "T2", "T3"]
+
+
+class TestResponseMeta:
+    @respx.mock(base_url="https://api.nansen.ai/api/v1")
+    def test_page_meta(self, respx_mock, client):
+        respx_mock.post("/smart-money/holdings").mock(
+            return_value=httpx.Response(
+                200,
+                json={"data": [], "pagination": {"page": 1, "per_page": 10, "is_last_page": True}},
+                headers={"x-nansen-credits-used": "3"},
+            )
+        )
+        page = client.smart_money.holdings(chains=["ethereum"])
+        assert page.meta is not None
+        assert page.meta.status_code == 200
+        assert page.meta.url.endswith("/smart-money/holdings")
+        assert page.meta.elapsed >= 0
+        assert page.meta.decompressed_bytes > 0
+        assert page.meta.rate_limit.credits_used == 3
+        assert not hasattr(page.meta, "content")
+
+
+def _dataset_route(respx_mock, total: int, *, max_per_page: int = 1000):
+    """Serve *total* rows, honouring page/per_page and rejecting oversized pages."""
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        pagination = json.loads(request.content).get("pagination", {})
+        page, per_page = pagination.get("page", 1), pagination.get("per_page", 10)
+        if per_page > max_per_page:
+            return httpx.Response(400, json={"error": {"message": "per_page too large"}})
+        start = (page - 1) * per_page
+        rows = [{"token_symbol": f"T{i}"} for i in range(start, min(start + per_page, total))]
+        return httpx.Response(
+            200,
+            json={
+                "data": rows,
+                "pagination": {
+                    "page": page,
+                    "per_page": per_page,
+                    "is_last_page": start + per_page >= total,
+                },
+            },
+        )
+
+    return respx_mock.post("/smart-money/holdings").mock(side_effect=handler)
+
+
+def _sizes(route) -> list[tuple[int, int]]:
+    return [
+        (body["pagination"]["page"], body["pagination"]["per_page"])
+        for body in (json.loads(call.request.content) for call in route.calls)
+    ]
+
+
+class TestLimit:
+    @respx.mock(base_url="https://api.nansen.ai/api/v1")
+    def test_small_limit_is_one_request(self, respx_mock, client):
+        route = _dataset_route(respx_mock, total=500)
+        page = client.smart_money.holdings(chains=["ethereum"], limit=25)
+        items = list(page)
+        assert len(items) == 25
+        assert not page.has_next_page
+        assert _sizes(route) == [(1, 25)]
+
+    @respx.mock(base_url="https://api.nansen.ai/api/v1")
+    def test_final_page_trimmed(self, respx_mock, client):
+        route = _dataset_route(respx_mock, total=5000)
+        page = client.smart_money.holdings(chains=["ethereum"], limit=2500)
+        pages = list(page.iter_pages())
+        assert [len(p.data) for p in pages] == [1000, 1000, 500]
+        assert _sizes(route) == [(1, 1000), (2, 1000), (3, 1000)]
+
+    @respx.mock(base_url="https://api.nansen.ai/api/v1")
+    def test_limit_beyond_total(self, respx_mock, client):
+        _dataset_route(respx_mock, total=30)
+        page = client.smart_money.holdings(chains=["ethereum"], limit=100)
+        assert [item.token_symbol for item in page] == [f"T{i}" for i in range(30)]
+
+    @respx.mock(base_url="https://api.nansen.ai/api/v1")
+    def test_explicit_per_page_kept(self, respx_mock, client):
+        route = _dataset_route(respx_mock, total=100)
+        page = client.smart_money.holdings(
+            chains=["ethereum"], pagination={"per_page": 4}, limit=10
+        )
+        assert len(list(page.stream_items())) == 10
+        assert _sizes(route) == [(1, 4), (2, 4), (3, 4)]
+
+    @respx.mock(base_url="https://api.nansen.ai/api/v1")
+    def test_backs_off_rejected_page_size(self, respx_mock, client):
+        route = _dataset_route(respx_mock, total=1000, max_per_page=250)
+        page = client.smart_money.holdings(chains=["ethereum"], limit=600)
+        items = list(page)
+        assert [item.token_symbol for item in items] == [f"T{i}" for i in range(600)]
+        assert _sizes(route) == [(1, 600), (1, 300), (1, 150), (2, 150), (3, 150), (4, 150)]
+        # The accepted size is remembered for later calls to the same endpoint.
+        seen = len(route.calls)
+        client.smart_money.holdings(chains=["ethereum"], limit=600)
+        assert _sizes(route)[seen:] == [(1, 150)]
+
+    @respx.mock(base_url="https://api.nansen.ai/api/v1")
+    def test_unrelated_bad_request_not_retried(self, respx_mock, client):
+        route = respx_mock.post("/smart-money/holdings").mock(
+            return_value=httpx.Response(400, json={"error": {"message": "unknown chain"}})
+        )
+        with pytest.raises(BadRequestError, match="unknown chain"):
+            client.smart_money.holdings(chains=["ethereum"], limit=600)
+        assert route.call_count == 1
+        # A failed request does not shrink the page size used next time.
+        _dataset_route(respx_mock, total=1000)
+        client.smart_money.holdings(chains=["ethereum"], limit=600)
+        assert _sizes(route)[-1] == (1, 600)
+
+    @respx.mock(base_url="https://api.nansen.ai/api/v1")
+    def test_backoff_gives_up_after_max_shrinks(self, respx_mock, client):
+        route = _dataset_route(respx_mock, total=1000, max_per_page=0)
+        with pytest.raises(BadRequestError, match="per_page"):
+            client.smart_money.holdings(chains=["ethereum"], limit=600)
+        assert [size for _, size in _sizes(route)] == [600, 300, 150, 75, 37, 18]
+        assert client._max_per_page == {}
+
+    @respx.mock(base_url="https://api.nansen.ai/api/v1")
+    def test_backoff_keeps_offset_aligned(self, respx_mock, client):
+        calls = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            pagination = json.loads(request.content)["pagination"]
+            page, per_page = pagination["page"], pagination["per_page"]
+            calls.append((page, per_page))
+            if page > 1 and per_page > 4:
+                raise httpx.ReadTimeout("slow page")
+            start = (page - 1) * per_page
+            return httpx.Response(
+                200,
+                json={
+                    "data": [{"token_symbol": f"T{i}"} for i in range(start, start + per_page)],
+                    "pagination": {"page": page, "per_page": per_page, "is_last_page": False},
+                },
+            )
+
+        respx_mock.post("/smart-money/holdings").mock(side_effect=handler)
+        with Nansen(api_key="test-key", max_retries=0) as c:
+            page = c.smart_money.holdings(
+                chains=["ethereum"], pagination={"per_page": 12}, limit=20
+            )
+            symbols = [item.token_symbol for item in page]
+        assert symbols == [f"T{i}" for i in range(20)]
+        # Offset 12 is kept by shrinking to 6 (page 3), then 3 (page 5 = items 12..14).
+        assert calls[:4] == [(1, 12), (2, 12), (3, 6), (5, 3)]
+
+    @respx.mock(base_url="https://api.nansen.ai/api/v1")
+    def test_no_request_past_limit(self, respx_mock, client):
+        route = _dataset_route(respx_mock, total=100)
+        page = client.smart_money.holdings(
+            chains=["ethereum"], pagination={"per_page": 10}, limit=20
+        )
+        pages = list(page.iter_pages_fan_out(initial_wave=4))
+        assert sum(len(p.data) for p in pages) == 20
+        assert all(body_page <= 2 for body_page, _ in _sizes(route))
+
+    def test_invalid_limit(self, client):
+        with pytest.raises(ValueError):
+            client.smart_money.holdings(chains=["ethereum"], limit=0)
+
+    @respx.mock(base_url="https://api.nansen.ai/api/v1")
+    def test_limit_survives_checkpoint(self, respx_mock, client):
+        _dataset_route(respx_mock, total=100)
+        page = client.smart_money.holdings(
+            chains=["ethereum"], pagination={"per_page": 10}, limit=25
+        )
+        token = page.next_cursor().to_token()
+        resumed = client.resume_page(token)
+        assert sum(len(p.data) for p in resumed.iter_pages()) == 15
+
+    @respx.mock(base_url="https://api.nansen.ai/api/v1")
+    async def test_async_limit(self, respx_mock):
+        route = _dataset_route(respx_mock, total=3000, max_per_page=500)
+        async with AsyncNansen(api_key="test-key") as client:
+            page = await client.smart_money.holdings(chains=["ethereum"], limit=1200)
+            items = [item async for item in page]
+        assert len(items) == 1200
+        assert _sizes(route)[0] == (1, 1000)
+        assert _sizes(route)[1] == (1, 500)
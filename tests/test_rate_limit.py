@@ -0,0 +1,173 @@
+import threading
+import time
+
+import httpx
+import pytest
+import respx
+
+from nansen import AsyncNansen, Nansen, RateLimiter, RateLimitInfo
+
+PAGE = {
+    "data": [{"token_symbol": "ETH"}],
+    "pagination": {"page": 1, "per_page": 10, "is_last_page": True},
+}
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class TestRateLimiter:
+    def test_burst_then_per_second_pacing(self):
+        clock = FakeClock()
+        limiter = RateLimiter(per_second=20, per_minute=300, clock=clock)
+        assert [limiter.reserve() for _ in range(20)] == [0.0] * 20
+        assert limiter.reserve() == pytest.approx(0.05)
+        assert limiter.reserve() == pytest.approx(0.10)
+
+    def test_per_minute_budget(self):
+        clock = FakeClock()
+        limiter = RateLimiter(per_second=100, per_minute=30, clock=clock)
+        assert all(limiter.reserve() == 0.0 for _ in range(30))
+        # Per-minute bucket is exhausted: it refills at 0.5 tokens/s.
+        assert limiter.reserve() == pytest.approx(2.0)
+
+    def test_refill_after_idle(self):
+        clock = FakeClock()
+        limiter = RateLimiter(per_second=2, per_minute=300, clock=clock)
+        limiter.reserve()
+        limiter.reserve()
+        assert limiter.available == 0
+        clock.now += 10
+        assert limiter.available == 2
+        assert limiter.reserve() == 0.0
+
+    def test_invalid_limits(self):
+        with pytest.raises(ValueError):
+            RateLimiter(per_second=0)
+
+    def test_threads_get_distinct_slots(self):
+        limiter = RateLimiter(per_second=5, per_minute=300)
+        waits: list[float] = []
+        lock = threading.Lock()
+
+        def worker() -> None:
+            delay = limiter.reserve()
+            with lock:
+                waits.append(delay)
+
+        threads = [threading.Thread(target=worker) for _ in range(10)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        waits.sort()
+        assert waits[:5] == [0.0] * 5
+        assert waits[-1] == pytest.approx(1.0, abs=0.05)
+
+
+class TestGovernor:
+    def test_exhausted_budget_waits_until_reset(self):
+        clock = FakeClock()
+        limiter = RateLimiter(clock=clock)
+        limiter.observe(RateLimitInfo(remaining_minute=0, limit_minute=300, reset=12.5))
+        assert limiter.stats.wait_time == pytest.approx(12.5)
+        assert limiter.reserve() == pytest.approx(12.5)
+        clock.now = 12.5
+        assert limiter.reserve() == 0.0
+        stats = limiter.stats
+        assert stats.throttle_events == 1
+        assert stats.throttle_wait == pytest.approx(12.5)
+
+    def test_second_tier_reset_capped_to_one_second(self):
+        clock = FakeClock()
+        limiter = RateLimiter(clock=clock)
+        limiter.observe(RateLimitInfo(remaining_second=0, limit_second=20, reset=40.0))
+        assert limiter.reserve() == pytest.approx(1.0)
+
+    def test_low_budget_spreads_requests(self):
+        clock = FakeClock()
+        limiter = RateLimiter(clock=clock)
+        limiter.observe(RateLimitInfo(remaining_minute=10, limit_minute=300, reset=30.0))
+        assert [limiter.reserve() for _ in range(3)] == pytest.approx([0.0, 3.0, 6.0])
+
+    def test_recovered_budget_stops_pacing(self):
+        clock = FakeClock()
+        limiter = RateLimiter(clock=clock)
+        limiter.observe(RateLimitInfo(remaining_minute=10, limit_minute=300, reset=30.0))
+        limiter.reserve()
+        limiter.observe(RateLimitInfo(remaining_minute=290, limit_minute=300, reset=30.0))
+        assert limiter.reserve() == 0.0
+        assert limiter.stats.wait_time == 0.0
+
+    @respx.mock(base_url="https://api.nansen.ai/api/v1")
+    def test_client_feeds_every_response(self, respx_mock):
+        respx_mock.post("/smart-money/holdings").mock(
+            return_value=httpx.Response(
+                200,
+                json={**PAGE, "pagination": {"page": 1, "per_page": 1, "is_last_page": False}},
+                headers={
+                    "x-ratelimit-limit-minute": "300",
+                    "x-ratelimit-remaining-minute": "0",
+                    "ratelimit-reset": "7",
+                },
+            )
+        )
+        clock = FakeClock()
+        limiter = RateLimiter(clock=clock)
+        with Nansen(api_key="test-key", rate_limiter=limiter) as client:
+            client.smart_money.holdings(chains=["ethereum"])
+        stats = limiter.stats
+        assert stats.last_rate_limit is not None
+        assert stats.last_rate_limit.remaining_minute == 0
+        assert stats.wait_time == pytest.approx(7.0)
+
+
+class TestClientRateLimiting:
+    def test_default_limiter(self):
+        with Nansen(api_key="test-key") as client:
+            assert isinstance(client.rate_limiter, RateLimiter)
+
+    def test_disabled(self):
+        with Nansen(api_key="test-key", rate_limiter=None) as client:
+            assert client.rate_limiter is None
+
+    @respx.mock(base_url="https://api.nansen.ai/api/v1")
+    def test_shared_between_clients(self, respx_mock):
+        respx_mock.post("/smart-money/holdings").mock(return_value=httpx.Response(200, json=PAGE))
+        limiter = RateLimiter(per_second=3, per_minute=300)
+        a = Nansen(api_key="a", rate_limiter=limiter)
+        b = Nansen(api_key="b", rate_limiter=limiter)
+        start = time.monotonic()
+        for client in (a, b, a, b):
+            client.smart_money.holdings(chains=["ethereum"])
+        elapsed = time.monotonic() - start
+        a.close()
+        b.close()
+        # Four requests against a shared 3/s budget: the fourth waits ~1/3s.
+        assert elapsed >= 0.3
+
+    @respx.mock(base_url="https://api.nansen.ai/api/v1")
+    def test_each_retry_acquires(self, respx_mock):
+        respx_mock.post("/smart-money/holdings").mock(
+            side_effect=[httpx.Response(500), httpx.Response(200, json=PAGE)]
+        )
+        clock = FakeClock()
+        limiter = RateLimiter(per_second=20, per_minute=300, clock=clock)
+        with Nansen(api_key="test-key", max_retries=1, rate_limiter=limiter) as client:
+            client.smart_money.holdings(chains=["ethereum"])
+        assert limiter.available == 18
+
+    @respx.mock(base_url="https://api.nansen.ai/api/v1")
+    async def test_async_client_acquires(self, respx_mock):
+        respx_mock.post("/smart-money/holdings").mock(return_value=httpx.Response(200, json=PAGE))
+        clock = FakeClock()
+        limiter = RateLimiter(per_second=20, per_minute=300, clock=clock)
+        async with AsyncNansen(api_key="test-key", rate_limiter=limiter) as client:
+            await client.smart_money.holdings(chains=["ethereum"])
+            await client.smart_money.holdings(chains=["ethereum"])
+        assert limiter.available == 18
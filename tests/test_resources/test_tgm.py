@@ -1,8 +1,10 @@
+import json
+
 import httpx
 import pytest
 import respx
 
-from nansen import Nansen
+from nansen import AsyncNansen, Nansen, NotFoundError
 
 
 @pytest.fixture
@@ -71,6 +73,63 @@ class TestTokenInformation:
         assert resp.data.data.spot_metrics.total_holders == 100000
 
 
+class TestTokenInformationMany:
+    @staticmethod
+    def _route(respx_mock, failing=()):
+        def handler(request: httpx.Request) -> httpx.Response:
+            body = json.loads(request.content)
+            if body["token_address"] in failing:
+                return httpx.Response(404, json={"error": {"message": "unknown token"}})
+            symbol = f"{body['chain']}:{body['token_address']}"
+            return httpx.Response(200, json={"data": {"symbol": symbol}})
+
+        return respx_mock.post("/tgm/token-information").mock(side_effect=handler)
+
+    @respx.mock(base_url="https://api.nansen.ai/api/v1")
+    def test_dedupes_and_returns_dict(self, respx_mock, client):
+        route = self._route(respx_mock)
+        rows = [("ethereum", "0xAAA"), ("solana", "So1"), ("ethereum", "0xaaa")] * 100
+        info = client.tgm.token_information_many(tokens=rows, timeframe="24h")
+        assert route.call_count == 2
+        assert set(info) == {("ethereum", "0xAAA"), ("ethereum", "0xaaa"), ("solana", "So1")}
+        assert info[("ethereum", "0xAAA")] is info[("ethereum", "0xaaa")]
+        assert info[("solana", "So1")].data.symbol == "solana:So1"
+
+    @respx.mock(base_url="https://api.nansen.ai/api/v1")
+    def test_repeats_served_from_cache(self, respx_mock, client):
+        route = self._route(respx_mock)
+        client.tgm.token_information_many(tokens=[("ethereum", "0x1")], timeframe="24h")
+        info = client.tgm.token_information_many(
+            tokens=[("ethereum", "0x1"), ("ethereum", "0x2")], timeframe="24h"
+        )
+        assert route.call_count == 2
+        assert info[("ethereum", "0x2")].data.symbol == "ethereum:0x2"
+        # A different timeframe is a different lookup.
+        client.tgm.token_information_many(tokens=[("ethereum", "0x1")], timeframe="7d")
+        assert route.call_count == 3
+
+    @respx.mock(base_url="https://api.nansen.ai/api/v1")
+    def test_error_raised_after_successes_cached(self, respx_mock, client):
+        route = self._route(respx_mock, failing=("0xbad",))
+        with pytest.raises(NotFoundError):
+            client.tgm.token_information_many(
+                tokens=[("ethereum", "0x1"), ("ethereum", "0xbad")], timeframe="24h"
+            )
+        client.tgm.token_information_many(tokens=[("ethereum", "0x1")], timeframe="24h")
+        assert route.call_count == 2
+
+    @respx.mock(base_url="https://api.nansen.ai/api/v1")
+    async def test_async_token_information_many(self, respx_mock):
+        route = self._route(respx_mock)
+        async with AsyncNansen(api_key="test-key") as client:
+            tokens = [("ethereum", f"0x{i % 5}") for i in range(50)]
+            info = await client.tgm.token_information_many(tokens=tokens, timeframe="24h")
+            again = await client.tgm.token_information_many(tokens=tokens, timeframe="24h")
+        assert route.call_count == 5
+        assert len(info) == 5
+        assert again[("ethereum", "0x3")].data.symbol == "ethereum:0x3"
+
+
 class TestFlowIntel:
     @respx.mock(base_url="https://api.nansen.ai/api/v1")
     def test_flow_intel(self, respx_mock, client):
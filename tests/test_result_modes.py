@@ -0,0 +1,93 @@
+import httpx
+import pydantic
+import pytest
+import respx
+
+from nansen import AsyncNansen, LazyModel, Nansen
+from nansen.types.smart_money import SmartMoneyHoldingItem
+
+
+def _rows(page: int, *, value_usd: object = 10.5) -> list[dict]:
+    return [{"token_symbol": f"T{page}", "value_usd": value_usd}]
+
+
+class TestRawMode:
+    @respx.mock(base_url="https://api.nansen.ai/api/v1")
+    def test_pages_yield_dicts(self, respx_mock, holdings_route):
+        route = holdings_route(respx_mock, _rows, pages=3)
+        with Nansen(api_key="test-key", rate_limiter=None, result_mode="raw") as client:
+            page = client.smart_money.holdings(chains=["ethereum"])
+            assert page.pagination.per_page == 1
+            items = list(page)
+        assert items == [{"token_symbol": f"T{n}", "value_usd": 10.5} for n in (1, 2, 3)]
+        assert route.call_count == 3
+
+    @respx.mock(base_url="https://api.nansen.ai/api/beta")
+    def test_list_responses(self, respx_mock):
+        respx_mock.post("/profiler/address/labels").mock(
+            return_value=httpx.Response(200, json=[{"label": "Whale"}])
+        )
+        with Nansen(api_key="test-key", rate_limiter=None) as client:
+            resp = client.with_options(result_mode="raw").profiler.address.labels(
+                address="0xabc", chain="ethereum"
+            )
+        assert resp.data == [{"label": "Whale"}]
+
+    @respx.mock(base_url="https://api.nansen.ai/api/v1")
+    def test_per_call_mode_applies_to_later_pages(self, respx_mock, holdings_route):
+        holdings_route(respx_mock, _rows)
+        with Nansen(api_key="test-key", rate_limiter=None) as client:
+            raw = list(client.with_options(result_mode="raw").smart_money.holdings(chains=["x"]))
+            models = list(client.smart_money.holdings(chains=["x"]))
+        assert all(isinstance(item, dict) for item in raw)
+        assert all(isinstance(item, SmartMoneyHoldingItem) for item in models)
+
+    def test_unknown_mode(self):
+        with pytest.raises(ValueError):
+            Nansen(api_key="test-key", result_mode="fast")  # type: ignore[arg-type]
+
+    @respx.mock(base_url="https://api.nansen.ai/api/v1")
+    async def test_async_raw(self, respx_mock, holdings_route):
+        holdings_route(respx_mock, _rows)
+        async with AsyncNansen(api_key="test-key", rate_limiter=None, result_mode="raw") as client:
+            page = await client.smart_money.holdings(chains=["ethereum"])
+            items = [item async for item in page]
+        assert [item["token_symbol"] for item in items] == ["T1", "T2"]
+
+
+class TestLazyMode:
+    @respx.mock(base_url="https://api.nansen.ai/api/v1")
+    def test_validates_on_first_access(self, respx_mock, holdings_route):
+        holdings_route(respx_mock, _rows)
+        with Nansen(api_key="test-key", rate_limiter=None, result_mode="lazy") as client:
+            items = list(client.smart_money.holdings(chains=["ethereum"]))
+        first = items[0]
+        assert isinstance(first, LazyModel)
+        assert "pending" in repr(first)
+        assert first["token_symbol"] == "T1"
+        assert "pending" in repr(first)
+        assert first.value_usd == 10.5
+        assert isinstance(first.resolve(), SmartMoneyHoldingItem)
+        assert first.resolve() is first.resolve()
+        assert first.raw == {"token_symbol": "T1", "value_usd": 10.5}
+
+    @respx.mock(base_url="https://api.nansen.ai/api/v1")
+    def test_validation_errors_deferred(self, respx_mock, holdings_route):
+        holdings_route(respx_mock, lambda page: _rows(page, value_usd="not a number"), pages=1)
+        with Nansen(api_key="test-key", rate_limiter=None, result_mode="lazy") as client:
+            (item,) = client.smart_money.holdings(chains=["ethereum"])
+        assert item["value_usd"] == "not a number"
+        with pytest.raises(pydantic.ValidationError):
+            item.value_usd  # noqa: B018
+
+    @respx.mock(base_url="https://api.nansen.ai/api/v1")
+    def test_nested_response(self, respx_mock):
+        respx_mock.post("/tgm/token-information").mock(
+            return_value=httpx.Response(200, json={"data": {"name": "Pepe", "symbol": "PEPE"}})
+        )
+        with Nansen(api_key="test-key", rate_limiter=None, result_mode="lazy") as client:
+            resp = client.tgm.token_information(
+                chain="ethereum", token_address="0x0", timeframe="24h"
+            )
+        assert isinstance(resp.data, LazyModel)
+        assert resp.data.data.name == "Pepe"
@@ -0,0 +1,239 @@
+import json
+import threading
+import time
+
+import anyio
+import httpx
+import pytest
+import respx
+
+from nansen import AsyncNansen, BadRequestError
+from nansen._sharding import split_date_range
+
+
+def _daily_transfers(respx_mock, *, per_day: int = 3, delay: float = 0.0):
+    """Serve ``per_day`` transfers per day of the requested window, two per page."""
+    state = {"active": 0, "peak": 0}
+    lock = threading.Lock()
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        body = json.loads(request.content)
+        with lock:
+            state["active"] += 1
+            state["peak"] = max(state["peak"], state["active"])
+        time.sleep(delay)
+        with lock:
+            state["active"] -= 1
+        window = split_date_range(body["date"])
+        rows = [
+            {"block_timestamp": f"{day['from']}T{hour:02d}:00:00", "transaction_hash": "0x"}
+            for day in window
+            for hour in range(per_day)
+        ]
+        if body["order_by"][0]["direction"] == "DESC":
+            rows.reverse()
+        page = body.get("pagination", {}).get("page", 1)
+        chunk = rows[(page - 1) * 2 : page * 2]
+        return httpx.Response(
+            200,
+            json={
+                "data": chunk,
+                "pagination": {"page": page, "per_page": 2, "is_last_page": page * 2 >= len(rows)},
+            },
+        )
+
+    route = respx_mock.post("/tgm/transfers").mock(side_effect=handler)
+    return route, state
+
+
+class TestSplitDateRange:
+    def test_whole_days(self):
+        shards = split_date_range({"from": "2024-01-30", "to": "2024-02-02"})
+        assert shards == [
+            {"from": "2024-01-30", "to": "2024-01-30"},
+            {"from": "2024-01-31", "to": "2024-01-31"},
+            {"from": "2024-02-01", "to": "2024-02-01"},
+            {"from": "2024-02-02", "to": "2024-02-02"},
+        ]
+
+    def test_multi_day_shards(self):
+        shards = split_date_range({"from": "2024-01-01", "to": "2024-01-05"}, shard_days=2)
+        assert [(s["from"], s["to"]) for s in shards] == [
+            ("2024-01-01", "2024-01-02"),
+            ("2024-01-03", "2024-01-04"),
+            ("2024-01-05", "2024-01-05"),
+        ]
+
+    def test_timestamps_do_not_overlap(self):
+        shards = split_date_range(
+            {"from": "2024-01-01T12:00:00Z", "to": "2024-01-03T06:00:00Z"}, shard_days=1
+        )
+        assert shards == [
+            {"from": "2024-01-01T12:00:00Z", "to": "2024-01-02T11:59:59Z"},
+            {"from": "2024-01-02T12:00:00Z", "to": "2024-01-03T06:00:00Z"},
+        ]
+
+    def test_invalid_window(self):
+        with pytest.raises(ValueError):
+            split_date_range({"from": "2024-02-01", "to": "2024-01-01"})
+        with pytest.raises(ValueError):
+            split_date_range({"from": "2024-01-01", "to": "2024-01-02"}, shard_days=0)
+
+
+class TestIterSharded:
+    @respx.mock(base_url="https://api.nansen.ai/api/v1")
+    def test_merged_in_timestamp_order(self, respx_mock, client):
+        route, state = _daily_transfers(respx_mock, delay=0.02)
+        items = list(
+            client.iter_sharded(
+                client.tgm.transfers,
+                chain="ethereum",
+                token_address="0xabc",
+                date={"from": "2024-01-01", "to": "2024-01-10"},
+                max_concurrency=4,
+            )
+        )
+        stamps = [item.block_timestamp for item in items]
+        assert len(stamps) == 30
+        assert stamps == sorted(stamps)
+        # Ten one-day shards of two pages each, fetched several at a time.
+        assert route.call_count == 20
+        assert 1 < state["peak"] <= 4
+
+    @respx.mock(base_url="https://api.nansen.ai/api/v1")
+    def test_descending_order_by(self, respx_mock, client):
+        _daily_transfers(respx_mock)
+        items = client.iter_sharded(
+            client.tgm.transfers,
+            chain="ethereum",
+            token_address="0xabc",
+            date={"from": "2024-01-01", "to": "2024-01-03"},
+            order_by=[{"field": "block_timestamp", "direction": "DESC"}],
+        )
+        stamps = [item.block_timestamp for item in items]
+        assert stamps == sorted(stamps, reverse=True)
+        assert len(stamps) == 9
+
+    def test_rejects_foreign_order(self, client):
+        with pytest.raises(ValueError):
+            client.iter_sharded(
+                client.tgm.transfers,
+                chain="ethereum",
+                token_address="0xabc",
+                date={"from": "2024-01-01", "to": "2024-01-03"},
+                order_by=[{"field": "transfer_value_usd", "direction": "DESC"}],
+            )
+
+    def test_requires_window(self, client):
+        with pytest.raises(TypeError):
+            client.iter_sharded(client.tgm.transfers, chain="ethereum", token_address="0xabc")
+
+    @respx.mock(base_url="https://api.nansen.ai/api/v1")
+    def test_shard_error_propagates(self, respx_mock, client):
+        respx_mock.post("/tgm/transfers").mock(
+            return_value=httpx.Response(400, json={"error": {"message": "bad"}})
+        )
+        with pytest.raises(Exception, match="bad"):
+            list(
+                client.iter_sharded(
+                    client.tgm.transfers,
+                    chain="ethereum",
+                    token_address="0xabc",
+                    date={"from": "2024-01-01", "to": "2024-01-03"},
+                )
+            )
+
+    @respx.mock(base_url="https://api.nansen.ai/api/v1")
+    async def test_async_sharded(self, respx_mock):
+        route, _ = _daily_transfers(respx_mock)
+        async with AsyncNansen(api_key="test-key", rate_limiter=None) as client:
+            items = [
+                item
+                async for item in client.iter_sharded(
+                    client.tgm.transfers,
+                    chain="ethereum",
+                    token_address="0xabc",
+                    date={"from": "2024-01-01", "to": "2024-01-05"},
+                    max_concurrency=3,
+                )
+            ]
+        stamps = [item.block_timestamp for item in items]
+        assert len(stamps) == 15
+        assert stamps == sorted(stamps)
+        assert route.call_count == 10
+
+    @respx.mock(base_url="https://api.nansen.ai/api/v1")
+    async def test_async_shard_error_raised_unwrapped(self, respx_mock):
+        respx_mock.post("/tgm/transfers").mock(
+            return_value=httpx.Response(400, json={"error": {"message": "bad"}})
+        )
+        async with AsyncNansen(api_key="test-key", rate_limiter=None, max_retries=0) as client:
+            with pytest.raises(BadRequestError, match="bad"):
+                async for _ in client.iter_sharded(
+                    client.tgm.transfers,
+                    chain="ethereum",
+                    token_address="0xabc",
+                    date={"from": "2024-01-01", "to": "2024-01-03"},
+                ):
+                    pass
+
+    @respx.mock(base_url="https://api.nansen.ai/api/v1")
+    async def test_async_break_stops_shards(self, respx_mock):
+        route, _ = _daily_transfers(respx_mock)
+        async with AsyncNansen(api_key="test-key", rate_limiter=None) as client:
+            async for item in client.iter_sharded(
+                client.tgm.transfers,
+                chain="ethereum",
+                token_address="0xabc",
+                date={"from": "2024-01-01", "to": "2024-01-20"},
+                max_concurrency=2,
+            ):
+                first = item
+                break
+            await anyio.sleep(0.05)
+            calls = route.call_count
+            await anyio.sleep(0.05)
+            assert route.call_count == calls
+        assert first.block_timestamp == "2024-01-01T00:00:00"
+        assert calls <= 6
+
+    @respx.mock(base_url="https://api.nansen.ai/api/v1")
+    async def test_async_without_context_manager(self, respx_mock):
+        _daily_transfers(respx_mock)
+        client = AsyncNansen(api_key="test-key", rate_limiter=None)
+        items = [
+            item
+            async for item in client.iter_sharded(
+                client.tgm.transfers,
+                chain="ethereum",
+                token_address="0xabc",
+                date={"from": "2024-01-01", "to": "2024-01-05"},
+                max_concurrency=2,
+            )
+        ]
+        await client.close()
+        stamps = [item.block_timestamp for item in items]
+        assert len(stamps) == 15
+        assert stamps == sorted(stamps)
+
+    @respx.mock(base_url="https://api.nansen.ai/api/v1")
+    def test_trio_sharded(self, respx_mock):
+        pytest.importorskip("trio")
+        _daily_transfers(respx_mock)
+
+        async def main() -> list[str]:
+            async with AsyncNansen(api_key="test-key", rate_limiter=None) as client:
+                return [
+                    item.block_timestamp
+                    async for item in client.iter_sharded(
+                        client.tgm.transfers,
+                        chain="ethereum",
+                        token_address="0xabc",
+                        date={"from": "2024-01-01", "to": "2024-01-03"},
+                        max_concurrency=2,
+                    )
+                ]
+
+        stamps = anyio.run(main, backend="trio")
+        assert len(stamps) == 9
+        assert stamps == sorted(stamps)
@@ -0,0 +1,172 @@
+import gzip
+import json
+
+import httpx
+import pytest
+import respx
+
+from nansen import AsyncNansen, Nansen
+from nansen._transport import (
+    _ASYNC_POOL,
+    _SYNC_POOL,
+    AsyncSharedTransport,
+    SharedTransport,
+    accept_encoding,
+)
+
+
+class TestConnectionOptions:
+    def test_default_limits(self):
+        with Nansen(api_key="test-key") as client:
+            pool = client._client._transport._pool  # type: ignore[attr-defined]
+            assert pool._max_connections == 100
+            assert pool._max_keepalive_connections == 20
+            assert pool._keepalive_expiry == 5.0
+
+    def test_custom_limits(self):
+        limits = httpx.Limits(max_connections=7, max_keepalive_connections=3, keepalive_expiry=30)
+        with Nansen(api_key="test-key", connection_limits=limits) as client:
+            pool = client._client._transport._pool  # type: ignore[attr-defined]
+            assert pool._max_connections == 7
+            assert pool._max_keepalive_connections == 3
+            assert pool._keepalive_expiry == 30
+
+    def test_http_client_takes_precedence(self):
+        http_client = httpx.Client()
+        with Nansen(api_key="test-key", http_client=http_client, share_transport=True) as client:
+            assert client._client is http_client
+        assert len(_SYNC_POOL) == 0
+
+
+class TestSharedTransport:
+    def test_clients_share_one_pool(self):
+        a = Nansen(api_key="a", share_transport=True)
+        b = Nansen(api_key="b", share_transport=True)
+        ta = a._client._transport
+        tb = b._client._transport
+        assert isinstance(ta, SharedTransport)
+        assert ta._transport is tb._transport  # type: ignore[attr-defined]
+        assert len(_SYNC_POOL) == 1
+
+        a.close()
+        assert len(_SYNC_POOL) == 1
+        a.close()  # closing twice releases only one lease
+        assert len(_SYNC_POOL) == 1
+        b.close()
+        assert len(_SYNC_POOL) == 0
+
+    def test_different_limits_get_separate_pools(self):
+        a = Nansen(api_key="a", share_transport=True)
+        b = Nansen(
+            api_key="b",
+            share_transport=True,
+            connection_limits=httpx.Limits(max_connections=5),
+        )
+        assert a._client._transport._transport is not b._client._transport._transport  # type: ignore[attr-defined]
+        assert len(_SYNC_POOL) == 2
+        a.close()
+        b.close()
+        assert len(_SYNC_POOL) == 0
+
+    @respx.mock(base_url="https://api.nansen.ai/api/v1")
+    def test_requests_flow_through_shared_transport(self, respx_mock):
+        respx_mock.post("/smart-money/holdings").mock(
+            return_value=httpx.Response(
+                200,
+                json={
+                    "data": [{"token_symbol": "ETH"}],
+                    "pagination": {"page": 1, "per_page": 10, "is_last_page": True},
+                },
+            )
+        )
+        with Nansen(api_key="a", share_transport=True) as a:
+            with Nansen(api_key="b", share_transport=True) as b:
+                assert a.smart_money.holdings(chains=["ethereum"]).data[0].token_symbol == "ETH"
+                assert b.smart_money.holdings(chains=["ethereum"]).data[0].token_symbol == "ETH"
+        assert respx_mock.calls.call_count == 2
+
+    async def test_async_clients_share_one_pool(self):
+        a = AsyncNansen(api_key="a", share_transport=True)
+        b = AsyncNansen(api_key="b", share_transport=True)
+        assert isinstance(a._client._transport, AsyncSharedTransport)
+        assert a._client._transport._transport is b._client._transport._transport  # type: ignore[attr-defined]
+        await a.close()
+        assert len(_ASYNC_POOL) == 1
+        await b.close()
+        assert len(_ASYNC_POOL) == 0
+
+    def test_http2_requires_h2(self):
+        try:
+            import h2  # noqa: F401
+        except ImportError:
+            with pytest.raises(ImportError):
+                Nansen(api_key="test-key", http2=True)
+        else:
+            with Nansen(api_key="test-key", http2=True) as client:
+                assert client._client._transport._pool._http2  # type: ignore[attr-defined]
+
+
+class TestCompression:
+    @pytest.mark.parametrize(
+        ("installed", "expected"),
+        [
+            ({"zstandard", "brotli"}, "zstd, br, gzip, deflate"),
+            ({"brotlicffi"}, "br, gzip, deflate"),
+            (set(), "gzip, deflate"),
+        ],
+    )
+    def test_accept_encoding_follows_installed_decoders(self, monkeypatch, installed, expected):
+        monkeypatch.setattr(
+            "importlib.util.find_spec", lambda name: object() if name in installed else None
+        )
+        accept_encoding.cache_clear()
+        try:
+            assert accept_encoding() == expected
+        finally:
+            accept_encoding.cache_clear()
+
+    @pytest.mark.parametrize(
+        ("version", "expected"),
+        [("0.27.0", "br, gzip, deflate"), ("0.27.1", "zstd, br, gzip, deflate")],
+    )
+    def test_zstd_needs_httpx_support(self, monkeypatch, version, expected):
+        monkeypatch.setattr("importlib.util.find_spec", lambda name: object())
+        monkeypatch.setattr(httpx, "__version__", version)
+        accept_encoding.cache_clear()
+        try:
+            assert accept_encoding() == expected
+        finally:
+            accept_encoding.cache_clear()
+
+    @respx.mock(base_url="https://api.nansen.ai/api/v1")
+    def test_gzip_response_reports_sizes(self, respx_mock):
+        payload = json.dumps({"data": {"symbol": "ETH", "name": "Ether" * 200}}).encode()
+        route = respx_mock.post("/tgm/token-information").mock(
+            return_value=httpx.Response(
+                200,
+                content=gzip.compress(payload),
+                headers={"content-encoding": "gzip", "content-type": "application/json"},
+            )
+        )
+        with Nansen(api_key="test-key") as client:
+            resp = client.tgm.token_information(
+                chain="ethereum", token_address="0xabc", timeframe="24h"
+            )
+        assert "gzip" in route.calls[0].request.headers["accept-encoding"]
+        assert resp.data.data is not None
+        assert resp.data.data.symbol == "ETH"
+        assert resp.content_encoding == "gzip"
+        assert resp.decompressed_bytes == len(payload)
+        assert 0 < resp.compressed_bytes < resp.decompressed_bytes
+
+    @respx.mock(base_url="https://api.nansen.ai/api/v1")
+    def test_uncompressed_response(self, respx_mock):
+        respx_mock.post("/tgm/token-information").mock(
+            return_value=httpx.Response(200, json={"data": {"symbol": "ETH"}})
+        )
+        with Nansen(api_key="test-key", compression=False) as client:
+            resp = client.tgm.token_information(
+                chain="ethereum", token_address="0xabc", timeframe="24h"
+            )
+        assert resp.content_encoding is None
+        assert resp.compressed_bytes == resp.decompressed_bytes
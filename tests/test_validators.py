@@ -0,0 +1,65 @@
+import httpx
+import respx
+
+from nansen import Nansen
+from nansen._pagination import PageEnvelope
+from nansen._utils import _validators
+from nansen._utils._validators import get_adapter, response_models
+from nansen.types.tgm import TransferItem
+
+
+class TestValidatorRegistry:
+    def test_adapter_reused(self):
+        assert get_adapter(list[TransferItem]) is get_adapter(list[TransferItem])
+        assert get_adapter(TransferItem) is not get_adapter(list[TransferItem])
+
+    def test_response_models_discovered(self):
+        models = response_models()
+        assert TransferItem in models
+        assert all(m.__module__.startswith("nansen.types.") for m in models)
+
+    def test_warmup_compiles_adapters(self, monkeypatch):
+        monkeypatch.setattr(_validators, "_ADAPTERS", {})
+        with Nansen(api_key="test-key") as client:
+            client.warmup(TransferItem)
+        assert TransferItem in _validators._ADAPTERS
+        assert list[TransferItem] in _validators._ADAPTERS
+        assert PageEnvelope[TransferItem] in _validators._ADAPTERS
+
+    def test_warmup_defaults_to_all_models(self, monkeypatch):
+        monkeypatch.setattr(_validators, "_ADAPTERS", {})
+        with Nansen(api_key="test-key") as client:
+            client.warmup()
+        assert len(_validators._ADAPTERS) == 3 * len(response_models())
+
+    @respx.mock(base_url="https://api.nansen.ai/api/v1")
+    def test_pages_share_one_adapter(self, respx_mock, monkeypatch):
+        built = []
+        original = _validators.TypeAdapter
+
+        def counting_adapter(tp):
+            built.append(tp)
+            return original(tp)
+
+        monkeypatch.setattr(_validators, "_ADAPTERS", {})
+        monkeypatch.setattr(_validators, "TypeAdapter", counting_adapter)
+        respx_mock.post("/tgm/transfers").mock(
+            side_effect=[
+                httpx.Response(
+                    200,
+                    json={
+                        "data": [{"transaction_hash": f"0x{i}"}],
+                        "pagination": {"page": i, "per_page": 1, "is_last_page": i == 3},
+                    },
+                )
+                for i in (1, 2, 3)
+            ]
+        )
+        with Nansen(api_key="test-key") as client:
+            page = client.tgm.transfers(
+                chain="ethereum",
+                token_address="0xabc",
+                date={"from": "2024-01-01", "to": "2024-01-31"},
+            )
+            assert len(list(page)) == 3
+        assert built == [PageEnvelope[TransferItem]]